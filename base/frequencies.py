@@ -218,6 +218,9 @@ class IF(BaseEntity):
         get_wavelengths
         get_active_frequencies
         get_inactive_frequencies
+        get_active_count
+        any_active
+        find_free_frequency
         
         activate_IF
         deactivate_IF
@@ -374,6 +377,28 @@ class Frequencies(BaseEntity):
         logger.debug(f"Retrieved {len(inactive)} inactive frequencies")
         return inactive
 
+    def get_active_count(self) -> int:
+        """Get the number of active IF frequencies without building a list"""
+        return sum(1 for if_obj in self._data if if_obj.isactive)
+
+    def any_active(self) -> bool:
+        """Check if any IF frequency is active without building a list"""
+        return any(if_obj.isactive for if_obj in self._data)
+
+    def find_free_frequency(self, bandwidth: float, start: float = 1000.0) -> float:
+        """First frequency from start whose band [f, f + bandwidth] fits between existing IFs
+
+        Each occupied band is followed by a gap of one bandwidth, as for IFs added from the GUI
+        """
+        check_positive(bandwidth, "Bandwidth")
+        new_freq = start
+        # Один проход по диапазонам, отсортированным по нижней границе
+        for lower, upper in sorted((f.get_frequency(), f.get_frequency() + f.get_bandwidth()) for f in self._data):
+            if new_freq + bandwidth <= lower:
+                break
+            new_freq = max(new_freq, upper + bandwidth)
+        return new_freq
+
     def activate_IF(self, index: int) -> None:
         """Activate IF by index"""
         check_type(index, int, "Index")
@@ -7,6 +7,7 @@ from base.scans import Scans
 from utils.validation import check_type, check_non_empty_string
 from utils.logging_setup import logger
 from datetime import datetime
+import sys
 from typing import Optional, Dict, Any
 import astropy.units as u
 import numpy as np
@@ -36,6 +37,9 @@ import numpy as np
         set_scans
         set_calculated_data
         set_calculated_data_by_key
+        set_calc_dirty
+        mark_activation_changed
+        clear_calculated_data
 
 
         get_observation_type
@@ -46,6 +50,8 @@ import numpy as np
         get_scans
         get_calculated_data
         set_calculated_data_by_key
+        is_calc_dirty
+        get_calc_version
 
         get_start_datetime
 
@@ -56,6 +62,7 @@ import numpy as np
 
         _update_scan_indices
         _sync_scans_with_activation
+        _activation_state
 
         __init__
         __repr__
@@ -79,7 +86,7 @@ class Observation(BaseEntity):
             check_type(frequencies, Frequencies, "Frequencies")
         if scans is not None:
             check_type(scans, Scans, "Scans")
-        self._observation_code = observation_code
+        self._observation_code = sys.intern(observation_code)
         self._observation_type = observation_type
         self._sources = sources if sources is not None else Sources()
         self._telescopes = telescopes if telescopes is not None else Telescopes()
@@ -90,6 +97,10 @@ class Observation(BaseEntity):
         self._frequencies._parent = self
         self._scans._parent = self
         self._calculated_data: Dict[str, Any] = {} # Хранилище для результатов Calculator
+        self._calc_dirty = True # Входные данные изменились после последнего расчёта
+        self._calc_version = 0 # Растёт при каждом изменении результатов, по нему GUI проверяет кэш графиков
+        self._activation_dirty = False # Менялись только флаги активности после последнего расчёта
+        self._calculated_activation = None # Флаги активности и индексы сканов на момент последнего расчёта
         logger.info(f"Initialized Observation '{observation_code}' with type '{observation_type}'")
 
     def set_observation(self, observation_code: str, sources: Sources = None,
@@ -108,7 +119,7 @@ class Observation(BaseEntity):
             check_type(frequencies, Frequencies, "Frequencies")
         if scans is not None:
             check_type(scans, Scans, "Scans")
-        self._observation_code = observation_code
+        self._observation_code = sys.intern(observation_code)
         self._observation_type = observation_type
         self._sources = sources if sources is not None else Sources()
         self._telescopes = telescopes if telescopes is not None else Telescopes()
@@ -116,6 +127,7 @@ class Observation(BaseEntity):
         self._scans = scans if scans is not None else Scans()
         self.isactive = isactive
         self._calculated_data.clear()
+        self.set_calc_dirty()
         logger.info(f"Set observation '{observation_code}' with type '{observation_type}'")
     
     def activate(self) -> None:
@@ -133,12 +145,13 @@ class Observation(BaseEntity):
             logger.error(f"Observation type must be 'VLBI' or 'SINGLE_DISH', got {observation_type}")
             raise ValueError(f"Observation type must be 'VLBI' or 'SINGLE_DISH', got {observation_type}")
         self._observation_type = observation_type
+        self.set_calc_dirty()
         logger.info(f"Set observation type to '{observation_type}' for observation '{self._observation_code}'")
 
     def set_observation_code(self, observation_code: str) -> None:
         """Set observation code"""
         check_type(observation_code, str, "Observation code")
-        self._observation_code = observation_code
+        self._observation_code = sys.intern(observation_code)
         logger.info(f"Set observation code to '{observation_code}'")
 
     def set_sources(self, sources: Sources) -> None:
@@ -146,6 +159,7 @@ class Observation(BaseEntity):
         check_type(sources, Sources, "Sources")
         self._sources = sources
         self._calculated_data.clear()
+        self.set_calc_dirty()
         logger.info(f"Set sources for observation '{self._observation_code}'")
 
     def set_frequencies(self, frequencies: Frequencies) -> None:
@@ -153,6 +167,7 @@ class Observation(BaseEntity):
         check_type(frequencies, Frequencies, "Frequencies")
         self._frequencies = frequencies
         self._calculated_data.clear()
+        self.set_calc_dirty()
         logger.info(f"Set frequencies with polarizations for observation '{self._observation_code}'")
 
     def set_telescopes(self, telescopes: Telescopes) -> None:
@@ -160,6 +175,7 @@ class Observation(BaseEntity):
         check_type(telescopes, Telescopes, "Telescopes")
         self._telescopes = telescopes
         self._calculated_data.clear()
+        self.set_calc_dirty()
         logger.info(f"Set telescopes for observation '{self._observation_code}'")    
 
     def set_scans(self, scans: Scans) -> None:
@@ -167,17 +183,39 @@ class Observation(BaseEntity):
         check_type(scans, Scans, "Scans")
         self._scans = scans
         self._calculated_data.clear()  # Очищаем результаты, так как данные изменились
+        self.set_calc_dirty()
         logger.info(f"Set scans for observation '{self._observation_code}'")
 
     def set_calculated_data(self, data: Any) -> None:
         """Save calculated data for this observation"""
         self._calculated_data = data.copy()
+        self._calc_version += 1
         logger.info(f"Stored calculated data for observation '{self._observation_code}'")
 
+    def set_calc_dirty(self, dirty: bool = True) -> None:
+        """Mark observation inputs as changed (or up to date) since the last calculation"""
+        self._calc_dirty = dirty
+        if dirty:
+            self._calc_version += 1
+        else:
+            self._activation_dirty = False
+            self._calculated_activation = self._activation_state()
+        logger.debug(f"Set calc dirty={dirty} for observation '{self._observation_code}'")
+
+    def clear_calculated_data(self) -> None:
+        """Drop stored calculation results and mark inputs as changed"""
+        self._calculated_data.clear()
+        self.set_calc_dirty()
+
+    def mark_activation_changed(self) -> None:
+        """Mark that activation flags changed; recalculation is needed only if they differ from the last calculated state"""
+        self._activation_dirty = True
+
     def set_calculated_data_by_key(self, key: str, data: Any) -> None:
         """Save concrete calculated data for this observation"""
         check_non_empty_string(key, "Key")
         self._calculated_data[key] = data
+        self._calc_version += 1
         logger.info(f"Stored calculated data '{key}' for observation '{self._observation_code}'")
 
     def get_observation_code(self) -> str:
@@ -214,6 +252,21 @@ class Observation(BaseEntity):
         logger.info(f"Retrieved calculated data '{key}' for observation '{self._observation_code}'")
         return self._calculated_data.get(key)
 
+    def is_calc_dirty(self) -> bool:
+        """Check whether observation inputs changed since the last calculation"""
+        if self._calc_dirty:
+            return True
+        if self._activation_dirty:
+            # Флаги, вернувшиеся к состоянию последнего расчёта, пересчёта не требуют
+            if self._activation_state() != self._calculated_activation:
+                return True
+            self._activation_dirty = False
+        return False
+
+    def get_calc_version(self) -> int:
+        """Get the counter that changes whenever calculated data may have changed"""
+        return self._calc_version
+
     def get_start_datetime(self) -> Optional[datetime]:
         """Get observation start time as a datetime object (UTC), based on earliest scan"""
         active_scans = self._scans.get_active_scans(self)  # Передаем self
@@ -235,17 +288,17 @@ class Observation(BaseEntity):
             return False
 
         # validate sources
-        if not self._sources.get_active_sources():
+        if not self._sources.any_active():
             logger.error("No active sources defined in observation")
             return False
 
         # validate telescopes
-        if not self._telescopes.get_active_telescopes():
+        if not self._telescopes.any_active():
             logger.error("No active telescopes defined in observation")
             return False
 
         # validate frequencies
-        if not self._frequencies.get_active_frequencies():
+        if not self._frequencies.any_active():
             logger.error("No active frequencies defined in observation")
             return False
 
@@ -281,8 +334,8 @@ class Observation(BaseEntity):
         logger.info(f"Observation '{self._observation_code}' validated successfully")
         return True
     
-    def _update_scan_indices(self, entity_type: str, removed_index: Optional[int] = None, inserted_index: Optional[int] = None) -> None:
-        """Update scan indices after adding/removing sources, telescopes, or frequencies."""
+    def _update_scan_indices(self, entity_type: str, removed_index: Optional[int] = None, inserted_index: Optional[int] = None, count: int = 1) -> None:
+        """Update scan indices after adding/removing sources, telescopes, or frequencies (count entities at once)."""
         entity_map = {"sources": "_source_index", "telescopes": "_telescope_indices", "frequencies": "_frequency_indices"}
         if entity_type not in entity_map:
             raise ValueError(f"Invalid entity type: {entity_type}")
@@ -292,27 +345,27 @@ class Observation(BaseEntity):
             if entity_type == "sources":
                 current_idx = getattr(scan, attr)
                 if removed_index is not None and current_idx is not None:
-                    if current_idx == removed_index:
+                    if removed_index <= current_idx < removed_index + count:
                         scan.set_source_index(None)  # Источник удалён, сбрасываем
                         scan.is_off_source = True
-                    elif current_idx > removed_index:
-                        scan.set_source_index(current_idx - 1)
+                    elif current_idx >= removed_index + count:
+                        scan.set_source_index(current_idx - count)
                 elif inserted_index is not None and current_idx is not None and current_idx >= inserted_index:
-                    scan.set_source_index(current_idx + 1)
+                    scan.set_source_index(current_idx + count)
             else:  # telescopes or frequencies
                 current_indices = getattr(scan, attr)
                 updated_indices = []
                 for idx in current_indices:
                     if removed_index is not None:
-                        if idx == removed_index:
+                        if removed_index <= idx < removed_index + count:
                             continue  # Пропускаем удалённый индекс
-                        elif idx > removed_index:
-                            updated_indices.append(idx - 1)
+                        elif idx >= removed_index + count:
+                            updated_indices.append(idx - count)
                         else:
                             updated_indices.append(idx)
                     elif inserted_index is not None:
                         if idx >= inserted_index:
-                            updated_indices.append(idx + 1)
+                            updated_indices.append(idx + count)
                         else:
                             updated_indices.append(idx)
                 if removed_index is not None or inserted_index is not None:
@@ -320,6 +373,7 @@ class Observation(BaseEntity):
                         scan.set_telescope_indices(updated_indices)
                     else:
                         scan.set_frequency_indices(updated_indices)
+        self.set_calc_dirty()
         logger.debug(f"Updated scan indices for {entity_type} in observation '{self._observation_code}'")
 
     def _sync_scans_with_activation(self, entity_type: str, index: int, is_active: bool) -> None:
@@ -329,6 +383,7 @@ class Observation(BaseEntity):
         if entity_type not in entity_map:
             raise ValueError(f"Invalid entity type: {entity_type}")
         attr = entity_map[entity_type]
+        self.mark_activation_changed()
         
         for scan in self._scans.get_all_scans():
             if entity_type == "sources":
@@ -364,6 +419,15 @@ class Observation(BaseEntity):
                                 scan.set_frequency_indices(updated_indices)
                             logger.debug(f"Added {entity_type} index {index} to scan in '{self._observation_code}'")    
 
+    def _activation_state(self) -> tuple:
+        """Activation flags of all entities and the scan indices derived from them"""
+        return (tuple(src.isactive for src in self._sources.get_all_sources()),
+                tuple(tel.isactive for tel in self._telescopes.get_all_telescopes()),
+                tuple(freq.isactive for freq in self._frequencies.get_all_IF()),
+                tuple((scan.isactive, scan.get_source_index(), scan.is_off_source,
+                       tuple(scan.get_telescope_indices()), tuple(scan.get_frequency_indices()))
+                      for scan in self._scans.get_all_scans()))
+
     def to_dict(self) -> dict:
         """Convert Observation object to a dictionary for serialization"""
         def convert_quantity(obj):
@@ -406,6 +470,7 @@ class Observation(BaseEntity):
         )
         if "calculated_data" in data:
             obs._calculated_data = data["calculated_data"]
+            obs.set_calc_dirty(False)
         logger.info(f"Created observation '{data['observation_code']}' from dictionary")
         return obs
 
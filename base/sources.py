@@ -39,6 +39,8 @@ from typing import Optional, Dict
         get_source_coordinates_deg
         get_ra_degrees
         get_dec_degrees
+        get_ra_str
+        get_dec_str
         get_spectral_index
         get_flux
         get_flux_table
@@ -117,6 +119,8 @@ class Source(BaseEntity):
         self._de_d = de_d
         self._de_m = de_m
         self._de_s = de_s
+        self._ra_str = None  # кэш строкового представления RA/DEC, сбрасывается при изменении координат
+        self._dec_str = None
         self._flux_table = flux_table if flux_table is not None else {}
         self._spectral_index = spectral_index
         logger.info(f"Initialized Source '{name}' at RA={ra_h}h{ra_m}m{ra_s}s, DEC={de_d}d{de_m}m{de_s}s")
@@ -183,6 +187,28 @@ class Source(BaseEntity):
         sign = 1 if self._de_d >= 0 else -1
         return sign * (abs(self._de_d) + self._de_m / 60 + self._de_s / 3600)
 
+    def get_ra_str(self) -> str:
+        """Return RA formatted for display (e.g. 12ʰ30′45.00″), cached until RA changes"""
+        if self._ra_str is None:
+            ra_deg = self.get_ra_degrees()
+            ra_h = int(ra_deg / 15)
+            ra_m = int((ra_deg / 15 - ra_h) * 60)
+            ra_s = ((ra_deg / 15 - ra_h) * 60 - ra_m) * 60
+            self._ra_str = f"{ra_h:02d}ʰ{ra_m:02d}′{ra_s:05.2f}″"
+        return self._ra_str
+
+    def get_dec_str(self) -> str:
+        """Return DEC formatted for display (e.g. 45°15′30.00″), cached until DEC changes"""
+        if self._dec_str is None:
+            dec_deg = self.get_dec_degrees()
+            sign = "-" if dec_deg < 0 else ""
+            dec_deg = abs(dec_deg)
+            dec_d = int(dec_deg)
+            dec_m = int((dec_deg - dec_d) * 60)
+            dec_s = ((dec_deg - dec_d) * 60 - dec_m) * 60
+            self._dec_str = f"{sign}{dec_d}°{dec_m:02d}′{dec_s:05.2f}″"
+        return self._dec_str
+
     def get_source_coordinates(self) -> tuple[float, float, float, float, float, float]:
         """Get source RA, DEC in hh:mm:ss, dd:mm:ss"""
         return self._ra_h, self._ra_m, self._ra_s, self._de_d, self._de_m, self._de_s
@@ -277,6 +303,8 @@ class Source(BaseEntity):
         self._de_d = de_d
         self._de_m = de_m
         self._de_s = de_s
+        self._ra_str = None
+        self._dec_str = None
         self._flux_table = flux_table if flux_table is not None else {}
         self._spectral_index = spectral_index
         self.isactive = isactive
@@ -324,6 +352,7 @@ class Source(BaseEntity):
         self._ra_h = ra_h
         self._ra_m = ra_m
         self._ra_s = ra_s
+        self._ra_str = None
         logger.info(f"Set RA={ra_h}h{ra_m}m{ra_s}s for source '{self._name}'")
 
     def set_dec(self, de_d: float, de_m: float, de_s: float) -> None:
@@ -341,6 +370,7 @@ class Source(BaseEntity):
         self._de_d = de_d
         self._de_m = de_m
         self._de_s = de_s
+        self._dec_str = None
         logger.info(f"Set DEC={de_d}d{de_m}m{de_s}s for source '{self._name}'")
     
     def set_ra_degrees(self, ra_deg: float) -> None:
@@ -358,6 +388,7 @@ class Source(BaseEntity):
         ra_minutes = (ra_hours - self._ra_h) * 60
         self._ra_m = int(ra_minutes)
         self._ra_s = (ra_minutes - self._ra_m) * 60
+        self._ra_str = None
         logger.info(f"Set RA={ra_deg} deg to RA={self._ra_h}h{self._ra_m}m{self._ra_s}s for source '{self._name}'")
     
     def set_dec_degrees(self, dec_deg: float) -> None:
@@ -374,6 +405,7 @@ class Source(BaseEntity):
         dec_minutes = (dec_abs - int(dec_abs)) * 60
         self._de_m = int(dec_minutes)
         self._de_s = (dec_minutes - self._de_m) * 60
+        self._dec_str = None
         logger.info(f"Set DEC={dec_deg} deg to DEC={self._de_d}d{self._de_m}m{self._de_s}s for source '{self._name}'")
 
     def set_source_coordinates(self, ra_h: float, ra_m: float, ra_s: float, de_d: float, de_m: float, de_s: float) -> None:
@@ -510,13 +542,17 @@ class Source(BaseEntity):
         add_source
         create_source
         insert_source
+        insert_sources
         remove_source
+        remove_source_range
     
         get_by_index
         get_all_sources      
 
         get_active_sources
         get_inactive_sources
+        get_active_count
+        any_active
         
         activate_source
         deactivate_source
@@ -635,6 +671,39 @@ class Sources(BaseEntity):
         self._data.insert(index, source)
         logger.info(f"Inserted source '{source.get_name()}' at index {index} in Sources")
 
+    def insert_sources(self, index: int, sources: list['Source']) -> int:
+        """Insert several sources at the specified index in one step, skipping duplicates
+
+        Args:
+            index (int): The index at which to insert the sources (0 to len(sources))
+            sources (list[Source]): The Source objects to insert, in order
+
+        Returns:
+            int: Number of sources actually inserted
+
+        Raises:
+            IndexError: If the index is out of range
+        """
+        check_type(index, int, "Index")
+        check_list_type(sources, Source, "Sources")
+
+        if not (0 <= index <= len(self._data)):
+            logger.error(f"Index {index} is out of range for Sources with {len(self._data)} elements")
+            raise IndexError(f"Index {index} is out of range!")
+
+        names = {s.get_name() for s in self._data}
+        new_sources = []
+        for source in sources:
+            if source.get_name() in names:
+                logger.warning(f"Source '{source.get_name()}' already exists in Sources, skipping insertion")
+                continue
+            names.add(source.get_name())
+            new_sources.append(source)
+
+        self._data[index:index] = new_sources
+        logger.info(f"Inserted {len(new_sources)} sources at index {index} in Sources")
+        return len(new_sources)
+
     def remove_source(self, index: int) -> None:
         """Remove source by index"""
         try:
@@ -644,6 +713,16 @@ class Sources(BaseEntity):
             logger.error(f"Invalid source index: {index}")
             raise IndexError("Invalid source index!")
 
+    def remove_source_range(self, start: int, end: int) -> None:
+        """Remove sources with indices from start up to (not including) end in one step"""
+        check_type(start, int, "Start index")
+        check_type(end, int, "End index")
+        if not (0 <= start < end <= len(self._data)):
+            logger.error(f"Invalid source range [{start}, {end}) for Sources with {len(self._data)} elements")
+            raise IndexError("Invalid source range!")
+        del self._data[start:end]
+        logger.info(f"Removed sources at indices {start}..{end - 1} from Sources")
+
     def get_by_index(self, index: int) -> 'Source':
         """Get source by index"""
         try:
@@ -667,6 +746,14 @@ class Sources(BaseEntity):
         inactive = [src_obj for src_obj in self._data if not src_obj.isactive]
         logger.debug(f"Retrieved {len(inactive)} inactive sources")
         return inactive
+
+    def get_active_count(self) -> int:
+        """Get the number of active sources without building a list"""
+        return sum(1 for src_obj in self._data if src_obj.isactive)
+
+    def any_active(self) -> bool:
+        """Check if any source is active without building a list"""
+        return any(src_obj.isactive for src_obj in self._data)
     
     def set_source(self, index: int, source: 'Source') -> None:
         """Set a source at a specific index"""
@@ -571,6 +571,7 @@ class Telescope(BaseEntity):
         get_state_vector
         get_state_vector_from_orbit
         get_state_vector_from_kepler
+        get_state_vector_array
 
         get_keplerian
         get_pitch_range
@@ -587,6 +588,9 @@ class Telescope(BaseEntity):
         from_dict
 
         _solve_kepler
+        _solve_kepler_array
+        _state_vectors_from_kepler
+        _state_vectors_from_orbit
         _validate_orbit_data
 
         __init__
@@ -804,7 +808,68 @@ class SpaceTelescope(Telescope):
             logger.warning(f"Using linear interpolation for position and velocity at time {t} for '{self._code}'")
         logger.debug(f"Retrieved position={pos}, velocity={vel} for '{self._code}' at {dt}")
         return pos, vel
-    
+
+    def get_state_vector_array(self, dts) -> tuple[np.ndarray, np.ndarray]:
+        """Get state vectors for a sequence of dates, positions and velocities of shape (N, 3)"""
+        if self._use_kep:
+            return self._state_vectors_from_kepler(dts)
+        else:
+            return self._state_vectors_from_orbit(dts)
+
+    def _state_vectors_from_kepler(self, dts) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized get_state_vector_from_kepler over a sequence of dates"""
+        if self._kepler_elements is None:
+            logger.error(f"No Keplerian elements set for '{self._code}'")
+            raise ValueError("No Keplerian elements set!")
+        a, e, i, raan, argp, nu0, epoch, mu = (
+            self._kepler_elements[k] for k in ["a", "e", "i", "raan", "argp", "nu", "epoch", "mu"]
+        )
+        t = np.array([(dt - epoch).total_seconds() for dt in dts], dtype=float)
+        M = np.sqrt(mu / a**3) * t + self._solve_kepler(nu0, e)  # Mean anomaly
+        E = self._solve_kepler_array(M, e)  # Eccentric anomaly
+        nu = 2 * np.arctan2(np.sqrt(1 + e) * np.sin(E / 2), np.sqrt(1 - e) * np.cos(E / 2))  # True anomaly
+        r = a * (1 - e * np.cos(E))  # Distance
+        p = a * (1 - e**2)  # Semi-latus rectum
+        h = np.sqrt(mu * p)  # Angular momentum
+        zeros = np.zeros_like(nu)
+        pos_p = np.stack([r * np.cos(nu), r * np.sin(nu), zeros], axis=-1)
+        vel_p = np.stack([-np.sin(nu), e + np.cos(nu), zeros], axis=-1) * (h / p)
+        R1 = np.array([[np.cos(raan), -np.sin(raan), 0], [np.sin(raan), np.cos(raan), 0], [0, 0, 1]])
+        R2 = np.array([[1, 0, 0], [0, np.cos(i), -np.sin(i)], [0, np.sin(i), np.cos(i)]])
+        R3 = np.array([[np.cos(argp), -np.sin(argp), 0], [np.sin(argp), np.cos(argp), 0], [0, 0, 1]])
+        R = R1 @ R2 @ R3
+        return pos_p @ R.T, vel_p @ R.T
+
+    def _state_vectors_from_orbit(self, dts) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized get_state_vector_from_orbit over a sequence of dates"""
+        if self._orbit_data is None:
+            logger.error(f"No orbit data defined for '{self._code}'")
+            raise ValueError("No orbit data available! Load an orbit file first.")
+        j2000_epoch = datetime(2000, 1, 1, 12, 0, 0)
+        t = np.array([(dt - j2000_epoch).total_seconds() for dt in dts], dtype=float)
+        times = self._orbit_data["times"]
+        # Вне диапазона данных орбиты - статическое положение, как в get_state_vector_from_orbit
+        pos = np.tile([self._x, self._y, self._z], (len(t), 1)).astype(float)
+        vel = np.tile([self._vx, self._vy, self._vz], (len(t), 1)).astype(float)
+        inside = (t >= times[0]) & (t <= times[-1])
+        if not inside.any():
+            return pos, vel
+        ti = t[inside]
+        if hasattr(self, "_cubic_splines") and self._cubic_splines:
+            pos[inside] = np.stack([spline(ti) for spline in self._cubic_splines["positions"]], axis=-1)
+            vel[inside] = np.stack([spline(ti, 1) for spline in self._cubic_splines["velocities"]], axis=-1)
+        elif hasattr(self, "_chebyshev_coeffs") and self._chebyshev_coeffs:
+            t_min, t_max = self._chebyshev_coeffs["time_range"]
+            norm_t = 2 * (ti - t_min) / (t_max - t_min) - 1
+            pos[inside] = np.stack([coeff(norm_t) for coeff in self._chebyshev_coeffs["positions"]], axis=-1)
+            vel[inside] = np.stack([coeff.deriv()(norm_t) for coeff in self._chebyshev_coeffs["velocities"]], axis=-1)
+        else:
+            positions, velocities = self._orbit_data["positions"], self._orbit_data["velocities"]
+            pos[inside] = np.stack([np.interp(ti, times, positions[:, k]) for k in range(3)], axis=-1)
+            vel[inside] = np.stack([np.interp(ti, times, velocities[:, k]) for k in range(3)], axis=-1)
+            logger.warning(f"Using linear interpolation for position and velocity at {len(ti)} times for '{self._code}'")
+        return pos, vel
+
     def get_keplerian(self) -> Optional[Dict[str, any]]:
         """Get the Keplerian elements of the SpaceTelescope
 
@@ -1039,6 +1104,24 @@ class SpaceTelescope(Telescope):
         logger.warning(f"Kepler's equation did not converge for e={e}, initial={initial} after {max_iter} iterations")
         return x
 
+    def _solve_kepler_array(self, initial: np.ndarray, e: float, tol: float = 1e-8, max_iter: int = 200) -> np.ndarray:
+        """Solve Kepler's equation using Newton-Raphson for an array of mean anomalies"""
+        if e >= 1:
+            logger.error(f"Eccentricity {e} not supported for elliptical orbit")
+            raise ValueError("Eccentricity must be < 1 for elliptical orbit!")
+        initial = np.asarray(initial, dtype=float)
+        x = initial.copy() if e < 0.9 else np.full_like(initial, np.pi)
+        active = np.ones(initial.shape, dtype=bool)  # итерации продолжаются только для несошедшихся элементов
+        for _ in range(max_iter):
+            xa = x[active]
+            dx = -(xa - e * np.sin(xa) - initial[active]) / (1 - e * np.cos(xa))
+            x[active] = xa + dx
+            active[active] = np.abs(dx) >= tol
+            if not active.any():
+                return x
+        logger.warning(f"Kepler's equation did not converge for e={e} at {int(active.sum())} points after {max_iter} iterations")
+        return x
+
     def _validate_orbit_data(self) -> bool:
         """Check if orbit data is available (either from file or Kepler elements)"""
         return self._orbit_data is not None or self._kepler_elements is not None
@@ -1061,6 +1144,7 @@ class SpaceTelescope(Telescope):
         add_telescope
         create_telescope
         insert_telescope
+        insert_telescopes
         remove_telescope
     
         get_by_index
@@ -1068,6 +1152,8 @@ class SpaceTelescope(Telescope):
 
         get_active_telescopes
         get_inactive_telescopes
+        get_active_count
+        any_active
 
         set_telescope
         
@@ -1185,6 +1271,34 @@ class Telescopes(BaseEntity):
         self._data.insert(index, telescope)
         logger.info(f"Inserted telescope '{telescope.get_code()}' at index {index}")
 
+    def insert_telescopes(self, index: int, telescopes: list[Telescope | SpaceTelescope]) -> int:
+        """Insert several telescopes at the specified index in one step, skipping duplicates.
+
+        Args:
+            index (int): Index at which to insert the telescopes.
+            telescopes (list[Telescope | SpaceTelescope]): Telescope objects to insert, in order.
+
+        Returns:
+            int: Number of telescopes actually inserted.
+        """
+        check_type(index, int, "Index")
+        check_type(telescopes, (list, tuple), "Telescopes")
+        if not 0 <= index <= len(self._data):
+            logger.error(f"Invalid index {index} for insertion, must be between 0 and {len(self._data)}")
+            raise IndexError(f"Index {index} out of range!")
+        codes = {t.get_code() for t in self._data}
+        new_telescopes = []
+        for telescope in telescopes:
+            check_type(telescope, (Telescope, SpaceTelescope), "Telescope")
+            if telescope.get_code() in codes:
+                logger.warning(f"Telescope with code '{telescope.get_code()}' already exists, skipping insertion")
+                continue
+            codes.add(telescope.get_code())
+            new_telescopes.append(telescope)
+        self._data[index:index] = new_telescopes
+        logger.info(f"Inserted {len(new_telescopes)} telescopes at index {index}")
+        return len(new_telescopes)
+
     def remove_telescope(self, index: int) -> None:
         """Remove telescope by index"""
         try:
@@ -1230,6 +1344,14 @@ class Telescopes(BaseEntity):
         inactive = [t for t in self._data if not t.isactive]
         logger.debug(f"Retrieved {len(inactive)} inactive telescopes")
         return inactive
+
+    def get_active_count(self) -> int:
+        """Get the number of active telescopes without building a list"""
+        return sum(1 for t in self._data if t.isactive)
+
+    def any_active(self) -> bool:
+        """Check if any telescope is active without building a list"""
+        return any(t.isactive for t in self._data)
     
     def activate_telescope(self, index: int) -> None:
         """Activate telescope by index"""
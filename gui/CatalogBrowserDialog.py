@@ -3,6 +3,7 @@ from PySide6.QtWidgets import (QApplication, QMainWindow, QTreeWidget, QTreeWidg
                                QTableWidget, QTableWidgetItem, QStatusBar, QDockWidget, QHBoxLayout, QMenu, 
                                QDialog, QFileDialog, QLabel, QGridLayout, QComboBox, QHeaderView)
 from PySide6.QtCore import Qt
+from utils.formatting import format_ra_array, format_dec_array
 
 class CatalogBrowserDialog(QDialog):
     def __init__(self, catalog_type, catalog_data, parent=None):
@@ -25,26 +26,17 @@ class CatalogBrowserDialog(QDialog):
         if self.catalog_type == "Source":
             self.table = QTableWidget(len(self.catalog_data), 5)
             self.table.setHorizontalHeaderLabels(["B1950 Name", "J2000 Name", "Alt Name", "RA", "Dec"])
+            # RA/DEC всего каталога форматируются одним векторизованным проходом
+            ra_strs = format_ra_array([source.get_ra_degrees() for source in self.catalog_data])
+            dec_strs = format_dec_array([source.get_dec_degrees() for source in self.catalog_data])
             for row, source in enumerate(self.catalog_data):
                 self.table.setItem(row, 0, QTableWidgetItem(source.get_name()))
                 self.table.setItem(row, 1, QTableWidgetItem(source.get_name_J2000() or ""))
                 self.table.setItem(row, 2, QTableWidgetItem(source.get_alt_name() or ""))
-                ra_deg = source.get_ra_degrees()
-                ra_d = int(ra_deg)
-                ra_m = int((ra_deg - ra_d) * 60)
-                ra_s = ((ra_deg - ra_d) * 60 - ra_m) * 60
-                ra_str = f"{ra_d}°{ra_m:02d}′{ra_s:05.2f}″"
-                ra_item = QTableWidgetItem(ra_str)
+                ra_item = QTableWidgetItem(ra_strs[row])
                 ra_item.setFlags(ra_item.flags() & ~Qt.ItemIsEditable)
                 self.table.setItem(row, 3, ra_item)
-                dec_deg = source.get_dec_degrees()
-                sign = "-" if dec_deg < 0 else ""
-                dec_deg = abs(dec_deg)
-                dec_h = int(dec_deg / 15)
-                dec_m = int((dec_deg / 15 - dec_h) * 60)
-                dec_s = ((dec_deg / 15 - dec_h) * 60 - dec_m) * 60
-                dec_str = f"{sign}{dec_h:02d}ʰ{dec_m:02d}′{dec_s:05.2f}″"
-                dec_item = QTableWidgetItem(dec_str)
+                dec_item = QTableWidgetItem(dec_strs[row])
                 dec_item.setFlags(dec_item.flags() & ~Qt.ItemIsEditable)
                 self.table.setItem(row, 4, dec_item)
         else:  # Telescope
@@ -0,0 +1,34 @@
+# gui/CatalogLoader.py
+from PySide6.QtCore import QObject, QRunnable, Signal
+from utils.catalogmanager import CatalogManager
+from utils.logging_setup import logger
+
+class CatalogLoaderSignals(QObject):
+    finished = Signal(str, str)       # catalog type ("sources"/"telescopes"), path
+    failed = Signal(str, str, str)    # catalog type, path, error message
+
+class CatalogLoader(QRunnable):
+    """Load a sources or telescopes catalog in a QThreadPool worker"""
+
+    def __init__(self, catalog_manager: CatalogManager, catalog_type: str, path: str):
+        super().__init__()
+        if catalog_type not in ("sources", "telescopes"):
+            logger.error(f"Catalog type must be 'sources' or 'telescopes', got {catalog_type}")
+            raise ValueError(f"Catalog type must be 'sources' or 'telescopes', got {catalog_type}")
+        self.catalog_manager = catalog_manager
+        self.catalog_type = catalog_type
+        self.path = path
+        self.signals = CatalogLoaderSignals()
+
+    def run(self):
+        # CatalogManager заменяет каталог целиком только после успешного разбора файла
+        try:
+            if self.catalog_type == "sources":
+                self.catalog_manager.load_source_catalog(self.path)
+            else:
+                self.catalog_manager.load_telescope_catalog(self.path)
+        except (FileNotFoundError, ValueError) as e:
+            logger.error(f"Failed to load {self.catalog_type} catalog '{self.path}': {e}")
+            self.signals.failed.emit(self.catalog_type, self.path, str(e))
+            return
+        self.signals.finished.emit(self.catalog_type, self.path)
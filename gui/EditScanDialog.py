@@ -6,6 +6,7 @@ from base.sources import Source
 from base.telescopes import Telescopes
 from base.frequencies import Frequencies
 from utils.validation import check_positive, check_type
+from utils.formatting import format_scan_start
 from utils.logging_setup import logger
 from datetime import datetime
 from typing import List, Optional
@@ -14,12 +15,20 @@ class EditScanDialog(QDialog):
     def __init__(self, scan: Scan = None, sources: List[Source] = None, telescopes: Telescopes = None, 
                  frequencies: Frequencies = None, parent=None):
         super().__init__(parent)
+        self.setup_ui()
+        self.load(scan, sources, telescopes, frequencies)
+
+    def load(self, scan: Scan = None, sources: List[Source] = None, telescopes: Telescopes = None,
+             frequencies: Frequencies = None):
+        """Reset the dialog for another scan (or a new one) without rebuilding its widgets"""
         self.setWindowTitle("Edit Scan" if scan else "Add Scan")
         self.scan = scan
         self.sources = sources or []
         self.telescopes = telescopes or Telescopes()
         self.frequencies = frequencies or Frequencies()
-        self.setup_ui()
+        self.source_combo.clear()
+        self.source_combo.addItem("None (OFF SOURCE)")
+        self.source_combo.addItems([src.get_name() for src in self.sources])
         self.populate_ui()
 
     def setup_ui(self):
@@ -45,9 +54,6 @@ class EditScanDialog(QDialog):
         source_layout = QHBoxLayout()
         source_layout.addWidget(QLabel("Source:"))
         self.source_combo = QComboBox()
-        self.source_combo.addItem("None (OFF SOURCE)")
-        for src in self.sources:
-            self.source_combo.addItem(src.get_name())
         source_layout.addWidget(self.source_combo)
         layout.addLayout(source_layout)
 
@@ -103,7 +109,7 @@ class EditScanDialog(QDialog):
         if self.scan:
             start_dt = self.scan.get_start_datetime()
             self.start_input.setDateTime(QDateTime.fromString(
-                start_dt.strftime("%Y-%m-%d %H:%M:%S.%f")[:-4], "yyyy-MM-dd HH:mm:ss.zz"))
+                format_scan_start(start_dt), "yyyy-MM-dd HH:mm:ss.zz"))
             self.duration_input.setText(str(self.scan.get_duration()))
             source_index = self.scan.get_source_index()
             if source_index is not None and source_index < len(self.sources):
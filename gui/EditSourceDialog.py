@@ -12,6 +12,7 @@ class EditSourceDialog(QDialog):
         self.setWindowTitle("Edit Source")
         self.source = source  # Исходный объект Source
         self.init_ui()
+        self.load(source)
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -19,28 +20,28 @@ class EditSourceDialog(QDialog):
         # Поля для имен
         name_layout = QHBoxLayout()
         name_layout.addWidget(QLabel("B1950 Name:"))
-        self.name_input = QLineEdit(self.source.get_name())
+        self.name_input = QLineEdit()
         name_layout.addWidget(self.name_input)
         layout.addLayout(name_layout)
 
         j2000_layout = QHBoxLayout()
         j2000_layout.addWidget(QLabel("J2000 Name:"))
-        self.j2000_input = QLineEdit(self.source.get_name_J2000() or "")
+        self.j2000_input = QLineEdit()
         j2000_layout.addWidget(self.j2000_input)
         layout.addLayout(j2000_layout)
 
         alt_layout = QHBoxLayout()
         alt_layout.addWidget(QLabel("Alt Name:"))
-        self.alt_input = QLineEdit(self.source.get_alt_name() or "")
+        self.alt_input = QLineEdit()
         alt_layout.addWidget(self.alt_input)
         layout.addLayout(alt_layout)
 
         # Координаты RA
         ra_layout = QHBoxLayout()
         ra_layout.addWidget(QLabel("RA (hh:mm:ss):"))
-        self.ra_h_input = QLineEdit(str(self.source.get_ra()[0]))
-        self.ra_m_input = QLineEdit(str(self.source.get_ra()[1]))
-        self.ra_s_input = QLineEdit(f"{self.source.get_ra()[2]:.3f}")
+        self.ra_h_input = QLineEdit()
+        self.ra_m_input = QLineEdit()
+        self.ra_s_input = QLineEdit()
         ra_layout.addWidget(self.ra_h_input)
         ra_layout.addWidget(self.ra_m_input)
         ra_layout.addWidget(self.ra_s_input)
@@ -49,9 +50,9 @@ class EditSourceDialog(QDialog):
         # Координаты DEC
         dec_layout = QHBoxLayout()
         dec_layout.addWidget(QLabel("Dec (dd:mm:ss):"))
-        self.dec_d_input = QLineEdit(str(self.source.get_dec()[0]))
-        self.dec_m_input = QLineEdit(str(self.source.get_dec()[1]))
-        self.dec_s_input = QLineEdit(f"{self.source.get_dec()[2]:.3f}")
+        self.dec_d_input = QLineEdit()
+        self.dec_m_input = QLineEdit()
+        self.dec_s_input = QLineEdit()
         dec_layout.addWidget(self.dec_d_input)
         dec_layout.addWidget(self.dec_m_input)
         dec_layout.addWidget(self.dec_s_input)
@@ -62,18 +63,13 @@ class EditSourceDialog(QDialog):
         active_layout.addWidget(QLabel("Is Active:"))
         self.active_combo = QComboBox()
         self.active_combo.addItems(["True", "False"])
-        self.active_combo.setCurrentText(str(self.source.isactive))
         active_layout.addWidget(self.active_combo)
         layout.addLayout(active_layout)
 
         # Таблица потоков
         layout.addWidget(QLabel("Flux Table (MHz : Jy):"))
-        self.flux_table = QTableWidget(len(self.source._flux_table), 2)
+        self.flux_table = QTableWidget(0, 2)
         self.flux_table.setHorizontalHeaderLabels(["Frequency (MHz)", "Flux (Jy)"])
-        for row, (freq, flux) in enumerate(self.source._flux_table.items()):
-            self.flux_table.setItem(row, 0, QTableWidgetItem(str(freq)))
-            self.flux_table.setItem(row, 1, QTableWidgetItem(str(flux)))
-        self.flux_table.resizeColumnsToContents()
         layout.addWidget(self.flux_table)
 
         flux_btn_layout = QHBoxLayout()
@@ -84,7 +80,7 @@ class EditSourceDialog(QDialog):
         # Спектральный индекс
         spec_layout = QHBoxLayout()
         spec_layout.addWidget(QLabel("Spectral Index:"))
-        self.spec_input = QLineEdit(str(self.source.get_spectral_index() or ""))
+        self.spec_input = QLineEdit()
         spec_layout.addWidget(self.spec_input)
         layout.addLayout(spec_layout)
 
@@ -102,6 +98,28 @@ class EditSourceDialog(QDialog):
         self.setLayout(layout)
         self.setMinimumSize(400, 500)
 
+    def load(self, source: Source):
+        """Fill the dialog fields from source; the dialog can be reused for another source"""
+        self.source = source
+        self.name_input.setText(source.get_name())
+        self.j2000_input.setText(source.get_name_J2000() or "")
+        self.alt_input.setText(source.get_alt_name() or "")
+        ra_h, ra_m, ra_s = source.get_ra()
+        self.ra_h_input.setText(str(ra_h))
+        self.ra_m_input.setText(str(ra_m))
+        self.ra_s_input.setText(f"{ra_s:.3f}")
+        dec_d, dec_m, dec_s = source.get_dec()
+        self.dec_d_input.setText(str(dec_d))
+        self.dec_m_input.setText(str(dec_m))
+        self.dec_s_input.setText(f"{dec_s:.3f}")
+        self.active_combo.setCurrentText(str(source.isactive))
+        self.flux_table.setRowCount(len(source._flux_table))
+        for row, (freq, flux) in enumerate(source._flux_table.items()):
+            self.flux_table.setItem(row, 0, QTableWidgetItem(str(freq)))
+            self.flux_table.setItem(row, 1, QTableWidgetItem(str(flux)))
+        self.flux_table.resizeColumnsToContents()
+        self.spec_input.setText(str(source.get_spectral_index() or ""))
+
     def add_flux_row(self):
         row = self.flux_table.rowCount()
         self.flux_table.insertRow(row)
@@ -4,10 +4,10 @@ import json
 from typing import Optional
 from PySide6.QtWidgets import (QApplication, QMainWindow, QTreeWidget, QTreeWidgetItem, 
                                QTabWidget, QWidget, QVBoxLayout, QLineEdit, QPushButton, 
-                               QTableWidget, QTableWidgetItem, QStatusBar, QDockWidget, QHBoxLayout, QMenu, 
-                               QFileDialog, QLabel, QComboBox, QHeaderView)
+                               QTableWidget, QTableWidgetItem, QTableView, QAbstractItemView, QStatusBar, QDockWidget,
+                               QHBoxLayout, QMenu, QFileDialog, QLabel, QComboBox, QHeaderView)
 from PySide6.QtGui import QAction, QCloseEvent, QIcon
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QThreadPool, QTimer, QSignalBlocker
 import matplotlib
 matplotlib.use('Qt5Agg')
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
@@ -24,6 +24,13 @@ from base.telescopes import Telescope, SpaceTelescope, Telescopes
 from base.frequencies import IF
 from gui.CatalogBrowserDialog import CatalogBrowserDialog
 from gui.CatalogSettingsDialog import CatalogSettingsDialog
+from gui.CatalogLoader import CatalogLoader
+from gui.ProjectLoader import ProjectLoader
+from gui.ProjectSaver import ProjectSaver
+from gui.ObsSummaryBuilder import ObsSummaryBuilder
+from utils.formatting import format_scan_start
+from gui.TableModels import (ObsTableModel, SourcesTableModel, TelescopesTableModel,
+                             FrequenciesTableModel, ScansTableModel)
 from gui.AboutDialog import AboutDialog
 from gui.SourceSelectorDialog import SourceSelectorDialog
 from gui.EditSourceDialog import EditSourceDialog
@@ -33,6 +40,54 @@ from gui.PolarizationSelectorDialog import PolarizationSelectorDialog
 from gui.EditScanDialog import EditScanDialog
 from typing import Union
 from datetime import datetime
+from contextlib import contextmanager
+from collections import OrderedDict
+
+# Допустимые и дефолтные поляризации для каждого типа наблюдения
+_VALID_POLS = {"VLBI": frozenset(("LL", "RR", "LR", "RL")), "SINGLE_DISH": frozenset(("RCP", "LCP", "H", "V"))}
+_DEFAULT_POLS = {"VLBI": ["LL", "RR", "LR", "RL"], "SINGLE_DISH": ["RCP", "LCP"]}
+
+@contextmanager
+def _frozen(*views):
+    """Suspend painting, signals and sorting of the given views while they are refilled"""
+    sorting = [view.isSortingEnabled() for view in views]
+    for view in views:
+        view.setUpdatesEnabled(False)
+        view.setSortingEnabled(False)
+        view.blockSignals(True)
+    try:
+        yield
+    finally:
+        for view, was_sorting in zip(views, sorting):
+            view.blockSignals(False)
+            view.setSortingEnabled(was_sorting)
+            view.setUpdatesEnabled(True)
+
+def _sync_combo_items(combo: QComboBox, items: list, placeholder: str = "Select Observation..."):
+    """Bring combo items after the placeholder in line with items, touching only the changed range"""
+    if combo.count() == 0:
+        combo.addItem(placeholder)
+    old = [combo.itemText(i) for i in range(1, combo.count())]
+    if old == items:
+        return
+    limit = min(len(old), len(items))
+    prefix = 0
+    while prefix < limit and old[prefix] == items[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-1 - suffix] == items[-1 - suffix]:
+        suffix += 1
+    for _ in range(len(old) - prefix - suffix):
+        combo.removeItem(1 + prefix)
+    for i, text in enumerate(items[prefix:len(items) - suffix]):
+        combo.insertItem(1 + prefix + i, text)
+
+def _sync_combo_data(combo: QComboBox, data: list):
+    """Store data[i] as item data of the i-th item after the placeholder"""
+    # Тот же текст может принадлежать новому объекту (загрузка проекта), поэтому сверяются сами объекты
+    for i, obj in enumerate(data, start=1):
+        if combo.itemData(i) is not obj:
+            combo.setItemData(i, obj)
 
 class PvCoreWindow(QMainWindow):
     def __init__(self):
@@ -46,44 +101,114 @@ class PvCoreWindow(QMainWindow):
             logger.error(f"Failed to initialize Manipulator: {e}")
             self.status_bar.showMessage("Critical error: Failed to initialize application")
             raise
+        self._cm = self.manipulator.get_catalog_manager()
+        self._source_catalog = self._cm.source_catalog
+        self._telescope_catalog = self._cm.telescope_catalog
 
         self.settings_file = "settings.json"
         self.current_project_file = None
+        self._catalog_loaders = []  # загрузчики каталогов, выполняющиеся в QThreadPool
+        self._project_loader = None  # загрузчик проекта, выполняющийся в QThreadPool
+        self._project_saver = None  # запись проекта, выполняющаяся в QThreadPool
+        self._obs_summary_builders = []  # подсчет строк obs_table в QThreadPool
+        self._obs_summary_generation = 0  # применяется только результат последнего запуска
+        self._catalog_load_paths = None
+        self._catalog_load_failed = False
+        self._observations_cache = None  # список наблюдений текущего проекта
+        self._obs_index_by_code = None  # код наблюдения -> индекс в проекте, строится лениво
+        self._obs_by_code = None  # код наблюдения -> Observation, строится лениво
+        self._tree_root = None  # корневой элемент project_tree
+        self._tree_items = {}  # код наблюдения -> QTreeWidgetItem в project_tree
+        self._freq_menu = None  # контекстные меню создаются при первом вызове и переиспользуются
+        self._scans_menu = None
+        self._sources_menu = None
+        self._telescopes_menu = None
+        self._tree_menu = None
+        self._obs_table_menu = None
+        self._edit_source_dialog = None  # диалоги редактирования создаются один раз и переиспользуются
+        self._edit_scan_dialog = None
+        self._pol_dialog = None
+        # Диалоги каталогов строят таблицу на весь каталог; пересоздаются только после загрузки нового каталога
+        self._telescope_selector_dialog = None
+        self._catalog_browser_dialogs = {}  # catalog_type -> (catalog, CatalogBrowserDialog)
+        # Готовые фигуры последних графиков: (obs_code, plot_type, scan_key) -> ((obs, calc_version), Figure)
+        self._figure_cache = OrderedDict()
+        self._figure_cache_size = 12
+        self._obs_selector_index = {}  # текст элемента obs_selector -> индекс
+        # Обновления таблиц, запрошенные серией правок, сливаются в одно через 50 мс после последней
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_ui_refresh)
+        self._pending_refresh_obs = None
+        self._pending_refresh = set()  # разделы окна, ожидающие обновления: "config", "obs", "tree"
+        self._programmatic_update = False  # таблицы заполняются программно, слоты игнорируют изменения
+        self._loaded_catalogs = set()  # каталоги разбираются при первом обращении, а не при запуске
         self.load_settings()
-        self.load_catalogs()
 
-        self.obs_table = QTableWidget(0, 6)
-        self.obs_table.setHorizontalHeaderLabels(["Code", "Type", "Sources", "Telescopes", "Frequencies", "Scans"])
-        self.obs_table.horizontalHeader().setStretchLastSection(True)
+        self.obs_model = ObsTableModel(self)
+        self.obs_table = QTableView()
+        self.obs_table.setModel(self.obs_model)
+        # Режим заголовка задаётся один раз: ширина колонок не пересчитывается при каждом обновлении
+        obs_header = self.obs_table.horizontalHeader()
+        obs_header.setSectionResizeMode(QHeaderView.Interactive)
+        obs_header.setDefaultSectionSize(140)
+        obs_header.setStretchLastSection(True)
+        self._obs_table_fitted = False  # колонки obs_table подогнаны под содержимое при первом заполнении
+        self.obs_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.obs_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.obs_table.customContextMenuRequested.connect(self.show_obs_table_context_menu)
-        self.obs_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.obs_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         
-        self.sources_table = QTableWidget(0, 6)
-        self.sources_table.setHorizontalHeaderLabels(["Name", "Name (J2000)", "Alt. Name", "RA", "Dec", "Is Active"])
-        self.sources_table.horizontalHeader().setStretchLastSection(True)
+        self.sources_model = SourcesTableModel(self)
+        self.sources_model.activeToggled.connect(self.on_source_is_active_changed)
+        self.sources_table = QTableView()
+        self.sources_table.setModel(self.sources_model)
+        # Колонки растягиваются заголовком, пересчет ширины по содержимому при обновлении не нужен
+        self.sources_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.sources_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.sources_table.setSelectionMode(QAbstractItemView.MultiSelection)
         self.sources_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.sources_table.customContextMenuRequested.connect(self.show_sources_table_context_menu)
 
-        self.telescopes_table = QTableWidget(0, 8)
-        self.telescopes_table.setHorizontalHeaderLabels(["Code", "Name", "X (m)", "Y (m)", "Z (m)", "Diameter (m)", "Mount Type", "Is Active"])
-        self.telescopes_table.horizontalHeader().setStretchLastSection(True)
+        self.telescopes_model = TelescopesTableModel(self)
+        self.telescopes_model.activeToggled.connect(self.on_telescope_is_active_changed)
+        self.telescopes_table = QTableView()
+        self.telescopes_table.setModel(self.telescopes_model)
+        self.telescopes_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.telescopes_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.telescopes_table.setSelectionMode(QAbstractItemView.MultiSelection)
         self.telescopes_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.telescopes_table.customContextMenuRequested.connect(self.show_telescopes_context_menu)
 
-        self.frequencies_table = QTableWidget(0, 4)  
-        self.frequencies_table.setHorizontalHeaderLabels(["Frequency (MHz)", "Bandwidth (MHz)", "Polarizations", "Is Active"])
-        self.frequencies_table.horizontalHeader().setStretchLastSection(True)
+        self.frequencies_model = FrequenciesTableModel(self)
+        self.frequencies_model.frequencyEdited.connect(self.on_frequency_item_changed)
+        self.frequencies_model.editFailed.connect(self.on_frequency_edit_failed)
+        self.frequencies_model.activeToggled.connect(self.on_frequency_is_active_changed)
+        self.frequencies_table = QTableView()
+        self.frequencies_table.setModel(self.frequencies_model)
+        self.frequencies_table.doubleClicked.connect(self.on_frequencies_double_clicked)
+        self.frequencies_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.frequencies_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.frequencies_table.setSelectionMode(QAbstractItemView.MultiSelection)
         self.frequencies_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.frequencies_table.customContextMenuRequested.connect(self.show_frequencies_context_menu)
-        self.frequencies_table.itemChanged.connect(self.on_frequency_item_changed)
 
-        self.scans_table = QTableWidget(0, 6)  
-        self.scans_table.setHorizontalHeaderLabels(["Start", "Duration", "Source", "Telescopes", "Frequencies", "Is Active"])
-        self.scans_table.horizontalHeader().setStretchLastSection(True)
+        self.scans_model = ScansTableModel(self)
+        self.scans_table = QTableView()
+        self.scans_table.setModel(self.scans_model)
+        self.scans_model.activeToggled.connect(self.on_scan_is_active_changed)
+        self.scans_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.scans_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.scans_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.scans_table.customContextMenuRequested.connect(self.show_scans_context_menu)
 
+        # Все строки таблиц однострочные: высота фиксирована и не измеряется по содержимому
+        for table in (self.obs_table, self.sources_table, self.telescopes_table, self.frequencies_table, self.scans_table):
+            rows_header = table.verticalHeader()
+            rows_header.setSectionResizeMode(QHeaderView.Fixed)
+            rows_header.setDefaultSectionSize(table.fontMetrics().height() + 8)
+
         self.setup_menu()
         main_widget = QWidget()
         self.setCentralWidget(main_widget)
@@ -99,61 +224,159 @@ class PvCoreWindow(QMainWindow):
         self.status_bar.showMessage(f"Ready | {datetime.now().strftime('%B %d, %Y')}")
 
     def get_observation_by_code(self, code: str) -> Optional[Observation]:
-        return next((obs for obs in self.manipulator.get_observations() if obs.get_observation_code() == code), None)
+        if self._obs_by_code is None:
+            self._rebuild_obs_index()
+        return self._obs_by_code.get(code)
+
+    def get_observation_index(self, code: str) -> int:
+        """Position of the observation in the project, -1 if the code is unknown"""
+        if self._obs_index_by_code is None:
+            self._rebuild_obs_index()
+        return self._obs_index_by_code.get(code, -1)
     
+    @property
+    def _observations(self) -> list:
+        if self._observations_cache is None:
+            self._observations_cache = self.manipulator.get_observations()
+        return self._observations_cache
+
+    def _invalidate_obs_cache(self):
+        self._observations_cache = None
+        self._obs_by_code = None
+        self._obs_index_by_code = None
+
+    def _rename_in_obs_index(self, old_code: str, new_code: str):
+        # Переименование не меняет порядок наблюдений: переносится только ключ
+        if self._obs_by_code is not None and old_code in self._obs_by_code:
+            self._obs_by_code[new_code] = self._obs_by_code.pop(old_code)
+        if self._obs_index_by_code is not None and old_code in self._obs_index_by_code:
+            self._obs_index_by_code[new_code] = self._obs_index_by_code.pop(old_code)
+
+    def _append_to_obs_index(self, obs: Observation):
+        # Добавление в конец не сдвигает индексы остальных наблюдений
+        self._observations_cache = None
+        if self._obs_by_code is None or self._obs_index_by_code is None:
+            return
+        code = obs.get_observation_code()
+        self._obs_index_by_code[code] = len(self._obs_index_by_code)
+        self._obs_by_code[code] = obs
+
+    def _rebuild_obs_index(self):
+        self._invalidate_obs_cache()
+        observations = self._observations
+        self._obs_index_by_code = {obs.get_observation_code(): i for i, obs in enumerate(observations)}
+        self._obs_by_code = {obs.get_observation_code(): obs for obs in observations}
+
+    def _schedule_ui_refresh(self, obs: Optional[Observation] = None, sections=("config", "obs")):
+        """Coalesce a burst of refresh requests into a single update of each section once edits settle."""
+        if obs is not None:
+            self._pending_refresh_obs = obs
+        self._pending_refresh.update(sections)
+        self._refresh_timer.start()  # перезапуск таймера откладывает обновление до конца серии
+
+    def _do_ui_refresh(self):
+        obs, self._pending_refresh_obs = self._pending_refresh_obs, None
+        sections, self._pending_refresh = self._pending_refresh, set()
+        # Каждый раздел обновляется не более одного раза за серию изменений
+        if "tree" in sections:
+            self.update_project_tree()
+        if "config" in sections and obs is not None:
+            self.update_config_tables(obs)
+        elif "telescopes" in sections and obs is not None:
+            self._refresh_telescope_table(obs)
+        if "obs" in sections:
+            self.update_obs_table()
+        if "selector" in sections:
+            self._refresh_obs_selector()
+
+    def _index_obs_selector(self):
+        self._obs_selector_index = {self.obs_selector.itemText(i): i for i in range(self.obs_selector.count())}
+
     def sync_all_obs_selectors(self, obs_code: str = None):
+        codes = [obs.get_observation_code() for obs in self._observations]
         for selector in [self.obs_selector, self.calc_obs_selector, self.viz_obs_selector]:
-            selector.blockSignals(True)
-            selector.clear()
-            selector.addItem("Select Observation...")
-            for obs in self.manipulator.get_observations():
-                selector.addItem(obs.get_observation_code())
-            if obs_code:
-                selector.setCurrentText(obs_code)
-            selector.blockSignals(False)
-
-    def format_ra(self, ra_deg: float) -> str:
-        ra_h = int(ra_deg / 15)
-        ra_m = int((ra_deg / 15 - ra_h) * 60)
-        ra_s = ((ra_deg / 15 - ra_h) * 60 - ra_m) * 60
-        return f"{ra_h:02d}ʰ{ra_m:02d}′{ra_s:05.2f}″"
-
-    def format_dec(self, dec_deg: float) -> str:
-        sign = "-" if dec_deg < 0 else ""
-        dec_deg = abs(dec_deg)
-        dec_d = int(dec_deg)
-        dec_m = int((dec_deg - dec_d) * 60)
-        dec_s = ((dec_deg - dec_d) * 60 - dec_m) * 60
-        return f"{sign}{dec_d}°{dec_m:02d}′{dec_s:05.2f}″"
-    
-    def show_frequencies_context_menu(self, position):
+            with QSignalBlocker(selector):
+                _sync_combo_items(selector, codes)
+                if selector is self.obs_selector:
+                    _sync_combo_data(selector, self._observations)
+                if obs_code:
+                    selector.setCurrentText(obs_code)
+        self._index_obs_selector()
+
+    def _source_dialog(self, source: Source) -> EditSourceDialog:
+        if self._edit_source_dialog is None:
+            self._edit_source_dialog = EditSourceDialog(source, self)
+        else:
+            self._edit_source_dialog.load(source)
+        return self._edit_source_dialog
+
+    def _scan_dialog(self, scan: Optional[Scan], obs: Observation) -> EditScanDialog:
+        sources = obs.get_sources().get_active_sources()
+        if self._edit_scan_dialog is None:
+            self._edit_scan_dialog = EditScanDialog(scan=scan, sources=sources, telescopes=obs.get_telescopes(),
+                                                    frequencies=obs.get_frequencies(), parent=self)
+        else:
+            self._edit_scan_dialog.load(scan, sources, obs.get_telescopes(), obs.get_frequencies())
+        return self._edit_scan_dialog
+
+    def _polarization_dialog(self, polarizations: list, obs_type: str) -> PolarizationSelectorDialog:
+        if self._pol_dialog is None:
+            self._pol_dialog = PolarizationSelectorDialog(polarizations, obs_type, self)
+        else:
+            self._pol_dialog.load(polarizations, obs_type)
+        return self._pol_dialog
+
+    def _telescope_selector(self) -> TelescopeSelectorDialog:
+        dialog = self._telescope_selector_dialog
+        if dialog is None or dialog.catalog is not self._telescope_catalog:
+            if dialog is not None:
+                dialog.deleteLater()
+            dialog = TelescopeSelectorDialog(self._telescope_catalog, self)
+            self._telescope_selector_dialog = dialog
+        else:
+            dialog.reset()
+        return dialog
+
+    def _catalog_browser(self, catalog_type: str, catalog) -> CatalogBrowserDialog:
+        cached = self._catalog_browser_dialogs.get(catalog_type)
+        if cached is not None and cached[0] is catalog:
+            cached[1].search_input.clear()
+            return cached[1]
+        if cached is not None:
+            cached[1].deleteLater()
+        data = catalog.get_all_sources() if catalog_type == "Source" else catalog.get_all_telescopes()
+        dialog = CatalogBrowserDialog(catalog_type, data, self)
+        self._catalog_browser_dialogs[catalog_type] = (catalog, dialog)
+        return dialog
+
+    def _build_context_menu(self, entries: list) -> QMenu:
+        """Build a context menu once; entries are (text, slot) pairs, None adds a separator"""
         menu = QMenu(self)
-        add_action = QAction("Add Frequency", self)
-        add_action.triggered.connect(self.add_frequency)
-        menu.addAction(add_action)
-        
-        insert_action = QAction("Insert Frequency", self)
-        insert_action.triggered.connect(self.insert_frequency)
-        menu.addAction(insert_action)
-        
-        remove_action = QAction("Remove Frequency", self)
-        remove_action.triggered.connect(self.remove_frequency)
-        menu.addAction(remove_action)
-        
-        menu.addSeparator()
-        
-        activate_action = QAction("Activate All Frequencies", self)
-        activate_action.triggered.connect(self.activate_all_frequencies)
-        menu.addAction(activate_action)
-        
-        deactivate_action = QAction("Deactivate All Frequencies", self)
-        deactivate_action.triggered.connect(self.deactivate_all_frequencies)
-        menu.addAction(deactivate_action)
-        
-        menu.popup(self.frequencies_table.viewport().mapToGlobal(position))
+        for entry in entries:
+            if entry is None:
+                menu.addSeparator()
+            else:
+                text, slot = entry
+                action = QAction(text, menu)
+                action.triggered.connect(slot)
+                menu.addAction(action)
+        return menu
 
-    def on_scan_is_active_changed(self, scan: Scan, state: str):
-        new_state = state == "True"
+    def show_frequencies_context_menu(self, position):
+        if self._freq_menu is None:
+            self._freq_menu = self._build_context_menu([
+                ("Add Frequency", self.add_frequency),
+                ("Insert Frequency", self.insert_frequency),
+                ("Remove Frequency", self.remove_frequency),
+                None,
+                ("Activate All Frequencies", self.activate_all_frequencies),
+                ("Deactivate All Frequencies", self.deactivate_all_frequencies),
+            ])
+        self._freq_menu.popup(self.frequencies_table.viewport().mapToGlobal(position))
+
+    def on_scan_is_active_changed(self, scan: Scan, row: int, new_state: bool):
+        if self._programmatic_update:
+            return
         if new_state != scan.isactive:
             if new_state:
                 scan.activate()
@@ -161,175 +384,129 @@ class PvCoreWindow(QMainWindow):
             else:
                 scan.deactivate()
                 logger.info(f"Deactivated scan with start={scan.get_start()}")
-            selected = self.obs_selector.currentText()
-            if selected != "Select Observation...":
-                obs = self.get_observation_by_code(selected)
-                if obs:
-                    self.update_config_tables(obs)
-                    self.update_obs_table()
+            obs = self.obs_selector.currentData()
+            if obs is not None:
+                obs.mark_activation_changed()
+                self._refresh_obs_row(obs)
     
     def activate_all_frequencies(self):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        obs = self.get_observation_by_code(selected)
-        if obs:
-            obs.get_frequencies().activate_all()
-            self.update_config_tables(obs)
-            self.update_obs_table()
-            self.status_bar.showMessage(f"All frequencies activated for '{selected}'")
+        selected = obs.get_observation_code()
+        obs.get_frequencies().activate_all()
+        obs.mark_activation_changed()
+        self._refresh_after_bulk_activation(self.frequencies_model, obs)
+        self.status_bar.showMessage(f"All frequencies activated for '{selected}'")
     
     def deactivate_all_frequencies(self):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        obs = self.get_observation_by_code(selected)
-        if obs:
-            obs.get_frequencies().deactivate_all()
-            self.update_config_tables(obs)
-            self.update_obs_table()
-            self.status_bar.showMessage(f"All frequencies deactivated for '{selected}'")
+        selected = obs.get_observation_code()
+        obs.get_frequencies().deactivate_all()
+        obs.mark_activation_changed()
+        self._refresh_after_bulk_activation(self.frequencies_model, obs)
+        self.status_bar.showMessage(f"All frequencies deactivated for '{selected}'")
 
     def insert_frequency(self):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        row = self.frequencies_table.currentRow()
-        obs = self.get_observation_by_code(selected)
-        if obs:
-            new_freq = 1000.0 + len(obs.get_frequencies().get_all_IF()) * 10 # ----> !!!!!! при добавлении частоты нужно учитывать пересечения
-            default_pol = ["LL"] if obs.get_observation_type() == "VLBI" else ["RCP"]
-            if_obj = IF(freq=new_freq, bandwidth=16.0, polarization=default_pol)
+        selected = obs.get_observation_code()
+        row = self.frequencies_table.currentIndex().row()
+        bandwidth = 16.0
+        new_freq = obs.get_frequencies().find_free_frequency(bandwidth, start=1000.0)
+        default_pol = ["LL"] if obs.get_observation_type() == "VLBI" else ["RCP"]
+        if_obj = IF(freq=new_freq, bandwidth=bandwidth, polarization=default_pol)
+        try:
             if row == -1:
                 self.manipulator.add_frequency_to_observation(obs, if_obj)
             else:
                 self.manipulator.insert_frequency_to_observation(obs, if_obj, row)
-            self.update_all_ui(selected)
-            self.status_bar.showMessage(f"Inserted frequency {new_freq} MHz into '{selected}'")
+        except ValueError as e:
+            logger.warning(f"Failed to insert frequency {new_freq} MHz into '{selected}': {e}")
+            self.status_bar.showMessage(f"Error: {e}")
+            return
+        obs.set_calc_dirty()
+        self._schedule_ui_refresh(obs)
+        self.status_bar.showMessage(f"Inserted frequency {new_freq} MHz into '{selected}'")
     
     def remove_frequency(self):
-        obs_code = self.obs_selector.currentText()
-        if obs_code == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        row = self.frequencies_table.currentRow()
+        row = self.frequencies_table.currentIndex().row()
         if row == -1:
             self.status_bar.showMessage("Please select a frequency to remove")
             return
-        obs = self.get_observation_by_code(obs_code)
-        if obs:
-            self.manipulator.remove_frequency_from_observation(obs, row)
-            self.update_all_ui(obs_code)
-            self.status_bar.showMessage("Telescope removed")        
+        self.manipulator.remove_frequency_from_observation(obs, row)
+        obs.set_calc_dirty()
+        self._schedule_ui_refresh(obs)
+        self.status_bar.showMessage("Telescope removed")        
     
-    def on_frequency_item_changed(self, item):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
-            return
-        obs = self.get_observation_by_code(selected)
-        if not obs:
-            return
-        row = item.row()
-        col = item.column()
-        frequencies = obs.get_frequencies().get_all_IF()
-        if row >= len(frequencies):
+    def on_frequency_item_changed(self, row: int, col: int):
+        # Проверку и запись значения выполняет FrequenciesTableModel.setData
+        obs = self.obs_selector.currentData()
+        if obs is None:
             return
-        freq_obj = frequencies[row]
-        old_freq = freq_obj.get_frequency()
-        old_bw = freq_obj.get_bandwidth()
-        old_pol = freq_obj.get_polarization()
+        selected = obs.get_observation_code()
+        logger.info(f"Updated frequency at row {row} in observation '{selected}'")
+        obs.set_calc_dirty()
+        self._schedule_ui_refresh(obs)
+        self.status_bar.showMessage(f"Frequency updated in '{selected}'")
+
+    def on_frequency_edit_failed(self, error: str):
+        self.status_bar.showMessage(f"Error: {error}")
+
+    def update_all_ui(self, selected_obs_code=None):
+        # Перерисовка окна откладывается до конца обновления всех виджетов
+        self.setUpdatesEnabled(False)
         try:
-            if col == 0:  # Frequency
-                new_freq = float(item.text())
-                if new_freq <= 0:
-                    raise ValueError("Frequency must be positive")
-                freq_obj.set_frequency(new_freq)
-            elif col == 1:  # Bandwidth
-                new_bw = float(item.text())
-                if new_bw <= 0:
-                    raise ValueError("Bandwidth must be positive")
-                freq_obj.set_bandwidth(new_bw)
-            elif col == 2:  # Polarization
-                new_pol = item.text().strip() or None
-                if new_pol:
-                    freq_obj.set_polarization(new_pol)
-                else:
-                    freq_obj._polarization = None
-            logger.info(f"Updated frequency at row {row} in observation '{selected}'")
-            self.update_config_tables(obs)
+            # Индекс наблюдений поддерживают сами обработчики изменений, здесь он не перестраивается
+            observations = self._observations
+            codes = [obs.get_observation_code() for obs in observations]
+            self._sync_project_tree(observations)
+
             self.update_obs_table()
-            self.status_bar.showMessage(f"Frequency updated in '{selected}'")
-        except ValueError as e:
-            logger.error(f"Invalid input for frequency at row {row}, col {col}: {e}")
-            self.status_bar.showMessage(f"Error: {e}")
-            if col == 0:
-                freq_obj.set_frequency(old_freq)
-            elif col == 1:
-                freq_obj.set_bandwidth(old_bw)
-            elif col == 2:
-                freq_obj.set_polarization(old_pol)
-            self.update_config_tables(obs)
 
-    def update_all_ui(self, selected_obs_code=None):
-        self.project_tree.clear()
-        root = QTreeWidgetItem([self.manipulator.get_project_name()])
-        for obs in self.manipulator.get_observations():
-            QTreeWidgetItem(root, [obs.get_observation_code()])
-        self.project_tree.addTopLevelItem(root)
-        root.setExpanded(True)
-
-        self.obs_table.setRowCount(0)
-        for i, obs in enumerate(self.manipulator.get_observations()):
-            self.obs_table.insertRow(i)
-            for col, value in enumerate([
-                obs.get_observation_code(),
-                obs.get_observation_type(),
-                f"{len(obs.get_sources().get_active_sources())} ({len(obs.get_sources().get_all_sources())})",
-                f"{len(obs.get_telescopes().get_active_telescopes())} ({len(obs.get_telescopes().get_all_telescopes())})",
-                f"{len(obs.get_frequencies().get_active_frequencies())} ({len(obs.get_frequencies().get_all_IF())})",
-                f"{len(obs.get_scans().get_active_scans(obs))} ({len(obs.get_scans().get_all_scans())})"
-            ]):
-                item = QTableWidgetItem(value)
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                self.obs_table.setItem(i, col, item)
-        self.obs_table.resizeColumnsToContents()
-        self.obs_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-
-        # Обновляем основной селектор (Configurator)
-        self.obs_selector.clear()
-        self.obs_selector.addItem("Select Observation...")
-        for obs in self.manipulator.get_observations():
-            self.obs_selector.addItem(obs.get_observation_code())
-        if selected_obs_code:
-            self.obs_selector.setCurrentText(selected_obs_code)
-
-        # Обновляем селектор на вкладке Calculator, если она существует
-        if self.tabs.count() > 2:  # Проверяем, что вкладка Calculator добавлена
-            self.update_calc_obs_selector(self.calc_obs_selector)  # Use instance variable
+            # Обновляем основной селектор (Configurator)
+            _sync_combo_items(self.obs_selector, codes)
+            _sync_combo_data(self.obs_selector, observations)
+            self._index_obs_selector()
             if selected_obs_code:
-                self.calc_obs_selector.setCurrentText(selected_obs_code)
+                self.obs_selector.setCurrentText(selected_obs_code)
 
-        if selected_obs_code and selected_obs_code != "Select Observation...":
-            obs = self.get_observation_by_code(selected_obs_code)
-            if obs:
-                self.update_config_tables(obs)
+            # Обновляем селектор на вкладке Calculator, если она существует
+            if self.tabs.count() > 2:  # Проверяем, что вкладка Calculator добавлена
+                self.update_calc_obs_selector(self.calc_obs_selector, codes)  # Use instance variable
+                if selected_obs_code:
+                    self.calc_obs_selector.setCurrentText(selected_obs_code)
+
+            if selected_obs_code and selected_obs_code != "Select Observation...":
+                obs = self.get_observation_by_code(selected_obs_code)
+                if obs:
+                    self.update_config_tables(obs)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def setup_menu(self):
         menubar = self.menuBar()
         file_menu = menubar.addMenu("File")
         file_menu.addAction("New", self.new_project)
         file_menu.addSeparator()
-        file_menu.addAction("Open", self.open_project)
+        self.open_project_action = file_menu.addAction("Open", self.open_project)
         file_menu.addAction("Save", self.save_project)
         file_menu.addAction("Save As...", self.save_project_as)
         file_menu.addSeparator()
         file_menu.addAction("Exit", self.close)
 
         settings_menu = menubar.addMenu("Settings")
-        settings_menu.addAction("Set Catalogs...", self.show_catalog_settings)
+        self.set_catalogs_action = settings_menu.addAction("Set Catalogs...", self.show_catalog_settings)
         settings_menu.addAction("Source Catalog Browser", self.show_source_catalog_browser)
         settings_menu.addAction("Telescope Catalog Browser", self.show_telescope_catalog_browser)
 
@@ -419,8 +596,6 @@ class PvCoreWindow(QMainWindow):
         telescopes_buttons_layout.addWidget(QPushButton("Edit Telescope", clicked=self.edit_telescope))
         telescopes_buttons_layout.addWidget(QPushButton("Remove Telescope", clicked=self.remove_telescope))
         telescopes_layout.addLayout(telescopes_buttons_layout)
-        self.telescopes_table.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.telescopes_table.customContextMenuRequested.connect(self.show_telescopes_context_menu)
         config_subtabs.addTab(telescopes_tab, "Telescopes")
 
         frequencies_tab = QWidget()
@@ -439,8 +614,6 @@ class PvCoreWindow(QMainWindow):
         scans_buttons_layout.addWidget(QPushButton("Add Scan", clicked=self.add_scan))
         scans_buttons_layout.addWidget(QPushButton("Remove Scan", clicked=self.remove_scan))
         scans_layout.addLayout(scans_buttons_layout)
-        self.scans_table.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.scans_table.customContextMenuRequested.connect(self.show_scans_context_menu)
         config_subtabs.addTab(scans_tab, "Scans")
         
         config_layout.addWidget(config_subtabs)
@@ -459,7 +632,7 @@ class PvCoreWindow(QMainWindow):
         
         # Кнопка для запуска расчетов
         calc_button = QPushButton("Calculate All Parameters")
-        calc_button.clicked.connect(lambda: self.run_calculations(self.calc_obs_selector.currentText()))
+        calc_button.clicked.connect(self.on_calc_button_clicked)
         calc_layout.addWidget(calc_button)
         
         # Таблица результатов
@@ -511,13 +684,10 @@ class PvCoreWindow(QMainWindow):
     def on_tab_changed(self, index: int):
         """Обновляет интерфейс при переключении вкладок."""
         if index == 1:  # Вкладка Configurator (индекс 1)
-            selected = self.obs_selector.currentText()
-            if selected != "Select Observation...":
-                obs = self.get_observation_by_code(selected)
-                if obs:
-                    self.obs_code_input.blockSignals(True)  # Блокируем сигналы, чтобы избежать лишних вызовов
+            obs = self.obs_selector.currentData()
+            if obs is not None:
+                with QSignalBlocker(self.obs_code_input):  # Блокируем сигналы, чтобы избежать лишних вызовов
                     self.obs_code_input.setText(obs.get_observation_code())
-                    self.obs_code_input.blockSignals(False)
         if index == 3:  # Vizualizator tab
             self.update_viz_obs_selector()
             self.refresh_plot()
@@ -526,7 +696,7 @@ class PvCoreWindow(QMainWindow):
         """Update observation selector for Vizualizator tab."""
         self.viz_obs_selector.clear()
         self.viz_obs_selector.addItem("Select Observation...")
-        for obs in self.manipulator.get_observations():
+        for obs in self._observations:
             self.viz_obs_selector.addItem(obs.get_observation_code())
 
     def on_viz_obs_selected(self, obs_code: str):
@@ -560,58 +730,36 @@ class PvCoreWindow(QMainWindow):
             self.status_bar.showMessage("Project name cannot be empty")
     
     def show_scans_context_menu(self, position):
-        menu = QMenu(self)
-        add_action = QAction("Add Scan", self)
-        add_action.triggered.connect(self.add_scan)
-        menu.addAction(add_action)
-        
-        insert_action = QAction("Insert Scan", self)
-        insert_action.triggered.connect(self.insert_scan)
-        menu.addAction(insert_action)
-        
-        edit_action = QAction("Edit Scan", self)
-        edit_action.triggered.connect(self.edit_scan)
-        menu.addAction(edit_action)
-        
-        remove_action = QAction("Remove Scan", self)
-        remove_action.triggered.connect(self.remove_scan)
-        menu.addAction(remove_action)
-        
-        menu.addSeparator()
-        
-        activate_action = QAction("Activate All", self)
-        activate_action.triggered.connect(self.activate_all_scans)
-        menu.addAction(activate_action)
-        
-        deactivate_action = QAction("Deactivate All", self)
-        deactivate_action.triggered.connect(self.deactivate_all_scans)
-        menu.addAction(deactivate_action)
-        
-        menu.popup(self.scans_table.viewport().mapToGlobal(position))
-        menu.aboutToHide.connect(menu.deleteLater)
+        if self._scans_menu is None:
+            self._scans_menu = self._build_context_menu([
+                ("Add Scan", self.add_scan),
+                ("Insert Scan", self.insert_scan),
+                ("Edit Scan", self.edit_scan),
+                ("Remove Scan", self.remove_scan),
+                None,
+                ("Activate All", self.activate_all_scans),
+                ("Deactivate All", self.deactivate_all_scans),
+            ])
+        self._scans_menu.popup(self.scans_table.viewport().mapToGlobal(position))
     
     def insert_scan(self):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        obs = self.get_observation_by_code(selected)
-        if not obs:
-            return
-        if not (obs.get_sources().get_active_sources() and obs.get_telescopes().get_active_telescopes() and obs.get_frequencies().get_active_frequencies()):
+        selected = obs.get_observation_code()
+        if not (obs.get_sources().any_active() and obs.get_telescopes().any_active() and obs.get_frequencies().any_active()):
             logger.warning(f"Cannot insert scan to '{selected}': missing active sources, telescopes, or frequencies")
             self.status_bar.showMessage("Cannot insert scan: observation requires active sources, telescopes, and frequencies")
             return
         
-        dialog = EditScanDialog(sources=obs.get_sources().get_active_sources(), 
-                                telescopes=obs.get_telescopes(), 
-                                frequencies=obs.get_frequencies(), 
-                                parent=self)
+        dialog = self._scan_dialog(None, obs)
         if dialog.exec():
             new_scan = dialog.get_updated_scan()
+            start_str = format_scan_start(new_scan.get_start_datetime())
             scans = obs.get_scans()
             current_scans = scans.get_all_scans()
-            row = self.scans_table.currentRow()
+            row = self.scans_table.currentIndex().row()
             if row == -1:
                 try:
                     self.manipulator.add_scan_to_observation(obs, new_scan)
@@ -629,325 +777,365 @@ class PvCoreWindow(QMainWindow):
                     logger.error(f"Failed to insert scan: {reason}")
                     self.status_bar.showMessage(f"Error: {reason}")
                     return
-                logger.info(f"Inserted scan starting at {new_scan.get_start_datetime().strftime('%Y-%m-%d %H:%M:%S.%f')[:-4]} at index {row} in '{selected}'")
-            self.update_config_tables(obs)
-            self.update_obs_table()
-            self.status_bar.showMessage(f"Inserted scan starting at {new_scan.get_start_datetime().strftime('%Y-%m-%d %H:%M:%S.%f')[:-4]} into '{selected}'")
+                logger.info(f"Inserted scan starting at {start_str} at index {row} in '{selected}'")
+            obs.set_calc_dirty()
+            self._schedule_ui_refresh(obs)
+            self.status_bar.showMessage(f"Inserted scan starting at {start_str} into '{selected}'")
     
     def remove_scan(self):
-        obs_code = self.obs_selector.currentText()
-        if obs_code == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        row = self.scans_table.currentRow()
+        row = self.scans_table.currentIndex().row()
         if row == -1:
             self.status_bar.showMessage("Please select a scan to remove")
             return
-        obs = self.get_observation_by_code(obs_code)
-        if obs:
-            self.manipulator.remove_scan_from_observation(obs, row)
-            self.update_all_ui(obs_code)
-            self.status_bar.showMessage("Scan removed")
+        self.manipulator.remove_scan_from_observation(obs, row)
+        obs.set_calc_dirty()
+        self._schedule_ui_refresh(obs)
+        self.status_bar.showMessage("Scan removed")
     
     def activate_all_scans(self):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        obs = self.get_observation_by_code(selected)
-        if obs:
-            obs.get_scans().activate_all()
-            self.update_config_tables(obs)
-            self.update_obs_table()
-            self.status_bar.showMessage(f"All scans activated for '{selected}'")
+        selected = obs.get_observation_code()
+        obs.get_scans().activate_all()
+        obs.mark_activation_changed()
+        self._refresh_after_bulk_activation(self.scans_model, obs)
+        self.status_bar.showMessage(f"All scans activated for '{selected}'")
 
     def deactivate_all_scans(self):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        obs = self.get_observation_by_code(selected)
-        if obs:
-            obs.get_scans().deactivate_all()
-            self.update_config_tables(obs)
-            self.update_obs_table()
-            self.status_bar.showMessage(f"All scans deactivated for '{selected}'")
+        selected = obs.get_observation_code()
+        obs.get_scans().deactivate_all()
+        obs.mark_activation_changed()
+        self._refresh_after_bulk_activation(self.scans_model, obs)
+        self.status_bar.showMessage(f"All scans deactivated for '{selected}'")
     
     def set_observation_code(self):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
+        selected = obs.get_observation_code()
         new_code = self.obs_code_input.text().strip()
         if not new_code:
             self.status_bar.showMessage("Observation code cannot be empty")
             return
-        obs = self.get_observation_by_code(selected)
-        if obs:
-            self.manipulator.configure_observation_code(obs, new_code)  # Через Manipulator
-            self.update_all_ui(new_code)
-            self.status_bar.showMessage(f"Observation code set to '{new_code}'")
+        if new_code == selected:
+            return  # код не изменился, обновлять окно не нужно
+        self.manipulator.configure_observation_code(obs, new_code)  # Через Manipulator
+        self._rename_in_obs_index(selected, new_code)
+        self.update_all_ui(new_code)
+        self.status_bar.showMessage(f"Observation code set to '{new_code}'")
 
     def edit_telescope(self):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        row = self.telescopes_table.currentRow()
+        row = self.telescopes_table.currentIndex().row()
         if row == -1:
             self.status_bar.showMessage("Please select a telescope to edit")
             return
-        obs = self.get_observation_by_code(selected)
-        if obs:
-            telescope = obs.get_telescopes().get_telescope(row)
-            dialog = EditTelescopeDialog(telescope, self)
-            if dialog.exec():
-                updated_telescope = dialog.get_updated_telescope()
-                obs.get_telescopes().set_telescope(row, updated_telescope)
-                self.update_config_tables(obs)
-                self.update_obs_table()
-                self.status_bar.showMessage(f"Telescope '{updated_telescope.get_code()}' updated")
+        telescope = obs.get_telescopes().get_telescope(row)
+        dialog = EditTelescopeDialog(telescope, self)
+        if dialog.exec():
+            updated_telescope = dialog.get_updated_telescope()
+            obs.get_telescopes().set_telescope(row, updated_telescope)
+            obs.set_calc_dirty()
+            self._schedule_ui_refresh(obs)
+            self.status_bar.showMessage(f"Telescope '{updated_telescope.get_code()}' updated")
 
     def remove_source(self):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
+        selected = obs.get_observation_code()
         selected_rows = [index.row() for index in self.sources_table.selectionModel().selectedRows()]
         if not selected_rows:
             self.status_bar.showMessage("No sources selected to remove")
             return
-        obs = self.get_observation_by_code(selected)
-        if obs:
-            for row in sorted(selected_rows, reverse=True):
-                self.manipulator.remove_source_from_observation(obs, row)
-            self.update_all_ui(selected)
-            self.status_bar.showMessage(f"Removed {len(selected_rows)} source(s) from '{selected}'")
+        # Группируем выделенные строки в непрерывные диапазоны [start, end)
+        ranges = []
+        for row in sorted(set(selected_rows)):
+            if ranges and ranges[-1][1] == row:
+                ranges[-1][1] = row + 1
+            else:
+                ranges.append([row, row + 1])
+        for start, end in reversed(ranges):
+            self.manipulator.remove_sources_from_observation(obs, start, end)
+        self._schedule_ui_refresh(obs)
+        self.status_bar.showMessage(f"Removed {len(selected_rows)} source(s) from '{selected}'")
 
     def remove_telescope(self):
-        obs_code = self.obs_selector.currentText()
-        if obs_code == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        row = self.telescopes_table.currentRow()
+        row = self.telescopes_table.currentIndex().row()
         if row == -1:
             self.status_bar.showMessage("Please select a telescope to remove")
             return
-        obs = self.get_observation_by_code(obs_code)
-        if obs:
-            self.manipulator.remove_telescope_from_observation(obs, row)
-            self.update_all_ui(obs_code)
-            self.status_bar.showMessage("Telescope removed")
+        self.manipulator.remove_telescope_from_observation(obs, row)
+        obs.set_calc_dirty()
+        self._schedule_ui_refresh(obs)
+        self.status_bar.showMessage("Telescope removed")
 
     def show_telescopes_context_menu(self, position):
-        menu = QMenu(self)
-        add_action = QAction("Add Telescope", self)
-        add_action.triggered.connect(self.add_telescope)
-        menu.addAction(add_action)
-        
-        add_space_action = QAction("Add Space Telescope", self)
-        add_space_action.triggered.connect(self.add_space_telescope)
-        menu.addAction(add_space_action)
-        
-        insert_action = QAction("Insert Telescope", self)
-        insert_action.triggered.connect(self.insert_telescope)
-        menu.addAction(insert_action)
-        
-        edit_action = QAction("Edit Telescope", self)
-        edit_action.triggered.connect(self.edit_telescope)
-        menu.addAction(edit_action)
-        
-        remove_action = QAction("Remove Telescope", self)
-        remove_action.triggered.connect(self.remove_telescope)
-        menu.addAction(remove_action)
-        
-        menu.addSeparator()
-        
-        activate_action = QAction("Activate All", self)
-        activate_action.triggered.connect(self.activate_all_telescopes)
-        menu.addAction(activate_action)
-        
-        deactivate_action = QAction("Deactivate All", self)
-        deactivate_action.triggered.connect(self.deactivate_all_telescopes)
-        menu.addAction(deactivate_action)
-        
-        menu.popup(self.telescopes_table.viewport().mapToGlobal(position))
-        menu.aboutToHide.connect(menu.deleteLater)
-    
+        if self._telescopes_menu is None:
+            self._telescopes_menu = self._build_context_menu([
+                ("Add Telescope", self.add_telescope),
+                ("Add Space Telescope", self.add_space_telescope),
+                ("Insert Telescope", self.insert_telescope),
+                ("Edit Telescope", self.edit_telescope),
+                ("Remove Telescope", self.remove_telescope),
+                None,
+                ("Activate All", self.activate_all_telescopes),
+                ("Deactivate All", self.deactivate_all_telescopes),
+            ])
+        self._telescopes_menu.popup(self.telescopes_table.viewport().mapToGlobal(position))
+
     def activate_all_telescopes(self):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        for obs in self.manipulator.get_observations():
-            if obs.get_observation_code() == selected:
-                obs.get_telescopes().activate_all()
-                self.update_config_tables(obs)
-                self.update_obs_table()
-                self.status_bar.showMessage(f"All telescopes activated for '{selected}'")
-                break
+        selected = obs.get_observation_code()
+        obs.get_telescopes().activate_all()
+        obs.mark_activation_changed()
+        self._refresh_after_bulk_activation(self.telescopes_model, obs)
+        self.status_bar.showMessage(f"All telescopes activated for '{selected}'")
     
     def deactivate_all_telescopes(self):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        for obs in self.manipulator.get_observations():
-            if obs.get_observation_code() == selected:
-                obs.get_telescopes().deactivate_all()
-                self.update_config_tables(obs)
-                self.update_obs_table()
-                self.status_bar.showMessage(f"All telescopes deactivated for '{selected}'")
-                break
+        selected = obs.get_observation_code()
+        obs.get_telescopes().deactivate_all()
+        obs.mark_activation_changed()
+        self._refresh_after_bulk_activation(self.telescopes_model, obs)
+        self.status_bar.showMessage(f"All telescopes deactivated for '{selected}'")
+
+    def _reset_project_tree(self):
+        # Полная перестройка дерева нужна только при смене проекта (new/open)
+        self.project_tree.clear()
+        self._tree_root = None
+        self._tree_items = {}
+
+    def _sync_project_tree(self, observations: list):
+        """Reconcile project_tree children with the observations, reusing existing items"""
+        codes = [obs.get_observation_code() for obs in observations]
+        project_name = self.manipulator.get_project_name()
+        root = self._tree_root
+        if root is None:
+            root = QTreeWidgetItem([project_name])
+            self.project_tree.addTopLevelItem(root)
+            root.setExpanded(True)
+            self._tree_root = root
+        elif root.text(0) != project_name:
+            root.setText(0, project_name)
+        current = set(codes)
+        for code in [code for code in self._tree_items if code not in current]:
+            root.removeChild(self._tree_items.pop(code))
+        for i, (code, obs) in enumerate(zip(codes, observations)):
+            item = self._tree_items.get(code)
+            if item is None:
+                item = QTreeWidgetItem([code])
+                self._tree_items[code] = item
+                root.insertChild(i, item)
+            elif root.child(i) is not item:
+                root.insertChild(i, root.takeChild(root.indexOfChild(item)))
+            # Элемент хранит само наблюдение: выбор в дереве не ищет его по коду
+            if item.data(0, Qt.UserRole) is not obs:
+                item.setData(0, Qt.UserRole, obs)
+
+    def _rename_tree_item(self, old_code: str, new_code: str):
+        # Переименование меняет текст существующего элемента, дерево не перестраивается
+        item = self._tree_items.pop(old_code, None)
+        if item is not None:
+            item.setText(0, new_code)
+            self._tree_items[new_code] = item
 
     def update_project_tree(self):
-        self.project_tree.clear()
-        root = QTreeWidgetItem([self.manipulator.get_project_name()])
-        for obs in self.manipulator.get_observations():
-            QTreeWidgetItem(root, [obs.get_observation_code()])
-        self.project_tree.addTopLevelItem(root)
-        root.setExpanded(True)
-        self.obs_selector.blockSignals(True)
-        self.update_obs_table()
-        self.update_obs_selector()
-        self.obs_selector.blockSignals(False)
+        # obs_table и obs_selector обновляются отдельными разделами _schedule_ui_refresh
+        self._sync_project_tree(self._observations)
+
+    def _clear_canvas(self):
+        # Пустой график не перерисовывается; перерисовка откладывается до возврата в цикл событий
+        figure = self.canvas.figure
+        if not figure.axes and not figure.texts:
+            return
+        if any(cached is figure for _, cached in self._figure_cache.values()):
+            # Фигура из кэша не очищается, холсту отдается новая пустая
+            self._show_figure(plt.Figure())
+            return
+        figure.clear()
+        self.canvas.draw_idle()
+
+    def _show_figure(self, figure):
+        # Подмена фигуры холста: размер берется у текущей, чтобы не ждать resizeEvent
+        if figure is self.canvas.figure:
+            return
+        figure.set_size_inches(self.canvas.figure.get_size_inches(), forward=False)
+        figure.set_canvas(self.canvas)
+        self.canvas.figure = figure
+        self.canvas.draw_idle()
+
+    def _refresh_after_bulk_activation(self, model, obs: Observation):
+        # Меняются только флажки одной колонки и счетчики строки наблюдения
+        model.refresh_active_column()
+        self._refresh_obs_row(obs)
+
+    def _refresh_obs_row(self, obs: Observation):
+        # Пересчитывается только строка изменившегося наблюдения
+        if self._obs_summary_builders:
+            # Идущий подсчет мог прочитать наблюдение до изменения: пересчитываем таблицу целиком
+            self.update_obs_table()
+            return
+        row = self.get_observation_index(obs.get_observation_code())
+        if row != -1:
+            self.obs_model.refresh_row(row)
 
     def update_obs_table(self):
-        self.obs_table.setRowCount(0)
-        for i, obs in enumerate(self.manipulator.get_observations()):
-            self.obs_table.insertRow(i)
-            code_item = QTableWidgetItem(obs.get_observation_code())
-            code_item.setFlags(code_item.flags() & ~Qt.ItemIsEditable)
-            self.obs_table.setItem(i, 0, code_item)
-            type_item = QTableWidgetItem(obs.get_observation_type())
-            type_item.setFlags(type_item.flags() & ~Qt.ItemIsEditable)
-            self.obs_table.setItem(i, 1, type_item)
-            sources_item = QTableWidgetItem(f"{len(obs.get_sources().get_active_sources())} ({len(obs.get_sources().get_all_sources())})")
-            sources_item.setFlags(sources_item.flags() & ~Qt.ItemIsEditable)
-            self.obs_table.setItem(i, 2, sources_item)
-            telescopes_item = QTableWidgetItem(f"{len(obs.get_telescopes().get_active_telescopes())} ({len(obs.get_telescopes().get_all_telescopes())})")
-            telescopes_item.setFlags(telescopes_item.flags() & ~Qt.ItemIsEditable)
-            self.obs_table.setItem(i, 3, telescopes_item)
-            scans_item = QTableWidgetItem(f"{len(obs.get_scans().get_active_scans(obs))} ({len(obs.get_scans().get_all_scans())})")  # Передаем obs
-            scans_item.setFlags(scans_item.flags() & ~Qt.ItemIsEditable)
-            self.obs_table.setItem(i, 4, scans_item)
-            freqs_item = QTableWidgetItem(f"{len(obs.get_frequencies().get_active_frequencies())} ({len(obs.get_frequencies().get_all_IF())})")
-            freqs_item.setFlags(freqs_item.flags() & ~Qt.ItemIsEditable)
-            self.obs_table.setItem(i, 5, freqs_item)
-        
-        self.obs_table.resizeColumnsToContents()
-        self.obs_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.obs_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        self.obs_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.obs_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
-        self.obs_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.Stretch)
-        self.obs_table.horizontalHeader().setSectionResizeMode(5, QHeaderView.Stretch)
+        # Счетчики активных сканов требуют прохода по всем сканам каждого наблюдения:
+        # они считаются в QThreadPool, а модель получает готовые строки в GUI-потоке
+        self._obs_summary_generation += 1
+        builder = ObsSummaryBuilder(self._obs_summary_generation, self._observations)
+        builder.setAutoDelete(False)
+        builder.signals.finished.connect(self.on_obs_summaries_ready, Qt.QueuedConnection)
+        self._obs_summary_builders.append(builder)
+        QThreadPool.globalInstance().start(builder)
+
+    def on_obs_summaries_ready(self, generation: int, observations: list, display):
+        self._obs_summary_builders = [b for b in self._obs_summary_builders if b.generation != generation]
+        if generation != self._obs_summary_generation:
+            return  # после запуска таблица запрошена заново, ждём более свежий результат
+        with _frozen(self.obs_table):
+            self.obs_model.set_rows(observations, display)
+            if not self._obs_table_fitted and self.obs_model.rowCount():
+                self.obs_table.resizeColumnsToContents()
+                self._obs_table_fitted = True
 
     def update_obs_selector(self):
-        self.obs_selector.clear()
-        self.obs_selector.addItem("Select Observation...")
-        for obs in self.manipulator.get_observations():
-            self.obs_selector.addItem(obs.get_observation_code())
+        # Вставляются и удаляются только изменившиеся коды, текущий выбор сохраняется
+        # Элементы хранят сами наблюдения: обработчики берут currentData() без поиска по коду
+        _sync_combo_items(self.obs_selector, [obs.get_observation_code() for obs in self._observations])
+        _sync_combo_data(self.obs_selector, self._observations)
+        self._index_obs_selector()
+
+    def _refresh_obs_selector(self):
+        # Список наблюдений обновляется без сигналов, выбранное наблюдение сохраняется
+        current = self.obs_selector.currentText()
+        with QSignalBlocker(self.obs_selector):
+            self.update_obs_selector()
+            self.obs_selector.setCurrentIndex(self._obs_selector_index.get(current, 0))
 
     def on_obs_selected_from_combo(self, text):
         if text == "Select Observation...":
             self.obs_code_input.clear()
-            self.obs_type_combo.blockSignals(True)
-            self.obs_type_combo.setCurrentText("VLBI")
-            self.obs_type_combo.blockSignals(False)
-            self.sources_table.setRowCount(0)
-            self.telescopes_table.setRowCount(0)
-            self.frequencies_table.setRowCount(0)
-            self.scans_table.setRowCount(0)
+            with QSignalBlocker(self.obs_type_combo):
+                self.obs_type_combo.setCurrentText("VLBI")
+            for model in (self.sources_model, self.telescopes_model, self.frequencies_model, self.scans_model):
+                model.clear()
             self.calc_results_table.setRowCount(0)  # Очистка результатов Calculator
-            self.canvas.figure.clf()
-            self.canvas.draw()
+            self._clear_canvas()
             return
         obs = self.get_observation_by_code(text)
         if obs:
-            self.obs_code_input.blockSignals(True)
-            self.obs_type_combo.blockSignals(True)
-            self.obs_code_input.setText(obs.get_observation_code())
-            self.obs_type_combo.setCurrentText(obs.get_observation_type())
-            self.obs_code_input.blockSignals(False)
-            self.obs_type_combo.blockSignals(False)
-            self.update_config_tables(obs)
+            # Поля и таблицы заполняются программно: сигналы полей ввода не должны запускать повторное обновление
+            with QSignalBlocker(self.obs_code_input), QSignalBlocker(self.obs_type_combo):
+                self.obs_code_input.setText(obs.get_observation_code())
+                self.obs_type_combo.setCurrentText(obs.get_observation_type())
+                self.update_config_tables(obs)
             # Подгружаем только существующие данные
             if hasattr(obs, '_calculated_data') and obs._calculated_data:
                 self._plot_existing_data(obs)
             else:
-                self.canvas.figure.clf()
-                self.canvas.draw()
-            for i in range(self.project_tree.topLevelItem(0).childCount()):
-                child = self.project_tree.topLevelItem(0).child(i)
-                if child.text(0) == text:
-                    self.project_tree.setCurrentItem(child)
-                    break
+                self._clear_canvas()
+            item = self._tree_items.get(text)
+            if item is not None:
+                self.project_tree.setCurrentItem(item)
 
     def edit_source(self):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        row = self.sources_table.currentRow()
+        row = self.sources_table.currentIndex().row()
         if row == -1:
             self.status_bar.showMessage("Please select a source to edit")
             return
-        for obs in self.manipulator.get_observations():
-            if obs.get_observation_code() == selected:
-                source = obs.get_sources().get_all_sources()[row]
-                dialog = EditSourceDialog(source, self)
-                if dialog.exec():
-                    updated_source = dialog.get_updated_source()
-                    obs.get_sources().set_source(row, updated_source)
-                    self.update_config_tables(obs)
-                    self.update_obs_table()
-                    self.status_bar.showMessage(f"Source '{updated_source.get_name()}' updated")
-                break
+        source = obs.get_sources().get_all_sources()[row]
+        dialog = self._source_dialog(source)
+        if dialog.exec():
+            updated_source = dialog.get_updated_source()
+            obs.get_sources().set_source(row, updated_source)
+            obs.set_calc_dirty()
+            self._schedule_ui_refresh(obs)
+            self.status_bar.showMessage(f"Source '{updated_source.get_name()}' updated")
 
     def update_observation_code(self):
-        selected = self.obs_selector.currentText()
+        obs = self.obs_selector.currentData()
         text = self.obs_code_input.text()
-        if selected == "Select Observation..." or not text:
-            return
-        for obs in self.manipulator.get_observations():
-            if obs.get_observation_code() == selected:
-                self.manipulator._configurator.set_observation_code(obs, text)
-                self.update_project_tree()
-                self.obs_selector.blockSignals(True)
-                self.obs_selector.setCurrentText(text)
-                self.obs_selector.blockSignals(False)
-                self.status_bar.showMessage(f"Observation code updated to '{text}'")
-                break
+        if obs is None or not text or text == obs.get_observation_code():
+            return
+        selected = obs.get_observation_code()
+        self.manipulator._configurator.set_observation_code(obs, text)
+        self._rename_in_obs_index(selected, text)
+        self._rename_tree_item(selected, text)
+        with QSignalBlocker(self.obs_selector):
+            self.obs_selector.setItemText(self.obs_selector.currentIndex(), text)
+        self._index_obs_selector()
+        self._schedule_ui_refresh(sections=("tree", "obs"))
+        self.status_bar.showMessage(f"Observation code updated to '{text}'")
             
     def update_observation_type(self, obs_type):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             return
-        obs = self.get_observation_by_code(selected)
-        if obs:
+        selected = obs.get_observation_code()
+        type_changed = obs.get_observation_type() != obs_type
+        if type_changed:
             self.manipulator.configure_observation_type(obs, obs_type)
-            # Устанавливаем дефолтные поляризации, если текущие не подходят
-            default_pols = ["LL", "RR", "LR", "RL"] if obs_type == "VLBI" else ["RCP", "LCP"]
-            valid_pols = {"VLBI": ["LL", "RR", "LR", "RL"], "SINGLE_DISH": ["RCP", "LCP", "H", "V"]}
-            for freq in obs.get_frequencies().get_all_IF():
-                current_pols = freq.get_polarization()
-                # Если текущие поляризации пустые или не подходят для нового типа, устанавливаем дефолтные
-                if not current_pols or not all(p in valid_pols[obs_type] for p in current_pols):
+        # Устанавливаем дефолтные поляризации, если текущие не подходят
+        default_pols = _DEFAULT_POLS[obs_type]
+        valid_pols = _VALID_POLS[obs_type]
+        pols_changed = False
+        for freq in obs.get_frequencies().get_all_IF():
+            current_pols = freq.get_polarization()
+            # Если текущие поляризации пустые или не подходят для нового типа, устанавливаем дефолтные
+            if not current_pols or not valid_pols.issuperset(current_pols):
+                if current_pols != default_pols:
                     freq.set_polarization(default_pols)
-                    logger.info(f"Set default polarizations {default_pols} for frequency {freq.get_frequency()} MHz in '{selected}'")
-                else:
-                    logger.info(f"Kept existing polarizations {current_pols} for frequency {freq.get_frequency()} MHz in '{selected}'")
-            self.update_all_ui(selected)
-            self.status_bar.showMessage(f"Observation type set to '{obs_type}'")
-
-    def update_calc_obs_selector(self, selector: QComboBox) -> None:
+                    pols_changed = True
+                logger.info(f"Set default polarizations {default_pols} for frequency {freq.get_frequency()} MHz in '{selected}'")
+            else:
+                logger.info(f"Kept existing polarizations {current_pols} for frequency {freq.get_frequency()} MHz in '{selected}'")
+        if not type_changed and not pols_changed:
+            return  # ни тип, ни поляризации не изменились
+        obs.set_calc_dirty()
+        # Тип и поляризации видны только в obs_table и таблицах Configurator; дерево и селекторы не меняются
+        self._schedule_ui_refresh(obs)
+        self.status_bar.showMessage(f"Observation type set to '{obs_type}'")
+
+    def update_calc_obs_selector(self, selector: QComboBox, codes: Optional[list] = None) -> None:
         """Синхронизирует селектор наблюдений для вкладки Calculator."""
-        selector.clear()
-        selector.addItem("Select Observation...")
-        for obs in self.manipulator.get_observations():
-            selector.addItem(obs.get_observation_code())
+        if codes is None:
+            codes = [obs.get_observation_code() for obs in self._observations]
+        _sync_combo_items(selector, codes)
     
+    def on_calc_button_clicked(self):
+        self.run_calculations(self.calc_obs_selector.currentText())
+
     def run_calculations(self, obs_code: str) -> None:
         if obs_code == "Select Observation...":
             self.status_bar.showMessage("Please select an observation first")
@@ -962,189 +1150,107 @@ class PvCoreWindow(QMainWindow):
     
     def update_calc_results_table(self, obs: Observation) -> None:
         """Обновляет таблицу результатов на вкладке Calculator."""
-        self.calc_results_table.setRowCount(0)
         if not hasattr(obs, '_calculated_data') or not obs._calculated_data:
+            self.calc_results_table.setRowCount(0)
             return
-        
+
+        def shorten(text: str) -> str:
+            return text[:100] + "..." if len(text) > 100 else text
+
+        # Сначала собираются все строки, затем таблица получает нужное число строк одним setRowCount
+        rows = []
+        is_vlbi = obs.get_observation_type() == "VLBI"
         # Пример отображения некоторых параметров
         for scan_key, scan_data in obs._calculated_data.items():
-            row = self.calc_results_table.rowCount()
-            self.calc_results_table.insertRow(row)
-            self.calc_results_table.setItem(row, 0, QTableWidgetItem("Scan"))
-            self.calc_results_table.setItem(row, 1, QTableWidgetItem(scan_key))
-            self.calc_results_table.setItem(row, 2, QTableWidgetItem("Calculated"))
+            rows.append(("Scan", scan_key, "Calculated"))
 
             # Telescope Positions
-            row += 1
-            self.calc_results_table.insertRow(row)
             pos_str = "; ".join(f"{k}: {v}" for k, v in scan_data["telescope_positions"].items())
-            self.calc_results_table.setItem(row, 0, QTableWidgetItem("Telescope Positions"))
-            self.calc_results_table.setItem(row, 1, QTableWidgetItem("All Telescopes"))
-            self.calc_results_table.setItem(row, 2, QTableWidgetItem(pos_str[:100] + "..." if len(pos_str) > 100 else pos_str))
+            rows.append(("Telescope Positions", "All Telescopes", shorten(pos_str)))
 
             # UV Coverage (для VLBI)
-            if obs.get_observation_type() == "VLBI" and "uv_coverage" in scan_data:
-                row += 1
-                self.calc_results_table.insertRow(row)
+            if is_vlbi and "uv_coverage" in scan_data:
                 uv_str = "; ".join(f"{k}: {len(v)} points" for k, v in scan_data["uv_coverage"].items())
-                self.calc_results_table.setItem(row, 0, QTableWidgetItem("UV Coverage"))
-                self.calc_results_table.setItem(row, 1, QTableWidgetItem("Baselines"))
-                self.calc_results_table.setItem(row, 2, QTableWidgetItem(uv_str[:100] + "..." if len(uv_str) > 100 else uv_str))
+                rows.append(("UV Coverage", "Baselines", shorten(uv_str)))
 
             # Baseline Sensitivity (пример для всех частот)
             for key, value in scan_data.items():
                 if key.startswith("baseline_sensitivity_"):
-                    row += 1
-                    self.calc_results_table.insertRow(row)
                     # Обрабатываем значения None
                     sens_str = "; ".join(f"{k}: {v:.2e}" if v is not None else f"{k}: N/A" for k, v in value.items())
-                    self.calc_results_table.setItem(row, 0, QTableWidgetItem("Baseline Sensitivity"))
-                    self.calc_results_table.setItem(row, 1, QTableWidgetItem(key.split('_', 2)[-1] + " MHz"))
-                    self.calc_results_table.setItem(row, 2, QTableWidgetItem(sens_str[:100] + "..." if len(sens_str) > 100 else sens_str))
+                    rows.append(("Baseline Sensitivity", key.split('_', 2)[-1] + " MHz", shorten(sens_str)))
 
             # Telescope Sensitivity (добавим для полноты)
             for key, value in scan_data.items():
                 if key.startswith("telescope_sensitivity_"):
-                    row += 1
-                    self.calc_results_table.insertRow(row)
                     # Обрабатываем значения None
                     sens_str = "; ".join(f"{k}: {v:.2f}" if v is not None else f"{k}: N/A" for k, v in value.items())
-                    self.calc_results_table.setItem(row, 0, QTableWidgetItem("Telescope Sensitivity"))
-                    self.calc_results_table.setItem(row, 1, QTableWidgetItem(key.split('_', 2)[-1] + " MHz"))
-                    self.calc_results_table.setItem(row, 2, QTableWidgetItem(sens_str[:100] + "..." if len(sens_str) > 100 else sens_str))
-
+                    rows.append(("Telescope Sensitivity", key.split('_', 2)[-1] + " MHz", shorten(sens_str)))
+
+        table = self.calc_results_table
+        table.setRowCount(len(rows))
+        # Ячейки, оставшиеся от прошлого расчета, переиспользуются через setText
+        item_at, set_item = table.item, table.setItem
+        for row, values in enumerate(rows):
+            for col, text in enumerate(values):
+                item = item_at(row, col)
+                if item is None:
+                    set_item(row, col, QTableWidgetItem(text))
+                else:
+                    item.setText(text)
         self.calc_results_table.resizeColumnsToContents()
 
     def update_config_tables(self, obs: Observation):
-        self.sources_table.setRowCount(0)
-        self.sources_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.sources_table.setSelectionMode(QTableWidget.MultiSelection)
-        for src in obs.get_sources().get_all_sources():
-            row = self.sources_table.rowCount()
-            self.sources_table.insertRow(row)
-            for col, value in enumerate([
-                src.get_name(), src.get_name_J2000() or "", src.get_alt_name() or "",
-                self.format_ra(src.get_ra_degrees()), self.format_dec(src.get_dec_degrees())
-            ]):
-                item = QTableWidgetItem(value)
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                self.sources_table.setItem(row, col, item)
-            combo = QComboBox()
-            combo.addItems(["True", "False"])
-            combo.setCurrentText(str(src.isactive))
-            combo.currentTextChanged.connect(lambda state, s=src: self.on_source_is_active_changed(s, state))
-            self.sources_table.setCellWidget(row, 5, combo)
-        self.sources_table.resizeColumnsToContents()
-        self.sources_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-
-        self.telescopes_table.setRowCount(0)
-        self.telescopes_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.telescopes_table.setSelectionMode(QTableWidget.MultiSelection)
-        for tel in obs.get_telescopes().get_all_telescopes():
-            row = self.telescopes_table.rowCount()
-            self.telescopes_table.insertRow(row)
-            coords = tel.get_coordinates() if not isinstance(tel, SpaceTelescope) else [0, 0, 0]
-            for col, value in enumerate([
-                tel.get_code(), tel.get_name(),
-                f"{coords[0]:.2f}", f"{coords[1]:.2f}", f"{coords[2]:.2f}",
-                f"{tel.get_diameter():.2f}", tel.get_mount_type().value if isinstance(tel, Telescope) else "N/A"
-            ]):
-                item = QTableWidgetItem(value)
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                self.telescopes_table.setItem(row, col, item)
-            combo = QComboBox()
-            combo.addItems(["True", "False"])
-            combo.setCurrentText(str(tel.isactive))
-            combo.currentTextChanged.connect(lambda state, t=tel: self.on_telescope_is_active_changed(t, state))
-            self.telescopes_table.setCellWidget(row, 7, combo)
-        self.telescopes_table.resizeColumnsToContents()
-        self.telescopes_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-
-        self.frequencies_table.blockSignals(True)
-        self.frequencies_table.setRowCount(0)
-        self.frequencies_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.frequencies_table.setSelectionMode(QTableWidget.MultiSelection)
+        self._programmatic_update = True
+        try:
+            with _frozen(self.sources_table, self.telescopes_table, self.frequencies_table, self.scans_table):
+                all_sources = obs.get_sources().get_all_sources()
+                all_tels = obs.get_telescopes().get_all_telescopes()
+                all_freqs = obs.get_frequencies().get_all_IF()
+                all_scans = obs.get_scans().get_all_scans()
+                self.sources_model.set_rows(all_sources)
+                self.telescopes_model.set_rows(all_tels)
+                self.frequencies_model.set_rows(all_freqs)
+                self.scans_model.set_scans(all_scans, all_sources, all_tels, all_freqs)
+                # Текст ячеек и флажки Is Active отдаёт модель; ширина колонок задана режимом заголовка в __init__
+        finally:
+            self._programmatic_update = False
+
+    def _refresh_telescope_table(self, obs: Observation):
+        # Телескопы, добавленные в конец списка, не меняют индексов в сканах: остальные таблицы не трогаем
+        self._programmatic_update = True
+        try:
+            with _frozen(self.telescopes_table):
+                self.telescopes_model.set_rows(obs.get_telescopes().get_all_telescopes())
+        finally:
+            self._programmatic_update = False
 
-        for freq in obs.get_frequencies().get_all_IF():
-            row = self.frequencies_table.rowCount()
-            self.frequencies_table.insertRow(row)
-            freq_item = QTableWidgetItem(str(freq.get_frequency()))
-            freq_item.setFlags(freq_item.flags() | Qt.ItemIsEditable)
-            self.frequencies_table.setItem(row, 0, freq_item)
-            bw_item = QTableWidgetItem(str(freq.get_bandwidth()))
-            bw_item.setFlags(bw_item.flags() | Qt.ItemIsEditable)
-            self.frequencies_table.setItem(row, 1, bw_item)
-            pol_text = ", ".join(freq.get_polarization()) if freq.get_polarization() else "None"
-            pol_button = QPushButton(pol_text)
-            pol_button.clicked.connect(lambda _, f=freq: self.edit_polarizations(f))
-            self.frequencies_table.setCellWidget(row, 2, pol_button)
-            # Добавляем колонку Is Active
-            active_combo = QComboBox()
-            active_combo.addItems(["True", "False"])
-            active_combo.setCurrentText(str(freq.isactive))
-            active_combo.currentTextChanged.connect(lambda state, f=freq: self.on_frequency_is_active_changed(f, state))
-            self.frequencies_table.setCellWidget(row, 3, active_combo)
-
-        self.frequencies_table.resizeColumnsToContents()
-        self.frequencies_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.frequencies_table.blockSignals(False)
-
-        self.scans_table.setRowCount(0)
-        all_sources = obs.get_sources().get_all_sources()
-        all_tels = obs.get_telescopes().get_all_telescopes()
-        all_freqs = obs.get_frequencies().get_all_IF()
-        for scan in obs.get_scans().get_all_scans():  # Здесь не нужно менять, так как берем все сканы
-            row = self.scans_table.rowCount()
-            self.scans_table.insertRow(row)
-            start_dt = scan.get_start_datetime()
-            source_name = "None (OFF SOURCE)" if scan.is_off_source else (all_sources[scan.get_source_index()].get_name() if scan.get_source_index() is not None else "None")
-            telescopes_str = ", ".join(all_tels[idx].get_code() for idx in scan.get_telescope_indices())
-            frequencies_str = ", ".join(str(all_freqs[idx].get_frequency()) for idx in scan.get_frequency_indices())
-            for col, value in enumerate([
-                start_dt.strftime("%Y-%m-%d %H:%M:%S.%f")[:-4],
-                str(scan.get_duration()), source_name, telescopes_str, frequencies_str
-            ]):
-                item = QTableWidgetItem(value)
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                self.scans_table.setItem(row, col, item)
-            active_combo = QComboBox()
-            active_combo.addItems(["True", "False"])
-            active_combo.setCurrentText(str(scan.isactive))
-            active_combo.currentTextChanged.connect(lambda state, s=scan: self.on_scan_is_active_changed(s, state))
-            self.scans_table.setCellWidget(row, 5, active_combo)
-        self.scans_table.resizeColumnsToContents()
-        self.scans_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-    
     def edit_scan(self):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        row = self.scans_table.currentRow()
+        selected = obs.get_observation_code()
+        row = self.scans_table.currentIndex().row()
         if row == -1:
             self.status_bar.showMessage("Please select a scan to edit")
             return
-        obs = self.get_observation_by_code(selected)
-        if obs:
-            scan = obs.get_scans().get_scan(row)
-            dialog = EditScanDialog(scan=scan, 
-                                    sources=obs.get_sources().get_active_sources(), 
-                                    telescopes=obs.get_telescopes(), 
-                                    frequencies=obs.get_frequencies(), 
-                                    parent=self)
-            if dialog.exec():
-                updated_scan = dialog.get_updated_scan()
-                try:
-                    obs.get_scans().set_scan(updated_scan, row)
-                    self.update_config_tables(obs)
-                    self.update_obs_table()
-                    self.status_bar.showMessage(f"Updated scan starting at {updated_scan.get_start_datetime().strftime('%Y-%m-%d %H:%M:%S.%f')[:-4]} in '{selected}'")
-                except ValueError as e:
-                    logger.error(f"Failed to update scan: {e}")
-                    self.status_bar.showMessage(f"Error: {e}")
+        scan = obs.get_scans().get_scan(row)
+        dialog = self._scan_dialog(scan, obs)
+        if dialog.exec():
+            updated_scan = dialog.get_updated_scan()
+            try:
+                obs.get_scans().set_scan(updated_scan, row)
+                obs.set_calc_dirty()
+                self._schedule_ui_refresh(obs)
+                self.status_bar.showMessage(f"Updated scan starting at {format_scan_start(updated_scan.get_start_datetime())} in '{selected}'")
+            except ValueError as e:
+                logger.error(f"Failed to update scan: {e}")
+                self.status_bar.showMessage(f"Error: {e}")
 
-    def on_frequency_is_active_changed(self, freq: IF, state: str):
-        new_state = state == "True"
+    def on_frequency_is_active_changed(self, freq: IF, row: int, new_state: bool):
+        if self._programmatic_update:
+            return
         if new_state != freq.isactive:
             if new_state:
                 freq.activate()
@@ -1152,67 +1258,61 @@ class PvCoreWindow(QMainWindow):
             else:
                 freq.deactivate()
                 logger.info(f"Deactivated frequency {freq.get_frequency()} MHz")
-            selected = self.obs_selector.currentText()
-            if selected != "Select Observation...":
-                obs = self.get_observation_by_code(selected)
-                if obs:
-                    index = obs.get_frequencies().get_all_IF().index(freq)
-                    obs._sync_scans_with_activation("frequencies", index, new_state)
-                    self.update_config_tables(obs)
-                    self.update_obs_table()
+            obs = self.obs_selector.currentData()
+            if obs is not None:
+                # Строка модели совпадает с индексом IF: модель показывает тот же список
+                obs._sync_scans_with_activation("frequencies", row, new_state)
+                obs.mark_activation_changed()
+                self.scans_model.refresh_rows()
+                self._refresh_obs_row(obs)
     
+    def on_frequencies_double_clicked(self, index):
+        # Диалог поляризаций открывается по двойному щелчку на ячейке, без кнопки в каждой строке
+        if index.column() != FrequenciesTableModel.POLARIZATION_COLUMN:
+            return
+        freq_obj = self.frequencies_model.row_object(index.row())
+        if freq_obj is not None:
+            self.edit_polarizations(freq_obj)
+
     def edit_polarizations(self, freq_obj: IF):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        obs = self.get_observation_by_code(selected)
-        if not obs or freq_obj not in obs.get_frequencies().get_all_IF():
+        selected = obs.get_observation_code()
+        if freq_obj not in obs.get_frequencies().get_all_IF():
             return
-        dialog = PolarizationSelectorDialog(freq_obj.get_polarization(), obs.get_observation_type(), self)
+        dialog = self._polarization_dialog(freq_obj.get_polarization(), obs.get_observation_type())
         if dialog.exec():
             new_polarizations = dialog.get_selected_polarizations()
             freq_obj.set_polarization(new_polarizations)
             logger.info(f"Updated polarizations to {new_polarizations} for frequency {freq_obj.get_frequency()} MHz in '{selected}'")
-            self.update_config_tables(obs)
-            self.update_obs_table()
+            obs.set_calc_dirty()
+            self._schedule_ui_refresh(obs)
             self.status_bar.showMessage(f"Polarizations updated in '{selected}'")
 
     def show_context_menu(self, position):
-        menu = QMenu(self)
-        add_action = QAction("Add Observation", self)
-        add_action.triggered.connect(self.add_observation)
-        menu.addAction(add_action)
-        
-        insert_action = QAction("Insert Observation", self)
-        insert_action.triggered.connect(self.insert_observation)
-        menu.addAction(insert_action)
-        
-        remove_action = QAction("Remove Observation", self)
-        remove_action.triggered.connect(self.remove_observation)
-        menu.addAction(remove_action)
-        
-        menu.popup(self.project_tree.viewport().mapToGlobal(position))
+        if self._tree_menu is None:
+            self._tree_menu = self._build_context_menu([
+                ("Add Observation", self.add_observation),
+                ("Insert Observation", self.insert_observation),
+                ("Remove Observation", self.remove_observation),
+            ])
+        self._tree_menu.popup(self.project_tree.viewport().mapToGlobal(position))
 
     def show_obs_table_context_menu(self, position):
-        menu = QMenu(self)
-        add_action = QAction("Add Observation", self)
-        add_action.triggered.connect(self.add_observation)
-        menu.addAction(add_action)
-        
-        insert_action = QAction("Insert Observation", self)
-        insert_action.triggered.connect(self.insert_observation_from_table)
-        menu.addAction(insert_action)
-        
-        remove_action = QAction("Remove Observation", self)
-        remove_action.triggered.connect(self.remove_observation_from_table)
-        menu.addAction(remove_action)
-        
-        menu.popup(self.obs_table.viewport().mapToGlobal(position))
+        if self._obs_table_menu is None:
+            self._obs_table_menu = self._build_context_menu([
+                ("Add Observation", self.add_observation),
+                ("Insert Observation", self.insert_observation_from_table),
+                ("Remove Observation", self.remove_observation_from_table),
+            ])
+        self._obs_table_menu.popup(self.obs_table.viewport().mapToGlobal(position))
 
     def add_observation(self):
-        obs = Observation(observation_code=f"Obs{len(self.manipulator.get_observations())+1}", observation_type="VLBI")
+        obs = Observation(observation_code=f"Obs{len(self._observations)+1}", observation_type="VLBI")
         self.manipulator.add_observation(obs)
+        self._append_to_obs_index(obs)
         self.update_all_ui(obs.get_observation_code())
 
     def insert_observation(self):
@@ -1221,147 +1321,136 @@ class PvCoreWindow(QMainWindow):
             self.add_observation()
             return
         selected_code = selected[0].text(0)
-        observations = self.manipulator.get_observations()
-        index = next((i for i, obs in enumerate(observations) if obs.get_observation_code() == selected_code), -1)
+        index = self.get_observation_index(selected_code)
         if index == -1:
             self.add_observation()
             return
-        new_obs = Observation(observation_code=f"Obs{len(observations)+1}", observation_type="VLBI")
+        new_obs = Observation(observation_code=f"Obs{len(self._observations)+1}", observation_type="VLBI")
         self.manipulator.insert_observation(new_obs, index)
+        self._invalidate_obs_cache()
         self.update_all_ui(new_obs.get_observation_code())
 
     def insert_telescope(self):
-        if not self.manipulator.get_catalog_manager().telescope_catalog.get_all_telescopes():
+        self._ensure_catalogs_loaded("telescopes")
+        if not self._telescope_catalog.get_all_telescopes():
             logger.warning("Cannot insert telescope: telescopes catalog is not loaded")
             self.status_bar.showMessage("Cannot insert telescope: load telescopes catalog first")
             return
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        row = self.telescopes_table.currentRow()
-        dialog = TelescopeSelectorDialog(self.manipulator.get_catalog_manager().telescope_catalog, self)
+        selected = obs.get_observation_code()
+        row = self.telescopes_table.currentIndex().row()
+        dialog = self._telescope_selector()
         if dialog.exec():
             selected_telescopes = dialog.get_selected_telescopes()
             if not selected_telescopes:
                 self.status_bar.showMessage("No telescopes selected")
                 return
-            obs = self.get_observation_by_code(selected)
-            if obs:
-                initial_count = len(obs.get_telescopes().get_all_telescopes())
-                if row == -1:
-                    for telescope in selected_telescopes:
-                        self.manipulator.add_telescope_to_observation(obs, telescope)
-                else:
-                    for i, telescope in enumerate(selected_telescopes):
-                        self.manipulator.insert_telescope_to_observation(obs, telescope, row + i)
-                final_count = len(obs.get_telescopes().get_all_telescopes())
-                added_count = final_count - initial_count
-                if added_count > 0:
-                    self.update_config_tables(obs)
-                    self.update_obs_table()
-                    self.status_bar.showMessage(f"Inserted {added_count} telescope(s) into '{selected}'")
-                else:
-                    self.status_bar.showMessage(f"No new telescopes inserted into '{selected}' (duplicates skipped)")
+            if row == -1:
+                added_count = self.manipulator.add_telescopes_to_observation(obs, selected_telescopes)
+            else:
+                added_count = self.manipulator.insert_telescopes_to_observation(obs, selected_telescopes, row)
+            if added_count > 0:
+                self._schedule_ui_refresh(obs)
+                self.status_bar.showMessage(f"Inserted {added_count} telescope(s) into '{selected}'")
+            else:
+                self.status_bar.showMessage(f"No new telescopes inserted into '{selected}' (duplicates skipped)")
 
     def insert_observation_from_table(self):
-        row = self.obs_table.currentRow()
+        row = self.obs_table.currentIndex().row()
         if row == -1:
             self.add_observation()
             return
-        new_obs = Observation(observation_code=f"Obs{len(self.manipulator.get_observations())+1}", observation_type="VLBI")
+        new_obs = Observation(observation_code=f"Obs{len(self._observations)+1}", observation_type="VLBI")
         self.manipulator.insert_observation(new_obs, row)
-        self.update_project_tree()
+        self._invalidate_obs_cache()
+        self._schedule_ui_refresh(sections=("tree", "obs", "selector"))
 
     def remove_observation(self):
         selected = self.project_tree.selectedItems()
         if not selected or selected[0].text(0) == self.manipulator.get_project_name():
             return
         selected_code = selected[0].text(0)
-        observations = self.manipulator.get_observations()
-        index = next((i for i, obs in enumerate(observations) if obs.get_observation_code() == selected_code), -1)
+        index = self.get_observation_index(selected_code)
         if index != -1:
             self.manipulator.remove_observation(index)
+            self._invalidate_obs_cache()
             self.update_all_ui()
 
     def remove_observation_from_table(self):
-        row = self.obs_table.currentRow()
+        row = self.obs_table.currentIndex().row()
         if row != -1:
             self.manipulator.remove_observation(row)
-            self.update_project_tree()
+            self._invalidate_obs_cache()
+            self._schedule_ui_refresh(sections=("tree", "obs", "selector"))
 
     def update_project_name(self):
         text = self.project_name_input.text()
         if text:
             self.manipulator._project.set_name(text)
-            self.update_project_tree()
+            self._schedule_ui_refresh(sections=("tree",))
             self.status_bar.showMessage(f"Project name updated to '{text}'")
 
     def add_source(self):
-        if not self.manipulator.get_catalog_manager().source_catalog.get_all_sources():
+        self._ensure_catalogs_loaded("sources")
+        all_sources = self._source_catalog.get_all_sources()
+        if not all_sources:
             logger.warning("Cannot add source: sources catalog is not loaded")
             self.status_bar.showMessage("Cannot add source: load sources catalog first")
             return
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        dialog = SourceSelectorDialog(self.manipulator.get_catalog_manager().source_catalog.get_all_sources(), self)
+        selected = obs.get_observation_code()
+        dialog = SourceSelectorDialog(all_sources, self)
         if dialog.exec():
             selected_sources = dialog.get_selected_sources()
             if not selected_sources:
                 self.status_bar.showMessage("No sources selected")
                 return
-            obs = self.get_observation_by_code(selected)
-            if obs:
-                initial_source_count = len(obs.get_sources().get_active_sources())
-                for source in selected_sources:
-                    self.manipulator.add_source_to_observation(obs, source)
-                final_source_count = len(obs.get_sources().get_active_sources())
-                added_count = final_source_count - initial_source_count
-                if added_count > 0:
-                    self.update_all_ui(selected)
-                    self.status_bar.showMessage(f"Added {added_count} new source(s) to '{selected}'")
-                else:
-                    self.status_bar.showMessage(f"No new sources added to '{selected}' (duplicates skipped)")
+            added_count = self.manipulator.add_sources_to_observation(obs, selected_sources)
+            if added_count > 0:
+                self._schedule_ui_refresh(obs)
+                self.status_bar.showMessage(f"Added {added_count} new source(s) to '{selected}'")
+            else:
+                self.status_bar.showMessage(f"No new sources added to '{selected}' (duplicates skipped)")
 
     def insert_source(self):
-        if not self.manipulator.get_catalog_manager().source_catalog.get_all_sources():
+        self._ensure_catalogs_loaded("sources")
+        all_sources = self._source_catalog.get_all_sources()
+        if not all_sources:
             logger.warning("Cannot insert source: sources catalog is not loaded")
             self.status_bar.showMessage("Cannot insert source: load sources catalog first")
             return
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
+        selected = obs.get_observation_code()
         
-        row = self.sources_table.currentRow()
-        dialog = SourceSelectorDialog(self.manipulator.get_catalog_manager().source_catalog.get_all_sources(), self)
+        row = self.sources_table.currentIndex().row()
+        dialog = SourceSelectorDialog(all_sources, self)
         if dialog.exec():
             selected_sources = dialog.get_selected_sources()
             if not selected_sources:
                 self.status_bar.showMessage("No sources selected")
                 return
-            obs = self.get_observation_by_code(selected)
-            if obs:
-                initial_count = len(obs.get_sources().get_active_sources())
-                if row == -1:
-                    for source in selected_sources:
-                        self.manipulator.add_source_to_observation(obs, source)
-                else:
-                    for i, source in enumerate(selected_sources):
-                        self.manipulator.insert_source_to_observation(obs, source, row + i)
-                final_count = len(obs.get_sources().get_active_sources())
-                added_count = final_count - initial_count
-                if added_count > 0:
-                    self.update_config_tables(obs)
-                    self.update_obs_table()
-                    self.status_bar.showMessage(f"Inserted {added_count} new source(s) into '{selected}'")
-                else:
-                    self.status_bar.showMessage(f"No new sources inserted into '{selected}' (duplicates skipped)")
+            if row == -1:
+                added_count = self.manipulator.add_sources_to_observation(obs, selected_sources)
+            else:
+                added_count = self.manipulator.insert_sources_to_observation(obs, selected_sources, row)
+            if added_count > 0:
+                self._schedule_ui_refresh(obs)
+                self.status_bar.showMessage(f"Inserted {added_count} new source(s) into '{selected}'")
+            else:
+                self.status_bar.showMessage(f"No new sources inserted into '{selected}' (duplicates skipped)")
 
-    def on_source_is_active_changed(self, source: Source, state: str):
-        new_state = state == "True"
+    def on_source_is_active_changed(self, source: Source, row: int, new_state: bool):
+        if self._programmatic_update:
+            return
         if new_state != source.isactive:
             if new_state:
                 source.activate()
@@ -1369,17 +1458,17 @@ class PvCoreWindow(QMainWindow):
             else:
                 source.deactivate()
                 logger.info(f"Deactivated source '{source.get_name()}'")
-            selected = self.obs_selector.currentText()
-            if selected != "Select Observation...":
-                obs = self.get_observation_by_code(selected)
-                if obs:
-                    index = obs.get_sources().get_all_sources().index(source)
-                    obs._sync_scans_with_activation("sources", index, new_state)
-                    self.update_config_tables(obs)
-                    self.update_obs_table()
-
-    def on_telescope_is_active_changed(self, telescope: Union[Telescope, SpaceTelescope], state: str):
-        new_state = state == "True"
+            obs = self.obs_selector.currentData()
+            if obs is not None:
+                obs._sync_scans_with_activation("sources", row, new_state)
+                obs.mark_activation_changed()
+                # Меняются только флажок, сканы и счетчики одной строки obs_table
+                self.scans_model.refresh_rows()
+                self._refresh_obs_row(obs)
+
+    def on_telescope_is_active_changed(self, telescope: Union[Telescope, SpaceTelescope], row: int, new_state: bool):
+        if self._programmatic_update:
+            return
         if new_state != telescope.isactive:
             if new_state:
                 telescope.activate()
@@ -1387,112 +1476,81 @@ class PvCoreWindow(QMainWindow):
             else:
                 telescope.deactivate()
                 logger.info(f"Deactivated telescope '{telescope.get_code()}'")
-            selected = self.obs_selector.currentText()
-            if selected != "Select Observation...":
-                obs = self.get_observation_by_code(selected)
-                if obs:
-                    # Находим индекс телескопа
-                    index = obs.get_telescopes().get_all_telescopes().index(telescope)
-                    obs._sync_scans_with_activation("telescopes", index, new_state)
-                    self.update_config_tables(obs)
-                    self.update_obs_table()
+            obs = self.obs_selector.currentData()
+            if obs is not None:
+                obs._sync_scans_with_activation("telescopes", row, new_state)
+                obs.mark_activation_changed()
+                self.scans_model.refresh_rows()
+                self._refresh_obs_row(obs)
 
     def show_sources_table_context_menu(self, position):
-        menu = QMenu(self)
-        add_action = QAction("Add Source", self)
-        add_action.triggered.connect(self.add_source)
-        menu.addAction(add_action)
-        
-        insert_action = QAction("Insert Source", self)
-        insert_action.triggered.connect(self.insert_source)
-        menu.addAction(insert_action)
-        
-        edit_action = QAction("Edit Source", self)
-        edit_action.triggered.connect(self.edit_source)
-        menu.addAction(edit_action)
-        
-        remove_action = QAction("Remove Source", self)
-        remove_action.triggered.connect(self.remove_source)
-        menu.addAction(remove_action)
-        
-        menu.addSeparator()
-        
-        activate_action = QAction("Activate All", self)
-        activate_action.triggered.connect(self.activate_all_sources)
-        menu.addAction(activate_action)
-        
-        deactivate_action = QAction("Deactivate All", self)
-        deactivate_action.triggered.connect(self.deactivate_all_sources)
-        menu.addAction(deactivate_action)
-        
-        menu.popup(self.sources_table.viewport().mapToGlobal(position))
+        if self._sources_menu is None:
+            self._sources_menu = self._build_context_menu([
+                ("Add Source", self.add_source),
+                ("Insert Source", self.insert_source),
+                ("Edit Source", self.edit_source),
+                ("Remove Source", self.remove_source),
+                None,
+                ("Activate All", self.activate_all_sources),
+                ("Deactivate All", self.deactivate_all_sources),
+            ])
+        self._sources_menu.popup(self.sources_table.viewport().mapToGlobal(position))
 
     def activate_all_sources(self):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        for obs in self.manipulator.get_observations():
-            if obs.get_observation_code() == selected:
-                obs.get_sources().activate_all()
-                self.update_config_tables(obs)
-                self.update_obs_table()
-                self.status_bar.showMessage(f"All sources activated for '{selected}'")
-                break
+        selected = obs.get_observation_code()
+        obs.get_sources().activate_all()
+        obs.mark_activation_changed()
+        self._refresh_after_bulk_activation(self.sources_model, obs)
+        self.status_bar.showMessage(f"All sources activated for '{selected}'")
     
     def deactivate_all_sources(self):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        for obs in self.manipulator.get_observations():
-            if obs.get_observation_code() == selected:
-                obs.get_sources().deactivate_all()
-                self.update_config_tables(obs)
-                self.update_obs_table()
-                self.status_bar.showMessage(f"All sources deactivated for '{selected}'")
-                break
+        selected = obs.get_observation_code()
+        obs.get_sources().deactivate_all()
+        obs.mark_activation_changed()
+        self._refresh_after_bulk_activation(self.sources_model, obs)
+        self.status_bar.showMessage(f"All sources deactivated for '{selected}'")
 
     def add_telescope(self):
-        if not self.manipulator.get_catalog_manager().telescope_catalog.get_all_telescopes():
+        self._ensure_catalogs_loaded("telescopes")
+        if not self._telescope_catalog.get_all_telescopes():
             logger.warning("Cannot add telescope: telescopes catalog is not loaded")
             self.status_bar.showMessage("Cannot add telescope: load telescopes catalog first")
             return
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        dialog = TelescopeSelectorDialog(self.manipulator.get_catalog_manager().telescope_catalog, self)
+        selected = obs.get_observation_code()
+        dialog = self._telescope_selector()
         if dialog.exec():
             selected_telescopes = dialog.get_selected_telescopes()
             if not selected_telescopes:
                 self.status_bar.showMessage("No telescopes selected")
                 return
-            obs = self.get_observation_by_code(selected)
-            if obs:
-                initial_telescope_count = len(obs.get_telescopes().get_all_telescopes())
-                for telescope in selected_telescopes:
-                    try:
-                        self.manipulator.add_telescope_to_observation(obs, telescope)
-                    except ValueError as e:
-                        self.status_bar.showMessage(str(e))
-                        continue
-                final_telescope_count = len(obs.get_telescopes().get_all_telescopes())
-                added_count = final_telescope_count - initial_telescope_count
-                if added_count > 0:
-                    self.update_all_ui(selected)
-                    self.status_bar.showMessage(f"Added {added_count} telescope(s) to '{selected}'")
-                else:
-                    self.status_bar.showMessage(f"No new telescopes added to '{selected}' (duplicates skipped)")
+            added_count = self.manipulator.add_telescopes_to_observation(obs, selected_telescopes)
+            if added_count > 0:
+                self._schedule_ui_refresh(obs, sections=("telescopes", "obs"))
+                self.status_bar.showMessage(f"Added {added_count} telescope(s) to '{selected}'")
+            else:
+                self.status_bar.showMessage(f"No new telescopes added to '{selected}' (duplicates skipped)")
 
     def add_space_telescope(self):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
+        selected = obs.get_observation_code()
         # Создаём SpaceTelescope с пустым orbit_file
         default_space_telescope = SpaceTelescope(
-            code=f"ST{len(self.manipulator.get_observations())}",
+            code=f"ST{len(self._observations)}",
             name="New Space Telescope",
             orbit_file="",  # Пустой файл орбиты, пользователь задаст позже
             diameter=1.0
@@ -1500,77 +1558,57 @@ class PvCoreWindow(QMainWindow):
         dialog = EditTelescopeDialog(default_space_telescope, self)
         if dialog.exec():
             new_space_telescope = dialog.get_updated_telescope()
-            obs = self.get_observation_by_code(selected)
-            if obs:
-                try:
-                    self.manipulator.add_telescope_to_observation(obs, new_space_telescope)
-                    self.update_all_ui(selected)
-                    self.status_bar.showMessage(f"Added space telescope '{new_space_telescope.get_code()}' to '{selected}'")
-                except ValueError as e:
-                    self.status_bar.showMessage(str(e))
+            try:
+                self.manipulator.add_telescope_to_observation(obs, new_space_telescope)
+                obs.set_calc_dirty()
+                self._schedule_ui_refresh(obs, sections=("telescopes", "obs"))
+                self.status_bar.showMessage(f"Added space telescope '{new_space_telescope.get_code()}' to '{selected}'")
+            except ValueError as e:
+                self.status_bar.showMessage(str(e))
 
     def add_scan(self):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        obs = self.get_observation_by_code(selected)
-        if not obs:
-            return
-        if not (obs.get_sources().get_active_sources() and obs.get_telescopes().get_active_telescopes() and obs.get_frequencies().get_active_frequencies()):
+        selected = obs.get_observation_code()
+        if not (obs.get_sources().any_active() and obs.get_telescopes().any_active() and obs.get_frequencies().any_active()):
             logger.warning(f"Cannot add scan to '{selected}': missing active sources, telescopes, or frequencies")
             self.status_bar.showMessage("Cannot add scan: observation requires active sources, telescopes, and frequencies")
             return
         
-        dialog = EditScanDialog(sources=obs.get_sources().get_active_sources(), 
-                                telescopes=obs.get_telescopes(), 
-                                frequencies=obs.get_frequencies(), 
-                                parent=self)
+        dialog = self._scan_dialog(None, obs)
         if dialog.exec():
             new_scan = dialog.get_updated_scan()
             try:
                 self.manipulator.add_scan_to_observation(obs, new_scan)
-                self.update_config_tables(obs)
-                self.update_obs_table()
-                self.status_bar.showMessage(f"Added scan starting at {new_scan.get_start_datetime().strftime('%Y-%m-%d %H:%M:%S.%f')[:-4]} to '{selected}'")
+                obs.set_calc_dirty()
+                self._schedule_ui_refresh(obs)
+                self.status_bar.showMessage(f"Added scan starting at {format_scan_start(new_scan.get_start_datetime())} to '{selected}'")
             except ValueError as e:
                 logger.error(f"Failed to add scan: {e}")
                 self.status_bar.showMessage(f"Error: {e}")
 
     def add_frequency(self):
-        selected = self.obs_selector.currentText()
-        if selected == "Select Observation...":
+        obs = self.obs_selector.currentData()
+        if obs is None:
             self.status_bar.showMessage("Please select an observation first")
             return
-        obs = self.get_observation_by_code(selected)
-        if not obs:
-            self.status_bar.showMessage("Observation not found")
-            return
+        selected = obs.get_observation_code()
         
         # Параметры новой частоты
         bandwidth = 16.0
         default_pol = ["LL"] if obs.get_observation_type() == "VLBI" else ["RCP"]
         
-        # Получаем существующие частоты и сортируем их
-        existing_freqs = obs.get_frequencies().get_all_IF()
-        ranges = [(f.get_frequency(), f.get_frequency() + f.get_bandwidth()) 
-                for f in existing_freqs]
-        ranges.sort()  # Сортируем по нижней границе диапазона
-        
         # Ищем свободную частоту, начиная с 1000.0 МГц
-        new_freq = 1000.0
-        step = bandwidth  # Шаг равен ширине полосы для минимизации пересечений
-        if ranges:
-            for lower, upper in ranges:
-                if new_freq + bandwidth / 2 <= lower:  # Если новый диапазон помещается перед текущим
-                    break
-                new_freq = upper + step  # Перескакиваем за верхнюю границу текущего диапазона
+        new_freq = obs.get_frequencies().find_free_frequency(bandwidth, start=1000.0)
         
         # Создаём объект IF и добавляем его
         if_obj = IF(freq=new_freq, bandwidth=bandwidth, polarization=default_pol)
         try:
             self.manipulator.add_frequency_to_observation(obs, if_obj)
-            self.update_all_ui(selected)
+            obs.set_calc_dirty()
+            self._schedule_ui_refresh(obs)
             self.status_bar.showMessage(f"Added frequency {new_freq} MHz to '{selected}'")
         except ValueError as e:
             logger.warning(f"Failed to add frequency {new_freq} MHz to '{selected}': {e}")
@@ -1579,14 +1617,12 @@ class PvCoreWindow(QMainWindow):
     def _plot_existing_data(self, obs: Observation) -> None:
         """Plot existing calculated data for the selected observation."""
         if not hasattr(obs, '_calculated_data') or not obs._calculated_data:
-            self.canvas.figure.clf()
-            self.canvas.draw()
+            self._clear_canvas()
             return
         
         # Синхронизируем селекторы на вкладке Vizualizator
-        self.viz_obs_selector.blockSignals(True)
-        self.viz_obs_selector.setCurrentText(obs.get_observation_code())
-        self.viz_obs_selector.blockSignals(False)
+        with QSignalBlocker(self.viz_obs_selector):
+            self.viz_obs_selector.setCurrentText(obs.get_observation_code())
         
         # Обновляем список сканирований
         self.update_scan_selector()
@@ -1610,9 +1646,8 @@ class PvCoreWindow(QMainWindow):
                 if available_plots:
                     break
             if available_plots:
-                self.plot_type_selector.blockSignals(True)
-                self.plot_type_selector.setCurrentText(available_plots[0])
-                self.plot_type_selector.blockSignals(False)
+                with QSignalBlocker(self.plot_type_selector):
+                    self.plot_type_selector.setCurrentText(available_plots[0])
         
         # Обновляем график
         self.refresh_plot()
@@ -1624,19 +1659,36 @@ class PvCoreWindow(QMainWindow):
         scan_key = self.scan_selector.currentText() if self.scan_selector.currentText() != "All Scans" else None
 
         if obs_code == "Select Observation..." or plot_type == "Select Plot Type...":
-            self.canvas.figure.clf()
-            self.canvas.draw()
+            self._clear_canvas()
             return
 
         obs = self.get_observation_by_code(obs_code)
         if not obs:
             return
 
-        if not hasattr(obs, '_calculated_data') or not obs._calculated_data:
+        if obs.is_calc_dirty() or not obs._calculated_data:
             self.calculator.calculate_all(obs)
-
-        self.canvas.figure.clf()  # Очищаем текущий график
-        scan_data = obs.get_calculated_data().get(scan_key, {}) if scan_key else obs._calculated_data[next(iter(obs._calculated_data))]
+            obs.set_calc_dirty(False)
+
+        if not scan_key:
+            scan_key = next(iter(obs._calculated_data))
+        # Каждый график (наблюдение, тип, скан) хранится в своей фигуре: переключение между
+        # уже показанными графиками не перестраивает оси и artists
+        cache_key = (obs_code, plot_type, scan_key)
+        validity = (obs, obs.get_calc_version())
+        cached = self._figure_cache.get(cache_key)
+        if cached is not None and cached[0] == validity:
+            # Результаты не менялись с последней отрисовки: показываем готовую фигуру
+            self._figure_cache.move_to_end(cache_key)
+            self._show_figure(cached[1])
+            return
+        figure = plt.Figure()
+        self._show_figure(figure)
+        self._figure_cache[cache_key] = (validity, figure)
+        self._figure_cache.move_to_end(cache_key)
+        while len(self._figure_cache) > self._figure_cache_size:
+            self._figure_cache.popitem(last=False)
+        scan_data = obs._calculated_data.get(scan_key, {})
 
         if plot_type == "uv_coverage" and "uv_coverage" in scan_data:
             self.manipulator.vizualizator.plot_uv_coverage(obs, "uv_coverage", self.canvas)
@@ -1645,7 +1697,7 @@ class PvCoreWindow(QMainWindow):
         elif plot_type == "beam_pattern" and "beam_pattern" in scan_data:
             self.manipulator.vizualizator.plot_beam_pattern(obs, "beam_pattern", self.canvas)
         elif plot_type == "field_of_view" and "field_of_view" in scan_data:
-            self.manipulator.vizualizator.plot_field_of_view(obs, scan_key or next(iter(obs._calculated_data)), scan_data["field_of_view"], self.canvas)
+            self.manipulator.vizualizator.plot_field_of_view(obs, scan_key, scan_data["field_of_view"], self.canvas)
         elif plot_type == "telescope_sensitivity":
             for key, value in scan_data.items():
                 if key.startswith("telescope_sensitivity_"):
@@ -1661,23 +1713,48 @@ class PvCoreWindow(QMainWindow):
 
     def new_project(self):
         self.manipulator.set_project(Project("DefaultProject"))
-        self.canvas.figure.clf()
-        self.canvas.draw()
+        self._invalidate_obs_cache()
+        self._reset_project_tree()
+        self._figure_cache.clear()
+        self._clear_canvas()
         self.current_project_file = None
         self.project_name_input.setText(self.manipulator.get_project_name())
         self.update_all_ui()
 
     def save_project(self):
         if self.current_project_file:
-            try:
-                self.manipulator.save_project(self.current_project_file)
-                self.status_bar.showMessage(f"Project saved to '{self.current_project_file}'")
-            except Exception as e:
-                logger.error(f"Failed to save project: {e}")
-                self.status_bar.showMessage("Failed to save project")
+            self._start_project_save(self.current_project_file)
         else:
             self.save_project_as()
 
+    def _start_project_save(self, filepath: str):
+        if self._project_saver is not None:
+            self.status_bar.showMessage("Project is still being saved, please wait")
+            return
+        # Снимок проекта делается в GUI-потоке, сериализация и запись на диск - в QThreadPool
+        try:
+            data = self.manipulator.get_project().to_dict()
+        except (TypeError, ValueError) as e:
+            logger.error(f"Failed to serialize project: {e}")
+            self.status_bar.showMessage("Failed to save project")
+            return
+        saver = ProjectSaver(data, filepath)
+        saver.setAutoDelete(False)
+        saver.signals.finished.connect(self.on_project_saved)
+        saver.signals.failed.connect(self.on_project_save_failed)
+        self._project_saver = saver
+        QThreadPool.globalInstance().start(saver)
+        self.status_bar.showMessage(f"Saving project to '{filepath}'...")
+
+    def on_project_saved(self, filepath: str):
+        self._project_saver = None
+        self.current_project_file = filepath
+        self.status_bar.showMessage(f"Project saved to '{filepath}'")
+
+    def on_project_save_failed(self, filepath: str, error: str):
+        self._project_saver = None
+        self.status_bar.showMessage("Failed to save project")
+
     def save_project_as(self):
         project_name = self.manipulator.get_project_name()
         if not project_name:
@@ -1686,85 +1763,82 @@ class PvCoreWindow(QMainWindow):
         default_filepath = f"{project_name}.json"
         filepath, _ = QFileDialog.getSaveFileName(self, "Save Project As", default_filepath, "JSON Files (*.json)")
         if filepath:
-            try:
-                self.manipulator.save_project(filepath)
-                self.current_project_file = filepath
-                self.status_bar.showMessage(f"Project saved as '{filepath}'")
-            except Exception as e:
-                logger.error(f"Failed to save project: {e}")
-                self.status_bar.showMessage("Failed to save project")
+            self._start_project_save(filepath)
     
-    def load_project(self, filepath: str) -> None:
-        import json
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            self._project = Project.from_dict(data)
-            # Проверка целостности
-            for obs in self._project.get_observations():
-                if not obs.validate():
-                    logger.error(f"Observation '{obs.get_observation_code()}' failed validation after loading")
-                    raise ValueError(f"Observation '{obs.get_observation_code()}' is invalid")
-            logger.info(f"Project loaded from '{filepath}'")
-        except FileNotFoundError:
-            logger.error(f"Project file '{filepath}' not found")
-            raise FileNotFoundError(f"Project file '{filepath}' not found!")
-        except json.JSONDecodeError as e:
-            logger.error(f"Error decoding JSON from '{filepath}': {e}")
-            raise ValueError(f"Invalid JSON in '{filepath}': {e}")
-        except ValueError as e:
-            logger.error(f"Validation error during project load: {e}")
-            raise
-
     def open_project(self):
+        if self._project_loader is not None:
+            self.status_bar.showMessage("Project is still loading, please wait")
+            return
         filepath, _ = QFileDialog.getOpenFileName(self, "Open Project", "", "JSON Files (*.json)")
         if filepath:
-            try:
-                self.manipulator.load_project(filepath)
-                self.current_project_file = filepath
-                self.project_name_input.setText(self.manipulator.get_project_name())
-                self.canvas.figure.clf()
-                self.canvas.draw()
-                observations = self.manipulator.get_observations()
-                selected_obs_code = observations[0].get_observation_code() if observations else None
-                self.update_all_ui(selected_obs_code)
-                if self.tabs.count() > 2:  # Calculator tab exists
-                    self.update_calc_obs_selector(self.calc_obs_selector)  # Use instance variable
-                    if selected_obs_code:
-                        self.calc_obs_selector.setCurrentText(selected_obs_code)
-                self.status_bar.showMessage(f"Project loaded from '{filepath}'")
-            except (FileNotFoundError, ValueError) as e:
-                logger.error(f"Failed to load project: {e}")
-                self.status_bar.showMessage(f"Failed to load project: {str(e)}")
+            # Чтение и разбор JSON выполняются в QThreadPool, окно продолжает перерисовываться
+            loader = ProjectLoader(filepath)
+            loader.setAutoDelete(False)
+            loader.signals.finished.connect(self.on_project_loaded)
+            loader.signals.failed.connect(self.on_project_load_failed)
+            self._project_loader = loader
+            self.open_project_action.setEnabled(False)
+            QThreadPool.globalInstance().start(loader)
+            self.status_bar.showMessage(f"Loading project '{filepath}'...")
+
+    def on_project_loaded(self, project: Project, filepath: str):
+        self._project_loader = None
+        self.open_project_action.setEnabled(True)
+        self.manipulator.set_project(project)
+        self._invalidate_obs_cache()
+        self._reset_project_tree()
+        self._figure_cache.clear()
+        self.current_project_file = filepath
+        self.project_name_input.setText(self.manipulator.get_project_name())
+        self._clear_canvas()
+        observations = self._observations
+        selected_obs_code = observations[0].get_observation_code() if observations else None
+        self.update_all_ui(selected_obs_code)
+        if self.tabs.count() > 2:  # Calculator tab exists
+            self.update_calc_obs_selector(self.calc_obs_selector)  # Use instance variable
+            if selected_obs_code:
+                self.calc_obs_selector.setCurrentText(selected_obs_code)
+        self.status_bar.showMessage(f"Project loaded from '{filepath}'")
+
+    def on_project_load_failed(self, filepath: str, error: str):
+        # Текущий проект не меняется, пока новый не загружен полностью
+        self._project_loader = None
+        self.open_project_action.setEnabled(True)
+        logger.error(f"Failed to load project: {error}")
+        self.status_bar.showMessage(f"Failed to load project: {error}")
 
     def show_about_dialog(self):
         dialog = AboutDialog(self)
         dialog.exec()
 
     def on_project_item_selected(self):
-        selected = self.project_tree.selectedItems()
-        if not selected:
+        item = self.project_tree.currentItem()
+        if item is None or not item.isSelected():
             return
-        selected_item = selected[0].text(0)
-        if selected_item == self.manipulator.get_project_name():
+        selected_item = item.text(0)
+        if item is self._tree_root:
             self.update_all_ui()
             self.obs_selector.setCurrentIndex(0)
             self.obs_code_input.clear()
-            self.canvas.figure.clf()
-            self.canvas.draw()
+            self._clear_canvas()
             self.status_bar.showMessage("Selected Project: " + selected_item)
         else:
-            obs = self.get_observation_by_code(selected_item)
+            obs = item.data(0, Qt.UserRole)
             if obs:
-                self.obs_selector.setCurrentText(selected_item)
+                idx = self._obs_selector_index.get(selected_item, -1)
+                if idx >= 0:
+                    # Сигналы блокируем: таблицы и график обновляются ниже
+                    with QSignalBlocker(self.obs_selector):
+                        self.obs_selector.setCurrentIndex(idx)
+                with QSignalBlocker(self.obs_type_combo):
+                    self.obs_type_combo.setCurrentText(obs.get_observation_type())
                 self.obs_code_input.setText(obs.get_observation_code())
                 self.update_config_tables(obs)
                 # Убираем автоматический refresh_plot, подгружаем только существующие данные
                 if hasattr(obs, '_calculated_data') and obs._calculated_data:
                     self._plot_existing_data(obs)
                 else:
-                    self.canvas.figure.clf()
-                    self.canvas.draw()
+                    self._clear_canvas()
                 self.status_bar.showMessage("Selected Observation: " + selected_item)
 
     def load_settings(self):
@@ -1774,74 +1848,119 @@ class PvCoreWindow(QMainWindow):
                 "telescopes": "catalogs/telescopes.dat"
             }
         }
+        self._settings_hash = None
         if not os.path.exists(self.settings_file):
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(default_settings, f, indent=4)
             self.settings = default_settings
+            self.save_settings()
             logger.info("Created default settings file")
         else:
             try:
                 with open(self.settings_file, 'r', encoding='utf-8') as f:
                     self.settings = json.load(f)
+                self._settings_hash = hash(json.dumps(self.settings, sort_keys=True))
                 logger.info("Loaded settings from file")
             except (json.JSONDecodeError, FileNotFoundError) as e:
                 logger.error(f"Error loading settings: {e}. Using defaults.")
                 self.settings = default_settings
-                with open(self.settings_file, 'w', encoding='utf-8') as f:
-                    json.dump(default_settings, f, indent=4)
+                self.save_settings()
 
     def save_settings(self):
+        settings_hash = hash(json.dumps(self.settings, sort_keys=True))
+        if settings_hash == self._settings_hash:
+            logger.debug("Settings unchanged, skipping save")
+            return
+        tmp_file = self.settings_file + ".tmp"
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
+            # Пишем во временный файл и атомарно подменяем, чтобы не повредить настройки при сбое
+            with open(tmp_file, 'w', encoding='utf-8') as f:
                 json.dump(self.settings, f, indent=4)
+            os.replace(tmp_file, self.settings_file)
+            self._settings_hash = settings_hash
             logger.info("Settings saved")
         except Exception as e:
             logger.error(f"Error saving settings: {e}")
 
     def load_catalogs(self):
-        sources_path = self.settings["catalogs"]["sources"]
-        telescopes_path = self.settings["catalogs"]["telescopes"]
-        self.manipulator.load_catalogs(sources_path, telescopes_path)
+        self._ensure_catalogs_loaded("sources", "telescopes")
+
+    def _ensure_catalogs_loaded(self, *catalog_types: str):
+        """Parse the given catalogs from the configured paths on first use"""
+        for catalog_type in catalog_types:
+            if catalog_type in self._loaded_catalogs:
+                continue
+            path = self.settings["catalogs"][catalog_type]
+            try:
+                if catalog_type == "sources":
+                    self._cm.load_source_catalog(path)
+                else:
+                    self._cm.load_telescope_catalog(path)
+            except (FileNotFoundError, ValueError) as e:
+                logger.error(f"Failed to load {catalog_type} catalog '{path}': {e}")
+                continue
+            self._loaded_catalogs.add(catalog_type)
+        self._bind_catalogs()
+
+    def _bind_catalogs(self):
+        # CatalogManager заменяет объекты каталогов при загрузке, поэтому перепривязываем ссылки
+        self._source_catalog = self._cm.source_catalog
+        self._telescope_catalog = self._cm.telescope_catalog
 
     def show_catalog_settings(self):
+        if self._catalog_loaders:
+            self.status_bar.showMessage("Catalogs are still loading, please wait")
+            return
         dialog = CatalogSettingsDialog(self.settings, self)
         if dialog.exec():
             new_paths = dialog.get_paths()
-            old_sources = self.manipulator.get_catalog_manager().source_catalog.get_all_sources()
-            old_telescopes = self.manipulator.get_catalog_manager().telescope_catalog.get_all_telescopes()
-            success = True
-            if new_paths["sources"] != self.settings["catalogs"]["sources"]:
-                try:
-                    self.manipulator.get_catalog_manager().load_source_catalog(new_paths["sources"])
-                    logger.info(f"Updated sources catalog to '{new_paths['sources']}'")
-                except (FileNotFoundError, ValueError) as e:
-                    logger.error(f"Failed to load new sources catalog: {e}")
-                    self.manipulator.get_catalog_manager().source_catalog = Sources(old_sources)
-                    success = False
-            if new_paths["telescopes"] != self.settings["catalogs"]["telescopes"]:
-                try:
-                    self.manipulator.get_catalog_manager().load_telescope_catalog(new_paths["telescopes"])
-                    logger.info(f"Updated telescopes catalog to '{new_paths['telescopes']}'")
-                except (FileNotFoundError, ValueError) as e:
-                    logger.error(f"Failed to load new telescopes catalog: {e}")
-                    self.manipulator.get_catalog_manager().telescope_catalog = Telescopes(old_telescopes)
-                    success = False
-            if success:
-                self.settings["catalogs"] = new_paths
-                self.save_settings()
+            changed = [(catalog_type, new_paths[catalog_type]) for catalog_type in ("sources", "telescopes")
+                       if new_paths[catalog_type] != self.settings["catalogs"][catalog_type]]
+            if not changed:
                 self.status_bar.showMessage("Catalogs updated successfully")
-            else:
-                self.status_bar.showMessage("Failed to update some catalogs; keeping old settings")
+                return
+            self._catalog_load_paths = new_paths
+            self._catalog_load_failed = False
+            self.set_catalogs_action.setEnabled(False)
+            for catalog_type, path in changed:
+                loader = CatalogLoader(self._cm, catalog_type, path)
+                loader.setAutoDelete(False)
+                loader.signals.finished.connect(self.on_catalog_loaded)
+                loader.signals.failed.connect(self.on_catalog_load_failed)
+                self._catalog_loaders.append(loader)
+                QThreadPool.globalInstance().start(loader)
+            self.status_bar.showMessage("Loading catalogs...")
+
+    def on_catalog_loaded(self, catalog_type: str, path: str):
+        logger.info(f"Updated {catalog_type} catalog to '{path}'")
+        self._loaded_catalogs.add(catalog_type)
+        self._bind_catalogs()
+        self._finish_catalog_load(catalog_type)
+
+    def on_catalog_load_failed(self, catalog_type: str, path: str, error: str):
+        # При ошибке CatalogManager оставляет прежний каталог без изменений
+        logger.error(f"Failed to load new {catalog_type} catalog: {error}")
+        self._catalog_load_failed = True
+        self._finish_catalog_load(catalog_type)
+
+    def _finish_catalog_load(self, catalog_type: str):
+        self._catalog_loaders = [l for l in self._catalog_loaders if l.catalog_type != catalog_type]
+        if self._catalog_loaders:
+            return
+        self.set_catalogs_action.setEnabled(True)
+        if not self._catalog_load_failed:
+            self.settings["catalogs"] = self._catalog_load_paths
+            self.save_settings()
+            self.status_bar.showMessage("Catalogs updated successfully")
+        else:
+            self.status_bar.showMessage("Failed to update some catalogs; keeping old settings")
+        self._catalog_load_paths = None
 
     def show_source_catalog_browser(self):
-        sources = self.manipulator.get_catalog_manager().source_catalog.get_all_sources()
-        dialog = CatalogBrowserDialog("Source", sources, self)
-        dialog.exec()
+        self._ensure_catalogs_loaded("sources")
+        self._catalog_browser("Source", self._source_catalog).exec()
 
     def show_telescope_catalog_browser(self):
-        telescopes = self.manipulator.get_catalog_manager().telescope_catalog.get_all_telescopes()
-        dialog = CatalogBrowserDialog("Telescope", telescopes, self)
-        dialog.exec()
+        self._ensure_catalogs_loaded("telescopes")
+        self._catalog_browser("Telescope", self._telescope_catalog).exec()
 
     def closeEvent(self, event: QCloseEvent):
         self.save_settings()
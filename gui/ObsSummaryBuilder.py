@@ -0,0 +1,26 @@
+# gui/ObsSummaryBuilder.py
+from PySide6.QtCore import QObject, QRunnable, Signal
+from gui.TableModels import ObsRow
+from utils.logging_setup import logger
+
+class ObsSummaryBuilderSignals(QObject):
+    finished = Signal(int, object, object)  # generation, observations, display rows
+
+class ObsSummaryBuilder(QRunnable):
+    """Compute obs table rows (active counts over all scans) in a QThreadPool worker"""
+
+    def __init__(self, generation: int, observations: list):
+        super().__init__()
+        self.generation = generation
+        self.observations = list(observations)
+        self.signals = ObsSummaryBuilderSignals()
+
+    def run(self):
+        # Наблюдения только читаются; если GUI изменил их во время подсчета, результат
+        # этого поколения отбрасывается, а следующее обновление таблицы запустит новый подсчет
+        try:
+            display = [ObsRow.from_observation(obs).display() for obs in self.observations]
+        except (IndexError, ValueError) as e:
+            logger.error(f"Failed to build obs table rows: {e}")
+            display = None
+        self.signals.finished.emit(self.generation, self.observations, display)
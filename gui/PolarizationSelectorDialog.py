@@ -1,37 +1,54 @@
 # gui/PolarizationSelectorDialog.py
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QCheckBox, QPushButton, QLabel
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QSignalBlocker
 from utils.logging_setup import logger
 from typing import List, Optional
 
 class PolarizationSelectorDialog(QDialog):
+    VALID_POLARIZATIONS = {"VLBI": ["LL", "RR", "RL", "LR"], "SINGLE_DISH": ["RCP", "LCP", "H", "V"]}
+
     def __init__(self, current_polarizations: List[str], observation_type: str, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Select Polarizations")
-        self.observation_type = observation_type
-        self.selected_polarizations = current_polarizations.copy()
-        
+
         layout = QVBoxLayout(self)
-        
-        if observation_type == "VLBI":
-            self.valid_polarizations = ["LL", "RR", "RL", "LR"]
-            layout.addWidget(QLabel("Select one or more polarizations (VLBI):"))
-        else:  # SINGLE_DISH
-            self.valid_polarizations = ["RCP", "LCP", "H", "V"]
-            layout.addWidget(QLabel("Select one or both from RCP, LCP or H, V (SINGLE_DISH):"))
+        self.hint_label = QLabel()
+        layout.addWidget(self.hint_label)
 
-        self.checkboxes = {}
-        for pol in self.valid_polarizations:
-            cb = QCheckBox(pol)
-            cb.setChecked(pol in current_polarizations)
-            cb.stateChanged.connect(self.on_checkbox_changed)
-            self.checkboxes[pol] = cb
-            layout.addWidget(cb)
+        # Флажки создаются для обоих типов наблюдений один раз, load показывает нужные
+        self._all_checkboxes = {}
+        for pols in self.VALID_POLARIZATIONS.values():
+            for pol in pols:
+                cb = QCheckBox(pol)
+                cb.stateChanged.connect(self.on_checkbox_changed)
+                self._all_checkboxes[pol] = cb
+                layout.addWidget(cb)
 
         self.ok_button = QPushButton("OK")
         self.ok_button.clicked.connect(self.accept)
         layout.addWidget(self.ok_button)
 
+        self.load(current_polarizations, observation_type)
+
+    def load(self, current_polarizations: List[str], observation_type: str):
+        """Reset the checkboxes for another frequency without rebuilding the dialog"""
+        self.observation_type = observation_type
+        if observation_type == "VLBI":
+            self.valid_polarizations = self.VALID_POLARIZATIONS["VLBI"]
+            self.hint_label.setText("Select one or more polarizations (VLBI):")
+        else:  # SINGLE_DISH
+            self.valid_polarizations = self.VALID_POLARIZATIONS["SINGLE_DISH"]
+            self.hint_label.setText("Select one or both from RCP, LCP or H, V (SINGLE_DISH):")
+
+        self.checkboxes = {}
+        for pol, cb in self._all_checkboxes.items():
+            valid = pol in self.valid_polarizations
+            cb.setVisible(valid)
+            with QSignalBlocker(cb):
+                cb.setChecked(valid and pol in current_polarizations)
+            if valid:
+                self.checkboxes[pol] = cb
+        self.selected_polarizations = current_polarizations.copy()
         self.update_ok_button_state()
 
     def on_checkbox_changed(self, state):
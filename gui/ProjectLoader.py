@@ -0,0 +1,43 @@
+# gui/ProjectLoader.py
+import json
+import orjson
+from PySide6.QtCore import QObject, QRunnable, Signal
+from base.project import Project
+from utils.logging_setup import logger
+
+class ProjectLoaderSignals(QObject):
+    finished = Signal(object, str)   # загруженный Project, path
+    failed = Signal(str, str)        # path, error message
+
+class ProjectLoader(QRunnable):
+    """Read, parse and validate a project file in a QThreadPool worker"""
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self.signals = ProjectLoaderSignals()
+
+    def run(self):
+        # Project собирается целиком в рабочем потоке, в GUI-поток передается готовый объект
+        try:
+            # Файл читается байтами и разбирается orjson без отдельного шага декодирования текста
+            with open(self.path, 'rb') as f:
+                data = orjson.loads(f.read())
+            project = Project.from_dict(data)
+            for obs in project.get_observations():
+                if not obs.validate():
+                    raise ValueError(f"Observation '{obs.get_observation_code()}' is invalid")
+        except FileNotFoundError:
+            logger.error(f"Project file '{self.path}' not found")
+            self.signals.failed.emit(self.path, f"Project file '{self.path}' not found!")
+            return
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError наследует json.JSONDecodeError
+            logger.error(f"Error decoding JSON from '{self.path}': {e}")
+            self.signals.failed.emit(self.path, f"Invalid JSON in '{self.path}': {e}")
+            return
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error(f"Failed to build project from '{self.path}': {e}")
+            self.signals.failed.emit(self.path, str(e))
+            return
+        logger.info(f"Project loaded from '{self.path}'")
+        self.signals.finished.emit(project, self.path)
@@ -0,0 +1,39 @@
+# gui/ProjectSaver.py
+import os
+import orjson
+from PySide6.QtCore import QObject, QRunnable, Signal
+from utils.logging_setup import logger
+
+class ProjectSaverSignals(QObject):
+    finished = Signal(str)       # path
+    failed = Signal(str, str)    # path, error message
+
+class ProjectSaver(QRunnable):
+    """Serialize and write a project snapshot in a QThreadPool worker"""
+
+    def __init__(self, data: dict, path: str):
+        super().__init__()
+        self.data = data  # Project.to_dict(), снятый в GUI-потоке до запуска
+        self.path = path
+        self.signals = ProjectSaverSignals()
+
+    def run(self):
+        tmp_path = self.path + ".tmp"
+        try:
+            payload = orjson.dumps(self.data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                                   | orjson.OPT_SERIALIZE_NUMPY)
+            # Пишем во временный файл и атомарно подменяем, чтобы сбой не обрезал файл проекта
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+        except (OSError, TypeError) as e:
+            logger.error(f"Failed to save project to '{self.path}': {e}")
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            self.signals.failed.emit(self.path, str(e))
+            return
+        logger.info(f"Project saved to '{self.path}'")
+        self.signals.finished.emit(self.path)
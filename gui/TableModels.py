@@ -0,0 +1,401 @@
+# gui/TableModels.py
+from dataclasses import dataclass
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+from base.observation import Observation
+from base.telescopes import Telescope, SpaceTelescope
+from utils.formatting import format_scan_start
+from utils.logging_setup import logger
+
+
+class BaseTableModel(QAbstractTableModel):
+    """Read-only table model over a snapshot of container rows"""
+    HEADERS: tuple = ()
+    ACTIVE_COLUMN = None  # колонка Is Active отображается флажком (CheckStateRole)
+
+    activeToggled = Signal(object, int, bool)  # row object, row index, new active state
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def set_rows(self, rows) -> None:
+        # Снимок списка: контейнеры возвращают _data по ссылке, а модель должна
+        # менять число строк только между begin*/end* уведомлениями.
+        # Новый список сверяется со старым по идентичности объектов: общий префикс
+        # обновляется через dataChanged, в конец добавляются или удаляются только лишние строки,
+        # полный сброс модели нужен только при перестановках и вставках в середину
+        rows = list(rows)
+        old_count, new_count = len(self._rows), len(rows)
+        same = self._common_prefix(rows)
+        if same == old_count == new_count:
+            self._update_rows_in_place(rows)
+            return
+        if same == old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._assign_rows(rows)
+            self.endInsertRows()
+        elif same == new_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            self._assign_rows(rows)
+            self.endRemoveRows()
+        else:
+            self.beginResetModel()
+            self._assign_rows(rows)
+            self.endResetModel()
+            return
+        if same:
+            self.refresh_rows(0, same - 1)
+
+    def _common_prefix(self, rows) -> int:
+        same = 0
+        for old, new in zip(self._rows, rows):
+            if old is not new:
+                break
+            same += 1
+        return same
+
+    def _assign_rows(self, rows) -> None:
+        self._rows = rows
+
+    def _update_rows_in_place(self, rows) -> None:
+        self._assign_rows(rows)
+        self.refresh_rows()
+
+    def clear(self) -> None:
+        self.set_rows([])
+
+    def row_object(self, row: int):
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == self.ACTIVE_COLUMN:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        if index.column() == self.ACTIVE_COLUMN:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if self._rows[index.row()].isactive else Qt.Unchecked
+            return None
+        if role != Qt.DisplayRole:
+            return None
+        return self.display_text(self._rows[index.row()], index.column())
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        # Флажок Is Active не меняет объект сам: активацию и синхронизацию сканов выполняет слот activeToggled
+        if role != Qt.CheckStateRole or not index.isValid() or index.column() != self.ACTIVE_COLUMN:
+            return False
+        if index.row() >= len(self._rows):
+            return False
+        self.activeToggled.emit(self._rows[index.row()], index.row(), Qt.CheckState(value) == Qt.Checked)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def display_text(self, obj, column: int) -> str:
+        raise NotImplementedError
+
+    def refresh_active_column(self) -> None:
+        """Notify views that the Is Active flags of all rows changed (activate/deactivate all)"""
+        if self.ACTIVE_COLUMN is None or not self.rowCount():
+            return
+        self.dataChanged.emit(self.index(0, self.ACTIVE_COLUMN), self.index(self.rowCount() - 1, self.ACTIVE_COLUMN),
+                              [Qt.CheckStateRole])
+
+    def refresh_rows(self, first: int = 0, last: int = None) -> None:
+        """Notify views that rows [first, last] changed in place"""
+        if not self.rowCount():
+            return
+        last = self.rowCount() - 1 if last is None else last
+        self.dataChanged.emit(self.index(first, 0), self.index(last, self.columnCount() - 1),
+                              [Qt.DisplayRole, Qt.CheckStateRole])
+
+
+@dataclass
+class ObsRow:
+    """Summary of one observation for the obs table, computed once per refresh"""
+    code: str
+    obs_type: str
+    src_active: int
+    src_total: int
+    tel_active: int
+    tel_total: int
+    freq_active: int
+    freq_total: int
+    scn_active: int
+    scn_total: int
+
+    @classmethod
+    def from_observation(cls, obs: Observation) -> 'ObsRow':
+        sources = obs.get_sources()
+        telescopes = obs.get_telescopes()
+        frequencies = obs.get_frequencies()
+        scans = obs.get_scans()
+        return cls(obs.get_observation_code(), obs.get_observation_type(),
+                   sources.get_active_count(), len(sources),
+                   telescopes.get_active_count(), len(telescopes),
+                   frequencies.get_active_count(), len(frequencies),
+                   len(scans.get_active_scans(obs)), len(scans))
+
+    def display(self) -> tuple:
+        # Порядок совпадает с ObsTableModel.HEADERS: ... Frequencies, Scans
+        return (self.code, self.obs_type,
+                f"{self.src_active} ({self.src_total})",
+                f"{self.tel_active} ({self.tel_total})",
+                f"{self.freq_active} ({self.freq_total})",
+                f"{self.scn_active} ({self.scn_total})")
+
+
+class ObsTableModel(BaseTableModel):
+    HEADERS = ("Code", "Type", "Sources", "Telescopes", "Frequencies", "Scans")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._display = []
+        self._prepared = None  # строки, заранее подсчитанные ObsSummaryBuilder
+
+    def set_rows(self, rows, display=None) -> None:
+        """Replace rows; display may carry ObsRow.display() tuples already computed for rows"""
+        self._prepared = display
+        try:
+            super().set_rows(rows)
+        finally:
+            self._prepared = None
+
+    def _assign_rows(self, rows) -> None:
+        self._rows = rows
+        if self._prepared is not None and len(self._prepared) == len(rows):
+            self._display = list(self._prepared)
+        else:
+            self._display = [ObsRow.from_observation(obs).display() for obs in rows]
+
+    def _update_rows_in_place(self, rows) -> None:
+        # Уведомляются только строки, у которых изменился отображаемый текст
+        old_display = self._display
+        self._assign_rows(rows)
+        last_col = len(self.HEADERS) - 1
+        for row, (old, new) in enumerate(zip(old_display, self._display)):
+            if old != new:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_col), [Qt.DisplayRole])
+
+    def refresh_row(self, row: int) -> None:
+        """Recompute one observation row and notify views only if its text changed"""
+        if not 0 <= row < len(self._rows):
+            return
+        display = ObsRow.from_observation(self._rows[row]).display()
+        if display != self._display[row]:
+            self._display[row] = display
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1), [Qt.DisplayRole])
+
+    def display_text(self, obs: Observation, column: int) -> str:
+        return ObsRow.from_observation(obs).display()[column]
+
+    def data(self, index, role=Qt.DisplayRole):
+        # Строки таблицы готовятся в set_rows, при отрисовке только читаются
+        if role != Qt.DisplayRole or not index.isValid() or index.row() >= len(self._display):
+            return None
+        return self._display[index.row()][index.column()]
+
+
+class SourcesTableModel(BaseTableModel):
+    HEADERS = ("Name", "Name (J2000)", "Alt. Name", "RA", "Dec", "Is Active")
+    ACTIVE_COLUMN = 5
+
+    def display_text(self, src, column: int) -> str:
+        if column == 0:
+            return src.get_name()
+        if column == 1:
+            return src.get_name_J2000() or ""
+        if column == 2:
+            return src.get_alt_name() or ""
+        if column == 3:
+            return src.get_ra_str()
+        if column == 4:
+            return src.get_dec_str()
+        return None
+
+
+class TelescopesTableModel(BaseTableModel):
+    HEADERS = ("Code", "Name", "X (m)", "Y (m)", "Z (m)", "Diameter (m)", "Mount Type", "Is Active")
+    ACTIVE_COLUMN = 7
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._coord_strs = []  # строки X/Y/Z для каждой строки, готовятся при заполнении модели
+
+    @staticmethod
+    def _format_coordinates(tel) -> tuple:
+        coords = tel.get_coordinates() if not isinstance(tel, SpaceTelescope) else (0, 0, 0)
+        return tuple(f"{c:.2f}" for c in coords)
+
+    def _assign_rows(self, rows) -> None:
+        self._rows = rows
+        self._coord_strs = [self._format_coordinates(tel) for tel in rows]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid() and 2 <= index.column() <= 4 \
+                and index.row() < len(self._coord_strs):
+            return self._coord_strs[index.row()][index.column() - 2]
+        return super().data(index, role)
+
+    def display_text(self, tel, column: int) -> str:
+        if column == 0:
+            return tel.get_code()
+        if column == 1:
+            return tel.get_name()
+        if 2 <= column <= 4:
+            return self._format_coordinates(tel)[column - 2]
+        if column == 5:
+            return f"{tel.get_diameter():.2f}"
+        if column == 6:
+            return tel.get_mount_type().value if isinstance(tel, Telescope) else "N/A"
+        return None
+
+
+class FrequenciesTableModel(BaseTableModel):
+    """Frequencies table; frequency and bandwidth are edited in place"""
+    HEADERS = ("Frequency (MHz)", "Bandwidth (MHz)", "Polarizations", "Is Active")
+    POLARIZATION_COLUMN = 2
+    ACTIVE_COLUMN = 3
+
+    frequencyEdited = Signal(int, int)  # row, column
+    editFailed = Signal(str)            # error message
+
+    def display_text(self, freq, column: int) -> str:
+        if column == 0:
+            return str(freq.get_frequency())
+        if column == 1:
+            return str(freq.get_bandwidth())
+        if column == 2:
+            return ", ".join(freq.get_polarization()) if freq.get_polarization() else "None"
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.EditRole and index.isValid() and index.column() in (0, 1):
+            return self.display_text(self._rows[index.row()], index.column())
+        return super().data(index, role)
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() in (0, 1):
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    @staticmethod
+    def _parse_positive(value, name: str) -> float:
+        """Convert edited text to a positive float without touching the IF"""
+        try:
+            number = float(str(value).strip())
+        except ValueError:
+            raise ValueError(f"{name} must be a number, got '{value}'")
+        if number <= 0:
+            raise ValueError(f"{name} must be positive")
+        return number
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        if role == Qt.CheckStateRole:
+            return super().setData(index, value, role)
+        if role != Qt.EditRole or not index.isValid() or index.column() not in (0, 1):
+            return False
+        row, col = index.row(), index.column()
+        if row >= len(self._rows):
+            return False
+        freq_obj = self._rows[row]
+        # Значение проверяется до изменения IF: при ошибке IF не меняется и откатывать нечего,
+        # а представление само перечитывает прежнее значение из модели
+        try:
+            new_value = self._parse_positive(value, "Frequency" if col == 0 else "Bandwidth")
+        except ValueError as e:
+            logger.error(f"Invalid input for frequency at row {row}, col {col}: {e}")
+            self.editFailed.emit(str(e))
+            return False
+        old_value = freq_obj.get_frequency() if col == 0 else freq_obj.get_bandwidth()
+        if new_value == old_value:
+            return True  # редактор закрыт без изменений: обновление таблиц не требуется
+        if col == 0:
+            freq_obj.set_frequency(new_value)
+        else:
+            freq_obj.set_bandwidth(new_value)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        self.frequencyEdited.emit(row, col)
+        return True
+
+
+class ScansTableModel(BaseTableModel):
+    """Scans table; rows are exposed to the view in batches via fetchMore"""
+    HEADERS = ("Start", "Duration", "Source", "Telescopes", "Frequencies", "Is Active")
+    ACTIVE_COLUMN = 5
+    FETCH_BATCH = 100
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._source_names = []
+        self._tel_codes = []
+        self._freq_strs = []
+        self._loaded = 0  # число строк, уже показанных представлению
+
+    def set_rows(self, rows) -> None:
+        rows = list(rows)
+        if len(rows) == len(self._rows) and self._common_prefix(rows) == len(rows):
+            self._update_rows_in_place(rows)  # уже подгруженные строки остаются на месте
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self._loaded = min(len(self._rows), self.FETCH_BATCH)
+        self.endResetModel()
+
+    def set_scans(self, scans, sources, telescopes, frequencies) -> None:
+        # Имена источников, коды телескопов и частоты готовятся один раз: строки сканов
+        # собираются по индексам из простых списков строк
+        self._source_names = [src.get_name() for src in sources]
+        self._tel_codes = [tel.get_code() for tel in telescopes]
+        self._freq_strs = [str(freq.get_frequency()) for freq in frequencies]
+        self.set_rows(scans)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        count = min(len(self._rows) - self._loaded, self.FETCH_BATCH)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def display_text(self, scan, column: int) -> str:
+        if column == 0:
+            return format_scan_start(scan.get_start_datetime())
+        if column == 1:
+            return str(scan.get_duration())
+        if column == 2:
+            if scan.is_off_source:
+                return "None (OFF SOURCE)"
+            source_index = scan.get_source_index()
+            return self._source_names[source_index] if source_index is not None else "None"
+        if column == 3:
+            tel_codes = self._tel_codes
+            return ", ".join([tel_codes[idx] for idx in scan.get_telescope_indices()])
+        if column == 4:
+            freq_strs = self._freq_strs
+            return ", ".join([freq_strs[idx] for idx in scan.get_frequency_indices()])
+        return None
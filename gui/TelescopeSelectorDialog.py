@@ -6,6 +6,7 @@ class TelescopeSelectorDialog(QDialog):
     def __init__(self, telescopes, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Select Telescopes")
+        self.catalog = telescopes
         self.telescopes = telescopes.get_all_telescopes()  # Предполагается, что это Telescopes объект
         self.selected_telescopes = []
         self.init_ui()
@@ -49,6 +50,12 @@ class TelescopeSelectorDialog(QDialog):
         self.setLayout(layout)
         self.setMinimumSize(600, 400)
 
+    def reset(self):
+        """Clear search and selection before the dialog is shown again"""
+        self.search_input.clear()
+        self.table.clearSelection()
+        self.selected_telescopes = []
+
     def filter_table(self, text):
         text = text.lower()
         for row in range(self.table.rowCount()):
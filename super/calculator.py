@@ -7,15 +7,43 @@ from base.scans import Scan
 from base.observation import Observation
 from base.project import Project
 from utils.logging_setup import logger
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, TYPE_CHECKING
 import numpy as np
 from astropy.time import Time
-from astropy.coordinates import ITRS, GCRS, CartesianRepresentation, SkyCoord, AltAz, get_sun, HADec
 import astropy.units as u
-from concurrent.futures import ThreadPoolExecutor
 from scipy.special import j1
-import threading
+from functools import lru_cache
+from datetime import datetime
 import math
+import hashlib
+
+if TYPE_CHECKING:
+    from astropy.coordinates import SkyCoord  # astropy.coordinates импортируется лениво в методах
+
+
+@lru_cache(maxsize=4096)
+def _itrs_to_gcrs_matrix(jd1: float, jd2: float, scale: str) -> np.ndarray:
+    """ITRS -> GCRS rotation matrix at one time, shared by all telescopes observing at that time"""
+    from astropy.coordinates import ITRS, GCRS, CartesianRepresentation
+    time = Time(jd1, jd2, format='jd', scale=scale)
+    gcrs = ITRS(CartesianRepresentation(np.eye(3), unit=u.m), obstime=time).transform_to(GCRS(obstime=time))
+    matrix = gcrs.cartesian.xyz.value
+    matrix.flags.writeable = False  # значение из кэша не должно меняться вызывающим кодом
+    return matrix
+
+
+@lru_cache(maxsize=2048)
+def _scan_time_grid(start: datetime, duration: float, time_step: float) -> Time:
+    """Time grid of a scan, shared by all calculations with the same start, duration and step.
+    The returned Time comes from the cache and must not be modified in place"""
+    return np.arange(0, duration, time_step) * u.s + Time(start)
+
+
+@lru_cache(maxsize=1024)
+def _source_skycoord(ra_deg: float, dec_deg: float) -> 'SkyCoord':
+    """ICRS SkyCoord of a source, built once per (ra, dec) instead of per scan and timestamp"""
+    from astropy.coordinates import SkyCoord
+    return SkyCoord(ra=ra_deg * u.deg, dec=dec_deg * u.deg, frame='icrs')
 
 
 class Calculator(ABC):
@@ -23,9 +51,16 @@ class Calculator(ABC):
     def __init__(self, manipulator: 'Manipulator'):
         """Initialize the Calculator"""
         self._manipulator = manipulator
-        self._lock = threading.Lock()
         logger.info("Initialized Calculator")
 
+    @staticmethod
+    def _attributes_key(attributes: Dict[str, Any], **resolved: Any) -> str:
+        """Hash of the calculation parameters used to validate cached results.
+        resolved holds parameters with defaults already applied, so omitted and explicit defaults match"""
+        params = {k: v for k, v in attributes.items() if k not in ("type", "recalculate", "store_key")}
+        params.update(resolved)
+        return hashlib.blake2b(repr(sorted(params.items())).encode(), digest_size=8).hexdigest()
+
     def _calculate_telescope_positions(self, obj: Observation | Project, attributes: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate telescope positions in J2000 for all scans in the observation or project"""
         try:
@@ -52,27 +87,21 @@ class Calculator(ABC):
                 logger.warning(f"No active scans in observation '{obj.get_observation_code()}'")
                 return {}
 
+            attr_key = self._attributes_key(attributes, time_step=time_step)
             existing_data = obj.get_calculated_data_by_key(store_key)
-            if existing_data and not recalculate and existing_data["metadata"]["time_step"] == time_step:
+            if existing_data and not recalculate and existing_data["metadata"].get("attr_key") == attr_key:
                 logger.info(f"Using cached telescope positions for '{obj.get_observation_code()}'")
                 return existing_data["data"]
 
             results = {}
-            with ThreadPoolExecutor() as executor:
-                futures = {
-                    executor.submit(self._process_scan_positions, scan, telescopes, time_step): i
-                    for i, scan in enumerate(scans)
-                }
-                for future in futures:
-                    scan_idx = futures[future]
-                    try:
-                        results[scan_idx] = future.result()
-                    except Exception as e:
-                        logger.error(f"Failed to process scan {scan_idx}: {str(e)}")
-
-            metadata = {"time_step": time_step, "scan_count": len(scans), "telescope_count": len(telescopes.get_active_telescopes())}
-            with self._lock:
-                obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
+            for scan_idx, scan in enumerate(scans):
+                try:
+                    results[scan_idx] = self._process_scan_positions(scan, telescopes, time_step)
+                except Exception as e:
+                    logger.error(f"Failed to process scan {scan_idx}: {str(e)}")
+
+            metadata = {"time_step": time_step, "scan_count": len(scans), "telescope_count": len(telescopes.get_active_telescopes()), "attr_key": attr_key}
+            obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
             logger.info(f"Calculated telescope positions for {len(scans)} scans in '{obj.get_observation_code()}'")
             return results
         except Exception as e:
@@ -83,9 +112,8 @@ class Calculator(ABC):
         """Process telescope positions for a single scan"""
         start_time = scan.get_start_datetime()
         duration = scan.get_duration()
-        end_time = Time(start_time) + duration * u.s
         telescope_indices = scan.get_telescope_indices()
-        active_telescopes = [telescopes.get_by_index(i) for i in telescope_indices if telescopes.get_by_index(i).isactive]
+        active_telescopes = [tel for tel in (telescopes.get_by_index(i) for i in telescope_indices) if tel.isactive]
 
         if not active_telescopes:
             logger.warning(f"No active telescopes for scan starting at {start_time}")
@@ -96,11 +124,13 @@ class Calculator(ABC):
             positions = {tel.get_code(): self._compute_telescope_position(tel, mean_time) for tel in active_telescopes}
             return {"telescope_positions": positions}
         else:
-            times = np.arange(0, duration, time_step) * u.s + Time(start_time)
+            times = _scan_time_grid(start_time, duration, time_step)
+            times_mjd = times.mjd  # один массив на скан, общий для всех телескопов
+            matrices = self._itrs_to_gcrs_matrices(times)
             result = {}
             for tel in active_telescopes:
-                tel_positions = [self._compute_telescope_position(tel, t) for t in times]
-                result[tel.get_code()] = {"times": [t.isot for t in times], "positions": tel_positions}
+                tel_positions = self._compute_telescope_positions(tel, times, matrices)
+                result[tel.get_code()] = {"times_mjd": times_mjd, "positions": tel_positions}
             return {"telescope_positions": result}
 
     def _compute_telescope_position(self, telescope: Telescope | SpaceTelescope, time: Time) -> Tuple[float, float, float]:
@@ -109,15 +139,39 @@ class Calculator(ABC):
             x, y, z = telescope.get_coordinates()
             vx, vy, vz = telescope.get_velocities()
             dt = (time - Time("2000-01-01T12:00:00")).sec
-            itrs_coords = CartesianRepresentation(x + vx * dt, y + vy * dt, z + vz * dt, unit=u.m)
-            itrs = ITRS(itrs_coords, obstime=time)
-            gcrs = itrs.transform_to(GCRS(obstime=time))
-            return (gcrs.cartesian.x.value, gcrs.cartesian.y.value, gcrs.cartesian.z.value)
+            matrix = _itrs_to_gcrs_matrix(float(time.jd1), float(time.jd2), time.scale)
+            return tuple((matrix @ np.array([x + vx * dt, y + vy * dt, z + vz * dt])).tolist())
         elif isinstance(telescope, SpaceTelescope):
             pos, _ = telescope.get_state_vector(time.to_datetime())
             return tuple(float(p) for p in pos)
         raise ValueError(f"Unsupported telescope type: {type(telescope)}")
 
+    @staticmethod
+    def _itrs_to_gcrs_matrices(times: Time) -> np.ndarray:
+        """ITRS -> GCRS rotation matrices for an array of times, shape (N, 3, 3)"""
+        from astropy.coordinates import ITRS, GCRS, CartesianRepresentation
+        # Для геоцентрических GCRS/ITRS преобразование - чистый поворот: переводим базисные векторы один раз
+        basis = np.broadcast_to(np.eye(3)[:, :, None], (3, 3, len(times)))
+        gcrs = ITRS(CartesianRepresentation(basis, unit=u.m), obstime=times).transform_to(GCRS(obstime=times))
+        return gcrs.cartesian.xyz.value.transpose(2, 0, 1)
+
+    def _compute_telescope_positions(self, telescope: Telescope | SpaceTelescope, times: Time,
+                                     matrices: Optional[np.ndarray] = None) -> np.ndarray:
+        """Compute the J2000 positions of a telescope for an array of times, shape (N, 3).
+        matrices from _itrs_to_gcrs_matrices(times) can be shared by all telescopes of a scan"""
+        if isinstance(telescope, SpaceTelescope):
+            positions, _ = telescope.get_state_vector_array(times.to_datetime())
+            return positions
+        if isinstance(telescope, Telescope):
+            if matrices is None:
+                matrices = self._itrs_to_gcrs_matrices(times)
+            x, y, z = telescope.get_coordinates()
+            vx, vy, vz = telescope.get_velocities()
+            dt = (times - Time("2000-01-01T12:00:00")).sec
+            itrs = np.stack([x + vx * dt, y + vy * dt, z + vz * dt], axis=-1)
+            return np.einsum('nij,nj->ni', matrices, itrs)
+        raise ValueError(f"Unsupported telescope type: {type(telescope)}")
+
     def _calculate_source_visibility(self, obj: Observation | Project, attributes: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate source visibility for all scans in the observation or project"""
         try:
@@ -141,24 +195,18 @@ class Calculator(ABC):
             telescopes = obj.get_telescopes()
             sources = obj.get_sources()
 
+            attr_key = self._attributes_key(attributes, time_step=time_step)
             existing_data = obj.get_calculated_data_by_key(store_key)
-            if existing_data and not recalculate and existing_data["metadata"]["time_step"] == time_step:
+            if existing_data and not recalculate and existing_data["metadata"].get("attr_key") == attr_key:
                 logger.info(f"Using cached source visibility for '{obj.get_observation_code()}'")
                 return existing_data["data"]
 
             results = {}
-            with ThreadPoolExecutor() as executor:
-                futures = {
-                    executor.submit(self._process_source_visibility, scan, telescopes, sources, time_step): i
-                    for i, scan in enumerate(scans)
-                }
-                for future in futures:
-                    scan_idx = futures[future]
-                    results[scan_idx] = future.result()
-
-            metadata = {"time_step": time_step, "scan_count": len(scans)}
-            with self._lock:
-                obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
+            for scan_idx, scan in enumerate(scans):
+                results[scan_idx] = self._process_source_visibility(scan, telescopes, sources, time_step)
+
+            metadata = {"time_step": time_step, "scan_count": len(scans), "attr_key": attr_key}
+            obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
             logger.info(f"Calculated source visibility for {len(scans)} scans in '{obj.get_observation_code()}'")
             return results
         except Exception as e:
@@ -172,54 +220,47 @@ class Calculator(ABC):
         source_idx = scan.get_source_index()
         source = sources.get_by_index(source_idx)
         telescope_indices = scan.get_telescope_indices()
-        active_telescopes = [telescopes.get_by_index(i) for i in telescope_indices if telescopes.get_by_index(i).isactive]
+        active_telescopes = [tel for tel in (telescopes.get_by_index(i) for i in telescope_indices) if tel.isactive]
 
         if time_step is None:
             mean_time = start_time + (duration / 2) * u.s
             visibility = self._compute_visibility_at_time(source, active_telescopes, mean_time)
             return {"source": source.get_name(), "visibility": visibility}
         else:
-            times = np.arange(0, duration, time_step) * u.s + start_time
-            visibility = {tel.get_code(): [] for tel in active_telescopes}
-            for t in times:
-                vis = self._compute_visibility_at_time(source, active_telescopes, t)
-                for tel_code, is_visible in vis.items():
-                    visibility[tel_code].append(is_visible)
-            return {"source": source.get_name(), "times": [t.isot for t in times], "visibility": visibility}
+            times = _scan_time_grid(scan.get_start_datetime(), duration, time_step)
+            visibility = self._compute_visibility_over_times(source, active_telescopes, times)
+            return {"source": source.get_name(), "times": times.isot.tolist(), "visibility": visibility}
 
     def _compute_visibility_at_time(self, source: Source, telescopes: List[Telescope | SpaceTelescope], time: Time) -> Dict[str, bool]:
         """Compute visibility of a source for telescopes at a given time, considering mount type"""
-        source_coord = SkyCoord(ra=source.get_ra_degrees() * u.deg, dec=source.get_dec_degrees() * u.deg, frame='icrs')
+        from astropy.coordinates import AltAz, EarthLocation
+        source_coord = _source_skycoord(source.get_ra_degrees(), source.get_dec_degrees())
+        supported_mounts = (MountType.AZIMUTHAL, MountType.EQUATORIAL)
+        # Наземные телескопы считаются одним преобразованием на тип монтировки
+        ground_coords = self._compute_az_el_at_time(
+            source_coord, [tel for tel in telescopes if not isinstance(tel, SpaceTelescope) and tel.get_mount_type() in supported_mounts], time)
         visibility = {}
         for tel in telescopes:
             if isinstance(tel, SpaceTelescope):
                 # Space Telescope -- simple orientation
                 pos, _ = tel.get_state_vector(time.to_datetime())
-                itrs = ITRS(CartesianRepresentation(*pos, unit=u.m), obstime=time)
-                altaz = source_coord.transform_to(AltAz(obstime=time, location=itrs.earth_location))
+                location = EarthLocation.from_geocentric(*pos, unit=u.m)
+                altaz = source_coord.transform_to(AltAz(obstime=time, location=location))
                 pitch = altaz.alt.deg  
                 yaw = altaz.az.deg     
                 pitch_range = tel.get_pitch_range()
                 yaw_range = tel.get_yaw_range()
                 is_visible = (pitch_range[0] <= pitch <= pitch_range[1]) and (yaw_range[0] <= yaw <= yaw_range[1])
             else:  # ground telescopes
-                pos = self._compute_telescope_position(tel, time)
-                itrs = ITRS(CartesianRepresentation(*pos, unit=u.m), obstime=time)
                 mount_type = tel.get_mount_type()
-                location = itrs.earth_location
                 
                 if mount_type == MountType.AZIMUTHAL:
-                    altaz = source_coord.transform_to(AltAz(obstime=time, location=location))
-                    el = altaz.alt.deg
-                    az = altaz.az.deg
+                    az, el = ground_coords[tel.get_code()]
                     el_range = tel.get_elevation_range()
                     az_range = tel.get_azimuth_range()
                     is_visible = (el_range[0] <= el <= el_range[1]) and (az_range[0] <= az <= az_range[1])
                 elif mount_type == MountType.EQUATORIAL:
-                    
-                    hadec = source_coord.transform_to(HADec(obstime=time, location=location))
-                    ha = hadec.ha.deg
-                    dec = hadec.dec.deg
+                    ha, dec = ground_coords[tel.get_code()]
 
                     dec_range = tel.get_elevation_range()  
                     ha_range = tel.get_azimuth_range()
@@ -234,6 +275,44 @@ class Calculator(ABC):
             visibility[tel.get_code()] = is_visible
         return visibility
     
+    def _compute_visibility_over_times(self, source: Source, telescopes: List[Telescope | SpaceTelescope], times: Time) -> Dict[str, List[bool]]:
+        """Compute visibility of a source for telescopes over an array of times, one frame transform per frame type"""
+        from astropy.coordinates import AltAz, HADec, EarthLocation
+        source_coord = _source_skycoord(source.get_ra_degrees(), source.get_dec_degrees())
+        matrices = self._itrs_to_gcrs_matrices(times)
+        # Пределы телескопов собираются один раз на скан: (индекс, (min1, max1), (min2, max2)),
+        # где для AltAz это el/pitch и az/yaw, для HADec - dec и ha
+        groups = {AltAz: [], HADec: []}
+        for k, tel in enumerate(telescopes):
+            if isinstance(tel, SpaceTelescope):
+                groups[AltAz].append((k, tel.get_pitch_range(), tel.get_yaw_range()))
+            elif tel.get_mount_type() == MountType.AZIMUTHAL:
+                groups[AltAz].append((k, tel.get_elevation_range(), tel.get_azimuth_range()))
+            elif tel.get_mount_type() == MountType.EQUATORIAL:
+                ha_range = tel.get_azimuth_range()
+                ha_min = ha_range[0] - 180 if ha_range[0] >= 0 else ha_range[0]
+                ha_max = ha_range[1] - 180 if ha_range[1] > 180 else ha_range[1]
+                groups[HADec].append((k, tel.get_elevation_range(), (ha_min, ha_max)))
+            else:
+                logger.warning(f"Unsupported mount type {tel.get_mount_type()} for telescope '{tel.get_code()}'")
+
+        masks = np.zeros((len(telescopes), len(times)), dtype=bool)
+        for frame, members in groups.items():
+            if not members:
+                continue
+            idx = [k for k, _, _ in members]
+            limits = np.array([(*range1, *range2) for _, range1, range2 in members], dtype=float)[:, :, None]
+            xyz = np.stack([self._compute_telescope_positions(telescopes[k], times, matrices) for k in idx])
+            locations = EarthLocation.from_geocentric(xyz[..., 0], xyz[..., 1], xyz[..., 2], unit=u.m)
+            coords = source_coord.transform_to(frame(obstime=times, location=locations))  # (телескоп, время)
+            if frame is AltAz:
+                coord1, coord2 = coords.alt.deg, coords.az.deg
+            else:
+                coord1, coord2 = coords.dec.deg, coords.ha.deg
+            masks[idx] = ((limits[:, 0] <= coord1) & (coord1 <= limits[:, 1])
+                          & (limits[:, 2] <= coord2) & (coord2 <= limits[:, 3]))
+        return {tel.get_code(): mask.tolist() for tel, mask in zip(telescopes, masks)}
+
     def _calculate_uv_coverage(self, obj: Observation | Project, attributes: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate (u,v) coverage for all scans in the observation or project"""
         try:
@@ -258,24 +337,18 @@ class Calculator(ABC):
             telescopes = obj.get_telescopes()
             frequencies = obj.get_frequencies()
 
+            attr_key = self._attributes_key(attributes, time_step=time_step, freq_idx=freq_idx)
             existing_data = obj.get_calculated_data_by_key(store_key)
-            if existing_data and not recalculate and existing_data["metadata"]["time_step"] == time_step:
+            if existing_data and not recalculate and existing_data["metadata"].get("attr_key") == attr_key:
                 logger.info(f"Using cached (u,v) coverage for '{obj.get_observation_code()}'")
                 return existing_data["data"]
 
             results = {}
-            with ThreadPoolExecutor() as executor:
-                futures = {
-                    executor.submit(self._process_uv_coverage, scan, telescopes, frequencies, time_step, freq_idx, obj): i
-                    for i, scan in enumerate(scans)
-                }
-                for future in futures:
-                    scan_idx = futures[future]
-                    results[scan_idx] = future.result()
-
-            metadata = {"time_step": time_step, "freq_idx": freq_idx, "scan_count": len(scans)}
-            with self._lock:
-                obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
+            for scan_idx, scan in enumerate(scans):
+                results[scan_idx] = self._process_uv_coverage(scan, telescopes, frequencies, time_step, freq_idx, obj)
+
+            metadata = {"time_step": time_step, "freq_idx": freq_idx, "scan_count": len(scans), "attr_key": attr_key}
+            obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
             logger.info(f"Calculated (u,v) coverage for {len(scans)} scans in '{obj.get_observation_code()}'")
             return results
         except Exception as e:
@@ -287,9 +360,9 @@ class Calculator(ABC):
         start_time = Time(scan.get_start_datetime())
         duration = scan.get_duration()
         telescope_indices = scan.get_telescope_indices()
-        active_telescopes = [telescopes.get_by_index(i) for i in telescope_indices if telescopes.get_by_index(i).isactive]
+        active_telescopes = [tel for tel in (telescopes.get_by_index(i) for i in telescope_indices) if tel.isactive]
         freq_indices = scan.get_frequency_indices() if freq_idx is None else [freq_idx]
-        freqs = [frequencies.get_by_index(i).get_frequency() * 1e6 for i in freq_indices if frequencies.get_by_index(i).isactive]
+        freqs = [freq.get_frequency() * 1e6 for freq in (frequencies.get_by_index(i) for i in freq_indices) if freq.isactive]
         source = scan.get_source(observation=observation)
 
         if time_step is None:
@@ -297,18 +370,20 @@ class Calculator(ABC):
             uv = self._compute_uv_at_time(active_telescopes, mean_time, freqs, source)
             return {"uv_points": uv}
         else:
-            times = np.arange(0, duration, time_step) * u.s + start_time
-            uv_points = {f: [] for f in freqs}
-            for t in times:
-                uv = self._compute_uv_at_time(active_telescopes, t, freqs, source)
-                for f, points in uv.items():
-                    uv_points[f].extend(points)
-            return {"times": [t.isot for t in times], "uv_points": uv_points}
+            times = _scan_time_grid(scan.get_start_datetime(), duration, time_step)
+            uv_points = self._compute_uv_over_times(active_telescopes, times, freqs, source)
+            return {"times": times.isot.tolist(), "uv_points": uv_points}
+
+    @staticmethod
+    def _pair_baselines(positions: list) -> np.ndarray:
+        """Baseline vectors pos[i] - pos[j] for all pairs i < j, in the order of the nested pair loop"""
+        pos = np.asarray(positions, dtype=np.float64)
+        i_idx, j_idx = np.triu_indices(len(pos), k=1)
+        return pos[i_idx] - pos[j_idx]
 
     def _compute_uv_at_time(self, telescopes: List[Telescope | SpaceTelescope], time: Time, frequencies: List[float], source: Optional[Source] = None) -> Dict[float, List[Tuple[float, float]]]:
         """Compute (u,v,w) points at a given time for given frequencies, relative to source direction, considering visibility"""
         uv_points = {f: [] for f in frequencies}
-        c = 299792458  # m/s
 
         if not telescopes or len(telescopes) < 2:
             logger.warning(f"Insufficient telescopes ({len(telescopes)}) to compute (u,v) at {time.isot}")
@@ -317,13 +392,8 @@ class Calculator(ABC):
         if source is None:
             logger.warning("No source provided; computing simplified (u,v) with no visibility check")
             positions = [self._compute_telescope_position(tel, time) for tel in telescopes]
-            for i, pos1 in enumerate(positions):
-                for j, pos2 in enumerate(positions[i + 1:], i + 1):
-                    baseline = np.array(pos1) - np.array(pos2)  # meters
-                    for freq in frequencies:
-                        wavelength = c / freq
-                        uu, vv = baseline[0] / wavelength, baseline[1] / wavelength
-                        uv_points[freq].append((uu, vv))
+            baselines = self._pair_baselines(positions)  # meters
+            uv_points.update(self._uv_by_frequency(baselines[:, 0], baselines[:, 1], frequencies))
             logger.debug(f"Computed {len(uv_points[frequencies[0]])} simplified (u,v) points at {time.isot}")
             return uv_points
 
@@ -345,18 +415,43 @@ class Calculator(ABC):
         u_hat = np.array([-np.sin(ra), np.cos(ra), 0])  # Eastward in sky plane
         v_hat = np.cross(np.array([0, 0, 1]), u_hat)  # Northward, perpendicular to u and zenith
 
-        for i, pos1 in enumerate(positions):
-            for j, pos2 in enumerate(positions[i + 1:], i + 1):
-                baseline = np.array(pos1) - np.array(pos2)  # meters in GCRS
-                uu = np.dot(baseline, u_hat)
-                vv = np.dot(baseline, v_hat)
-                for freq in frequencies:
-                    wavelength = c / freq
-                    uv_points[freq].append((uu / wavelength, vv / wavelength))
+        baselines = self._pair_baselines(positions)  # meters in GCRS
+        uv_points.update(self._uv_by_frequency(baselines @ u_hat, baselines @ v_hat, frequencies))
 
         logger.debug(f"Computed {len(uv_points[frequencies[0]])} (u,v) points at {time.isot} with visibility check")
         return uv_points
 
+    @staticmethod
+    def _uv_by_frequency(uu: np.ndarray, vv: np.ndarray, frequencies: List[float]) -> Dict[float, List[Tuple[float, float]]]:
+        """Scale baseline projections (meters) to wavelengths for all frequencies in one broadcast"""
+        wavelengths = 299792458 / np.asarray(frequencies, dtype=np.float64)
+        u_all = (uu[None, :] / wavelengths[:, None]).tolist()
+        v_all = (vv[None, :] / wavelengths[:, None]).tolist()
+        return {freq: list(zip(u_all[k], v_all[k])) for k, freq in enumerate(frequencies)}
+
+    def _compute_uv_over_times(self, telescopes: List[Telescope | SpaceTelescope], times: Time, frequencies: List[float], source: Optional[Source] = None) -> Dict[float, List[Tuple[float, float]]]:
+        """(u,v) points for a whole time grid, in the same order as calling _compute_uv_at_time per time"""
+        if len(telescopes) < 2:
+            logger.warning(f"Insufficient telescopes ({len(telescopes)}) to compute (u,v) over {len(times)} times")
+            return {f: [] for f in frequencies}
+        matrices = self._itrs_to_gcrs_matrices(times)
+        # positions: (N_times, N_tel, 3); все пары баз на каждый момент: (N_times, N_pairs, 3)
+        positions = np.stack([self._compute_telescope_positions(tel, times, matrices) for tel in telescopes], axis=1)
+        i_idx, j_idx = np.triu_indices(len(telescopes), k=1)
+        baselines = positions[:, i_idx] - positions[:, j_idx]
+        if source is None:
+            uu, vv = baselines[..., 0].ravel(), baselines[..., 1].ravel()
+        else:
+            visibility = self._compute_visibility_over_times(source, telescopes, times)
+            visible = np.array([visibility[tel.get_code()] for tel in telescopes], dtype=bool).T
+            # Пара учитывается, только если источник виден обоим телескопам; порядок пар как у видимого подмножества
+            selected = baselines[visible[:, i_idx] & visible[:, j_idx]]
+            ra = math.radians(source.get_ra_degrees())
+            u_hat = np.array([-np.sin(ra), np.cos(ra), 0])
+            v_hat = np.cross(np.array([0, 0, 1]), u_hat)
+            uu, vv = selected @ u_hat, selected @ v_hat
+        return self._uv_by_frequency(uu, vv, frequencies)
+
     def _calculate_sun_angles(self, obj: Observation | Project, attributes: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate angles between source and Sun for all scans in the observation or project"""
         try:
@@ -379,24 +474,18 @@ class Calculator(ABC):
             scans = obj.get_scans().get_active_scans(obj)
             sources = obj.get_sources()
 
+            attr_key = self._attributes_key(attributes, time_step=time_step)
             existing_data = obj.get_calculated_data_by_key(store_key)
-            if existing_data and not recalculate and existing_data["metadata"]["time_step"] == time_step:
+            if existing_data and not recalculate and existing_data["metadata"].get("attr_key") == attr_key:
                 logger.info(f"Using cached Sun angles for '{obj.get_observation_code()}'")
                 return existing_data["data"]
 
             results = {}
-            with ThreadPoolExecutor() as executor:
-                futures = {
-                    executor.submit(self._process_sun_angles, scan, sources, time_step): i
-                    for i, scan in enumerate(scans)
-                }
-                for future in futures:
-                    scan_idx = futures[future]
-                    results[scan_idx] = future.result()
-
-            metadata = {"time_step": time_step, "scan_count": len(scans)}
-            with self._lock:
-                obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
+            for scan_idx, scan in enumerate(scans):
+                results[scan_idx] = self._process_sun_angles(scan, sources, time_step)
+
+            metadata = {"time_step": time_step, "scan_count": len(scans), "attr_key": attr_key}
+            obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
             logger.info(f"Calculated Sun angles for {len(scans)} scans in '{obj.get_observation_code()}'")
             return results
         except Exception as e:
@@ -408,19 +497,20 @@ class Calculator(ABC):
         start_time = Time(scan.get_start_datetime())
         duration = scan.get_duration()
         source = sources.get_by_index(scan.get_source_index())
-        source_coord = SkyCoord(ra=source.get_ra_degrees() * u.deg, dec=source.get_dec_degrees() * u.deg, frame='icrs')
+        source_coord = _source_skycoord(source.get_ra_degrees(), source.get_dec_degrees())
 
         if time_step is None:
             mean_time = start_time + (duration / 2) * u.s
             angle = self._compute_sun_angle(source_coord, mean_time)
             return {"source": source.get_name(), "sun_angle": angle}
         else:
-            times = np.arange(0, duration, time_step) * u.s + start_time
-            angles = [self._compute_sun_angle(source_coord, t) for t in times]
-            return {"source": source.get_name(), "times": [t.isot for t in times], "sun_angles": angles}
+            times = _scan_time_grid(scan.get_start_datetime(), duration, time_step)
+            angles = self._compute_sun_angle(source_coord, times)  # один вызов get_sun на весь скан
+            return {"source": source.get_name(), "times": times.isot.tolist(), "sun_angles": angles.tolist()}
 
-    def _compute_sun_angle(self, source_coord: SkyCoord, time: Time) -> float:
-        """Compute angle between source and Sun at a given time"""
+    def _compute_sun_angle(self, source_coord: 'SkyCoord', time: Time) -> float | np.ndarray:
+        """Compute angle between source and Sun at a given time or array of times"""
+        from astropy.coordinates import get_sun
         sun = get_sun(time)
         return source_coord.separation(sun).deg
 
@@ -447,24 +537,18 @@ class Calculator(ABC):
             telescopes = obj.get_telescopes()
             sources = obj.get_sources()
 
+            attr_key = self._attributes_key(attributes, time_step=time_step)
             existing_data = obj.get_calculated_data_by_key(store_key)
-            if existing_data and not recalculate and existing_data["metadata"]["time_step"] == time_step:
+            if existing_data and not recalculate and existing_data["metadata"].get("attr_key") == attr_key:
                 logger.info(f"Using cached Az/El or HA/Dec for '{obj.get_observation_code()}'")
                 return existing_data["data"]
 
             results = {}
-            with ThreadPoolExecutor() as executor:
-                futures = {
-                    executor.submit(self._process_az_el, scan, telescopes, sources, time_step): i
-                    for i, scan in enumerate(scans)
-                }
-                for future in futures:
-                    scan_idx = futures[future]
-                    results[scan_idx] = future.result()
-
-            metadata = {"time_step": time_step, "scan_count": len(scans)}
-            with self._lock:
-                obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
+            for scan_idx, scan in enumerate(scans):
+                results[scan_idx] = self._process_az_el(scan, telescopes, sources, time_step)
+
+            metadata = {"time_step": time_step, "scan_count": len(scans), "attr_key": attr_key}
+            obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
             logger.info(f"Calculated Az/El or HA/Dec for {len(scans)} scans in '{obj.get_observation_code()}'")
             return results
         except Exception as e:
@@ -476,7 +560,7 @@ class Calculator(ABC):
         start_time = Time(scan.get_start_datetime())
         duration = scan.get_duration()
         source = sources.get_by_index(scan.get_source_index())
-        source_coord = SkyCoord(ra=source.get_ra_degrees() * u.deg, dec=source.get_dec_degrees() * u.deg, frame='icrs')
+        source_coord = _source_skycoord(source.get_ra_degrees(), source.get_dec_degrees())
         telescope_indices = scan.get_telescope_indices()
         active_ground_tels = [tel for tel in (telescopes.get_by_index(i) for i in telescope_indices) 
                              if tel.isactive and not isinstance(tel, SpaceTelescope)]
@@ -486,7 +570,7 @@ class Calculator(ABC):
             az_el = self._compute_az_el_at_time(source_coord, active_ground_tels, mean_time)
             return {"source": source.get_name(), "az_el": az_el}
         else:
-            times = np.arange(0, duration, time_step) * u.s + start_time
+            times = _scan_time_grid(scan.get_start_datetime(), duration, time_step)
             az_el = {tel.get_code(): {"coord1": [], "coord2": []} for tel in active_ground_tels}  # coord1: Az/HA, coord2: El/Dec
             for t in times:
                 result = self._compute_az_el_at_time(source_coord, active_ground_tels, t)
@@ -499,27 +583,34 @@ class Calculator(ABC):
                 az_el[tel.get_code()]["coord_type"] = "AzEl" if mount_type == MountType.AZIMUTHAL else "HADec"
             return {"source": source.get_name(), "times": [t.isot for t in times], "az_el": az_el}
 
-    def _compute_az_el_at_time(self, source_coord: SkyCoord, telescopes: List[Telescope], time: Time) -> Dict[str, Tuple[float, float]]:
+    def _compute_az_el_at_time(self, source_coord: 'SkyCoord', telescopes: List[Telescope], time: Time) -> Dict[str, Tuple[float, float]]:
         """Compute Az/El or HA/Dec for ground telescopes at a given time, depending on mount type"""
-        az_el = {}
-        for tel in telescopes:
-            pos = self._compute_telescope_position(tel, time)
-            itrs = ITRS(CartesianRepresentation(*pos, unit=u.m), obstime=time)
-            mount_type = tel.get_mount_type()
-            location = itrs.earth_location
-
+        from astropy.coordinates import AltAz, HADec, EarthLocation
+        if not telescopes:
+            return {}
+        positions = np.array([self._compute_telescope_position(tel, time) for tel in telescopes], dtype=float)
+        locations = EarthLocation.from_geocentric(positions[:, 0], positions[:, 1], positions[:, 2], unit=u.m)
+        mount_types = [tel.get_mount_type() for tel in telescopes]
+        coords = {}
+        for mount_type, frame in ((MountType.AZIMUTHAL, AltAz), (MountType.EQUATORIAL, HADec)):
+            idx = [k for k, mount in enumerate(mount_types) if mount == mount_type]
+            if not idx:
+                continue
+            # одно преобразование на все телескопы с данной монтировкой
+            transformed = source_coord.transform_to(frame(obstime=time, location=locations[idx]))
             if mount_type == MountType.AZIMUTHAL:
-                # AZIM mount
-                altaz = source_coord.transform_to(AltAz(obstime=time, location=location))
-                az_el[tel.get_code()] = (altaz.az.deg, altaz.alt.deg)
-            elif mount_type == MountType.EQUATORIAL:
-                # EQUA mount
-                hadec = source_coord.transform_to(HADec(obstime=time, location=location))
-                ha = hadec.ha.deg
-                dec = hadec.dec.deg
-                az_el[tel.get_code()] = (ha, dec)
+                coord1, coord2 = transformed.az.deg, transformed.alt.deg  # AZIM mount
             else:
-                logger.warning(f"Unsupported mount type {mount_type} for telescope '{tel.get_code()}' in Az/El calculation")
+                coord1, coord2 = transformed.ha.deg, transformed.dec.deg  # EQUA mount
+            for j, k in enumerate(idx):
+                coords[k] = (coord1[j], coord2[j])
+
+        az_el = {}
+        for k, tel in enumerate(telescopes):
+            if k in coords:
+                az_el[tel.get_code()] = coords[k]
+            else:
+                logger.warning(f"Unsupported mount type {mount_types[k]} for telescope '{tel.get_code()}' in Az/El calculation")
                 az_el[tel.get_code()] = (0.0, 0.0)  # Заглушка для неподдерживаемых типов
 
         return az_el
@@ -545,22 +636,28 @@ class Calculator(ABC):
             scans = obj.get_scans().get_active_scans(obj)
             sources = obj.get_sources()
 
+            attr_key = self._attributes_key(attributes)
             existing_data = obj.get_calculated_data_by_key(store_key)
-            if existing_data and not recalculate:
+            if existing_data and not recalculate and existing_data["metadata"].get("attr_key") == attr_key:
                 logger.info(f"Using cached time on source for '{obj.get_observation_code()}'")
                 return existing_data["data"]
 
-            time_on_source = {}
-            for i, scan in enumerate(scans):
-                source_name = sources.get_by_index(scan.get_source_index()).get_name()
-                duration = scan.get_duration()
-                time_on_source.setdefault(source_name, []).append({"scan_idx": i, "duration": duration})
-
-            results = {source: {"total_time": sum(s["duration"] for s in scans), "scans": scans} 
-                      for source, scans in time_on_source.items()}
-            metadata = {"scan_count": len(scans)}
-            with self._lock:
-                obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
+            results = {}
+            if scans:
+                src_idx = np.fromiter((scan.get_source_index() for scan in scans), dtype=np.int64, count=len(scans))
+                durations = np.fromiter((scan.get_duration() for scan in scans), dtype=np.float64, count=len(scans))
+                totals = np.bincount(src_idx, weights=durations)
+                order = np.argsort(src_idx, kind='stable')
+                groups = np.split(order, np.flatnonzero(np.diff(src_idx[order])) + 1)
+                groups.sort(key=lambda group: group[0])  # источники в порядке первого появления в скане
+                for group in groups:
+                    source_idx = int(src_idx[group[0]])
+                    source_name = sources.get_by_index(source_idx).get_name()
+                    entry = results.setdefault(source_name, {"total_time": 0.0, "scans": []})
+                    entry["total_time"] += float(totals[source_idx])
+                    entry["scans"].extend({"scan_idx": int(i), "duration": float(durations[i])} for i in group)
+            metadata = {"scan_count": len(scans), "attr_key": attr_key}
+            obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
             logger.info(f"Calculated time on source for {len(scans)} scans in '{obj.get_observation_code()}'")
             return results
         except Exception as e:
@@ -593,8 +690,9 @@ class Calculator(ABC):
             telescopes = obj.get_telescopes().get_active_telescopes()
             frequency = obj.get_frequencies().get_by_index(freq_idx).get_frequency() * 1e6  # MHz -> Hz
 
+            attr_key = self._attributes_key(attributes, freq_idx=freq_idx)
             existing_data = obj.get_calculated_data_by_key(store_key)
-            if existing_data and not recalculate:
+            if existing_data and not recalculate and existing_data["metadata"].get("attr_key") == attr_key:
                 logger.info(f"Using cached beam pattern for '{obj.get_observation_code()}'")
                 return existing_data["data"]
 
@@ -611,9 +709,8 @@ class Calculator(ABC):
                 pattern[np.isnan(pattern)] = 1.0  # Center fix
                 results[tel.get_code()] = {"theta": theta.tolist(), "pattern": pattern.tolist()}
 
-            metadata = {"freq_idx": freq_idx}
-            with self._lock:
-                obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
+            metadata = {"freq_idx": freq_idx, "attr_key": attr_key}
+            obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
             logger.info(f"Calculated beam pattern for '{obj.get_observation_code()}' at {frequency/1e6} MHz")
             return results
         except Exception as e:
@@ -645,8 +742,9 @@ class Calculator(ABC):
 
             frequency = obj.get_frequencies().get_by_index(freq_idx).get_frequency() * 1e6  # MHz -> Hz
 
+            attr_key = self._attributes_key(attributes, freq_idx=freq_idx)
             existing_data = obj.get_calculated_data_by_key(store_key)
-            if existing_data and not recalculate:
+            if existing_data and not recalculate and existing_data["metadata"].get("attr_key") == attr_key:
                 logger.info(f"Using cached synthesized beam for '{obj.get_observation_code()}'")
                 return existing_data["data"]
 
@@ -668,16 +766,15 @@ class Calculator(ABC):
                     logger.warning(f"No valid UV points for scan {scan_idx} at frequency {frequency/1e6} MHz")
                     continue
 
-                u, v = zip(*uv_points)
-                max_baseline = np.max(np.sqrt(np.array(u)**2 + np.array(v)**2)) * wavelength
+                uv = np.asarray(uv_points, dtype=np.float64)
+                max_baseline = np.max(np.hypot(uv[:, 0], uv[:, 1])) * wavelength
                 theta_fwhm = 1.22 * wavelength / max_baseline  # radians
                 theta = np.linspace(-theta_fwhm*2, theta_fwhm*2, 1000)
                 pattern = np.exp(-4 * np.log(2) * (theta / theta_fwhm) ** 2)  # Gaussian
                 results[scan_idx] = {"theta": theta.tolist(), "pattern": pattern.tolist()}
 
-            metadata = {"freq_idx": freq_idx}
-            with self._lock:
-                obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
+            metadata = {"freq_idx": freq_idx, "attr_key": attr_key}
+            obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
             logger.info(f"Calculated synthesized beam for '{obj.get_observation_code()}' at {frequency/1e6} MHz")
             return results
         except Exception as e:
@@ -717,8 +814,9 @@ class Calculator(ABC):
                 logger.error(f"VLBI requires at least 2 active telescopes, got {len(active_telescopes)}")
                 return {}
 
+            attr_key = self._attributes_key(attributes, time_step=time_step, freq_idx=freq_idx)
             existing_data = obj.get_calculated_data_by_key(store_key)
-            if existing_data and not recalculate:
+            if existing_data and not recalculate and existing_data["metadata"].get("attr_key") == attr_key:
                 logger.info(f"Using cached baseline projections for '{obj.get_observation_code()}'")
                 return existing_data["data"]
 
@@ -733,22 +831,15 @@ class Calculator(ABC):
                     return {}
 
             results = {}
-            with ThreadPoolExecutor() as executor:
-                futures = {
-                    executor.submit(self._process_baseline_projections, scan, telescopes, frequencies, time_step, freq_idx, uv_data.get(i, {}), obj): i
-                    for i, scan in enumerate(scans)
-                }
-                for future in futures:
-                    scan_idx = futures[future]
-                    try:
-                        results[scan_idx] = future.result()
-                    except Exception as e:
-                        logger.error(f"Failed to process scan {scan_idx} in baseline projections: {str(e)}")
-                        results[scan_idx] = {}
-
-            metadata = {"time_step": time_step, "freq_idx": freq_idx, "scan_count": len(scans)}
-            with self._lock:
-                obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
+            for scan_idx, scan in enumerate(scans):
+                try:
+                    results[scan_idx] = self._process_baseline_projections(scan, telescopes, frequencies, time_step, freq_idx, uv_data.get(scan_idx, {}), obj)
+                except Exception as e:
+                    logger.error(f"Failed to process scan {scan_idx} in baseline projections: {str(e)}")
+                    results[scan_idx] = {}
+
+            metadata = {"time_step": time_step, "freq_idx": freq_idx, "scan_count": len(scans), "attr_key": attr_key}
+            obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
             logger.info(f"Calculated baseline projections for {len(scans)} scans in '{obj.get_observation_code()}'")
             return results
         except Exception as e:
@@ -760,10 +851,10 @@ class Calculator(ABC):
         start_time = Time(scan.get_start_datetime())
         duration = scan.get_duration()
         telescope_indices = scan.get_telescope_indices()
-        active_telescopes = [telescopes.get_by_index(i) for i in telescope_indices if telescopes.get_by_index(i).isactive]
+        active_telescopes = [tel for tel in (telescopes.get_by_index(i) for i in telescope_indices) if tel.isactive]
         frequency = frequencies.get_by_index(freq_idx).get_frequency() * 1e6  # MHz -> Hz
         source = scan.get_source(observation=observation)
-        source_coord = SkyCoord(ra=source.get_ra_degrees() * u.deg, dec=source.get_dec_degrees() * u.deg, frame='icrs') if source else None
+        source_coord = _source_skycoord(source.get_ra_degrees(), source.get_dec_degrees()) if source else None
 
         if time_step is None:
             mean_time = start_time + (duration / 2) * u.s
@@ -773,7 +864,7 @@ class Calculator(ABC):
                 projections = self._compute_baseline_projections_at_time(active_telescopes, mean_time, frequency, source_coord)
             return {"projections": projections}
         else:
-            times = np.arange(0, duration, time_step) * u.s + start_time
+            times = _scan_time_grid(scan.get_start_datetime(), duration, time_step)
             projections = {}
             if uv_data and "uv_points" in uv_data and "times" in uv_data:
                 for t, uv_points in zip(uv_data["times"], uv_data["uv_points"][frequency]):
@@ -793,7 +884,7 @@ class Calculator(ABC):
                         projections[pair]["w"].append(ww)
             return {"times": [t.isot for t in times], "projections": projections}
         
-    def _compute_baseline_projections_at_time(self, telescopes: List[Telescope | SpaceTelescope], time: Time, frequency: float, source_coord: Optional[SkyCoord] = None) -> Dict[str, Tuple[float, float, float]]:
+    def _compute_baseline_projections_at_time(self, telescopes: List[Telescope | SpaceTelescope], time: Time, frequency: float, source_coord: Optional['SkyCoord'] = None) -> Dict[str, Tuple[float, float, float]]:
         """Compute (u, v, w) baseline projections at a given time for a given frequency"""
         positions = [self._compute_telescope_position(tel, time) for tel in telescopes]
         c = 299792458  # m/s
@@ -859,24 +950,18 @@ class Calculator(ABC):
             scans = obj.get_scans().get_active_scans(obj)
             sources = obj.get_sources()
 
+            attr_key = self._attributes_key(attributes, time_step=time_step)
             existing_data = obj.get_calculated_data_by_key(store_key)
-            if existing_data and not recalculate:
+            if existing_data and not recalculate and existing_data["metadata"].get("attr_key") == attr_key:
                 logger.info(f"Using cached Mollweide tracks for '{obj.get_observation_code()}'")
                 return existing_data["data"]
 
             results = {}
-            with ThreadPoolExecutor() as executor:
-                futures = {
-                    executor.submit(self._process_mollweide_tracks, scan, sources, time_step): i
-                    for i, scan in enumerate(scans)
-                }
-                for future in futures:
-                    scan_idx = futures[future]
-                    results[scan_idx] = future.result()
-
-            metadata = {"time_step": time_step, "scan_count": len(scans)}
-            with self._lock:
-                obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
+            for scan_idx, scan in enumerate(scans):
+                results[scan_idx] = self._process_mollweide_tracks(scan, sources, time_step)
+
+            metadata = {"time_step": time_step, "scan_count": len(scans), "attr_key": attr_key}
+            obj.set_calculated_data_by_key(store_key, {"metadata": metadata, "data": results})
             logger.info(f"Calculated Mollweide tracks for {len(scans)} scans in '{obj.get_observation_code()}'")
             return results
         except Exception as e:
@@ -888,14 +973,14 @@ class Calculator(ABC):
         start_time = Time(scan.get_start_datetime())
         duration = scan.get_duration()
         source = sources.get_by_index(scan.get_source_index())
-        source_coord = SkyCoord(ra=source.get_ra_degrees() * u.deg, dec=source.get_dec_degrees() * u.deg, frame='icrs')
+        source_coord = _source_skycoord(source.get_ra_degrees(), source.get_dec_degrees())
 
         if time_step is None:
             mean_time = start_time + (duration / 2) * u.s
             lon, lat = self._compute_mollweide_coords(source_coord, mean_time)
             return {"source": source.get_name(), "mollweide": {"lon": lon, "lat": lat}}
         else:
-            times = np.arange(0, duration, time_step) * u.s + start_time
+            times = _scan_time_grid(scan.get_start_datetime(), duration, time_step)
             tracks = {"lon": [], "lat": []}
             for t in times:
                 lon, lat = self._compute_mollweide_coords(source_coord, t)
@@ -903,7 +988,7 @@ class Calculator(ABC):
                 tracks["lat"].append(lat)
             return {"source": source.get_name(), "times": [t.isot for t in times], "mollweide": tracks}
 
-    def _compute_mollweide_coords(self, coord: SkyCoord, time: Time) -> Tuple[float, float]:
+    def _compute_mollweide_coords(self, coord: 'SkyCoord', time: Time) -> Tuple[float, float]:
         """Compute Mollweide projection coordinates with precession and nutation"""
         from astropy.coordinates import CIRS
         
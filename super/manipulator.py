@@ -143,6 +143,50 @@ class Manipulator(ABC):
 
         return super_instance.execute(target_obj, attributes)
 
+    def _insert_into_observation(self, obs: Observation, entity_type: str, items: list, index: Optional[int]) -> int:
+        if not isinstance(obs, Observation):
+            logger.error(f"Expected Observation instance, got {type(obs)}")
+            raise ValueError(f"Expected Observation instance, got {type(obs)}")
+        collection = obs.get_sources() if entity_type == "sources" else obs.get_telescopes()
+        size = len(collection)
+        position = size if index is None else index
+        # Один проход с проверкой дубликатов и одна вставка среза вместо поэлементных добавлений
+        if entity_type == "sources":
+            inserted = collection.insert_sources(position, list(items))
+        else:
+            inserted = collection.insert_telescopes(position, list(items))
+        if inserted:
+            if position < size:
+                obs._update_scan_indices(entity_type, inserted_index=position, count=inserted)
+            obs.clear_calculated_data()
+        return inserted
+
+    def add_sources_to_observation(self, obs: Observation, sources: list) -> int:
+        """Append sources to an observation in one step, skipping duplicates; returns the number added"""
+        return self._insert_into_observation(obs, "sources", sources, None)
+
+    def insert_sources_to_observation(self, obs: Observation, sources: list, index: int) -> int:
+        """Insert sources at index in one step, skipping duplicates and shifting scan source indices"""
+        return self._insert_into_observation(obs, "sources", sources, index)
+
+    def add_telescopes_to_observation(self, obs: Observation, telescopes: list) -> int:
+        """Append telescopes to an observation in one step, skipping duplicates; returns the number added"""
+        return self._insert_into_observation(obs, "telescopes", telescopes, None)
+
+    def insert_telescopes_to_observation(self, obs: Observation, telescopes: list, index: int) -> int:
+        """Insert telescopes at index in one step, skipping duplicates and shifting scan telescope indices"""
+        return self._insert_into_observation(obs, "telescopes", telescopes, index)
+
+    def remove_sources_from_observation(self, obs: Observation, start: int, end: int) -> int:
+        """Remove sources [start, end) from an observation in one step, resetting or shifting scan source indices"""
+        if not isinstance(obs, Observation):
+            logger.error(f"Expected Observation instance, got {type(obs)}")
+            raise ValueError(f"Expected Observation instance, got {type(obs)}")
+        obs.get_sources().remove_source_range(start, end)
+        obs._update_scan_indices("sources", removed_index=start, count=end - start)
+        obs.clear_calculated_data()
+        return end - start
+
     def __repr__(self) -> str:
         project_name = self._project.get_name() if self._project else "None"
         return f"Manipulator(project='{project_name}')"
@@ -94,8 +94,10 @@ class TestCalculator(unittest.TestCase):
 
         # Проверка с шагом времени
         result = self.calculator.execute(self.observation_vlbi, {"type": "telescope_positions", "time_step": 100.0, "recalculate": True})
-        self.assertIn("times", result[0]["telescope_positions"]["T1"])
-        self.assertTrue(len(result[0]["telescope_positions"]["T1"]["positions"]) > 1)
+        t1 = result[0]["telescope_positions"]["T1"]
+        self.assertIn("times_mjd", t1)
+        self.assertTrue(len(t1["positions"]) > 1)
+        self.assertEqual(t1["positions"].shape, (len(t1["times_mjd"]), 3))
 
     def test_calculate_source_visibility(self):
         result = self.calculator.execute(self.observation_vlbi, {"type": "source_visibility", "time_step": None})
@@ -187,6 +189,17 @@ class TestCalculator(unittest.TestCase):
         self.assertIn("times", result_with_step[0])
         self.assertTrue(len(result_with_step[0]["mollweide"]["lon"]) > 1)
 
+    def test_cache_respects_attributes(self):
+        # Кэш не должен возвращаться при других параметрах расчёта
+        self.calculator.execute(self.observation_vlbi, {"type": "mollweide_tracks", "time_step": None})
+        result = self.calculator.execute(self.observation_vlbi, {"type": "mollweide_tracks", "time_step": 100.0})
+        self.assertIn("times", result[0])
+
+        # Явное значение по умолчанию совпадает с опущенным
+        first = self.calculator.execute(self.observation_vlbi, {"type": "uv_coverage", "time_step": None})
+        second = self.calculator.execute(self.observation_vlbi, {"type": "uv_coverage", "time_step": None, "freq_idx": 0})
+        self.assertIs(first, second)
+
     def test_project_calculations(self):
         result = self.calculator.execute(self.project, {"type": "telescope_positions", "time_step": None})
         self.assertIn("OBS_VLBI", result)
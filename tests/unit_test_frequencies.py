@@ -64,6 +64,7 @@ class TestFrequencies(unittest.TestCase):
         self.assertTrue(self.frequencies.get_by_index(0).isactive)
         self.frequencies.activate_all()
         self.assertEqual(len(self.frequencies.get_active_frequencies()), 2)
+        self.assertEqual(self.frequencies.get_active_count(), 2)
 
     def test_frequencies_serialization(self) -> None:
         """Test Frequencies to/from dict serialization."""
@@ -82,5 +83,15 @@ class TestFrequencies(unittest.TestCase):
         self.frequencies.add_IF(IF(freq=1060.0, bandwidth=10.0))  # No overlap
         self.assertEqual(len(self.frequencies), 2)
 
+    def test_find_free_frequency(self) -> None:
+        """Test search of a non-overlapping band for a new IF."""
+        self.assertEqual(self.frequencies.find_free_frequency(16.0), 1048.0)  # after 1000-1032
+        self.frequencies.clear()
+        self.assertEqual(self.frequencies.find_free_frequency(16.0), 1000.0)
+        self.frequencies.add_IF(IF(freq=1010.0, bandwidth=16.0))  # 1010-1026
+        new_freq = self.frequencies.find_free_frequency(16.0)
+        self.frequencies.add_IF(IF(freq=new_freq, bandwidth=16.0))  # must not overlap
+        self.assertEqual(new_freq, 1042.0)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -149,5 +149,31 @@ class TestManipulator(unittest.TestCase):
             self.manipulator.get_methods_for_type(str)
         logger.info("Tested get_methods_for_type with invalid type")
 
+    def test_bulk_add_sources_and_telescopes(self):
+        new_sources = [Source(name="SRC_A"), Source(name="TEST_SRC"), Source(name="SRC_B")]
+        self.assertEqual(self.manipulator.insert_sources_to_observation(self.observation, new_sources, 0), 2)
+        self.assertEqual([s.get_name() for s in self.sources.get_all_sources()], ["SRC_A", "SRC_B", "TEST_SRC"])
+        self.assertEqual(self.scan.get_source_index(), 2)
+        self.assertTrue(self.observation.is_calc_dirty())
+        self.assertEqual(self.manipulator.add_sources_to_observation(self.observation, [Source(name="SRC_A")]), 0)
+        new_tel = Telescope(code="T2", name="Second Telescope", x=1.0, y=2.0, z=3.0)
+        self.assertEqual(self.manipulator.add_telescopes_to_observation(self.observation, [new_tel, self.telescope]), 1)
+        self.assertEqual(self.scan.get_telescope_indices(), [0])
+        logger.info("Tested bulk insertion of sources and telescopes")
+
+    def test_remove_source_range(self):
+        self.manipulator.insert_sources_to_observation(self.observation, [Source(name="SRC_A"), Source(name="SRC_B")], 0)
+        self.assertEqual(self.scan.get_source_index(), 2)
+        self.observation.set_calc_dirty(False)
+        version = self.observation.get_calc_version()
+        self.assertEqual(self.manipulator.remove_sources_from_observation(self.observation, 0, 2), 2)
+        self.assertEqual([s.get_name() for s in self.sources.get_all_sources()], ["TEST_SRC"])
+        self.assertEqual(self.scan.get_source_index(), 0)
+        self.assertTrue(self.observation.is_calc_dirty())
+        self.assertGreater(self.observation.get_calc_version(), version)
+        with self.assertRaises(IndexError):
+            self.manipulator.remove_sources_from_observation(self.observation, 0, 5)
+        logger.info("Tested removal of a source range")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
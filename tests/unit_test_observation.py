@@ -92,5 +92,57 @@ class TestObservation(unittest.TestCase):
         self.observation.activate()
         self.assertTrue(self.observation.isactive)
 
+    def test_calc_dirty_flag(self):
+        self.assertTrue(self.observation.is_calc_dirty())
+        self.observation.set_calc_dirty(False)
+        self.assertFalse(self.observation.is_calc_dirty())
+        self.observation.set_observation_type("SINGLE_DISH")
+        self.assertTrue(self.observation.is_calc_dirty())
+        self.observation.set_calc_dirty(False)
+        self.observation._update_scan_indices("telescopes", inserted_index=0)
+        self.assertTrue(self.observation.is_calc_dirty())
+
+    def test_calc_version(self):
+        version = self.observation.get_calc_version()
+        self.observation.set_calc_dirty(False)
+        self.assertEqual(self.observation.get_calc_version(), version)
+        self.observation.set_calculated_data_by_key("scan_0", {"uv_coverage": []})
+        self.assertGreater(self.observation.get_calc_version(), version)
+        version = self.observation.get_calc_version()
+        self.observation.set_calc_dirty()
+        self.assertGreater(self.observation.get_calc_version(), version)
+        version = self.observation.get_calc_version()
+        self.observation.set_observation_type("SINGLE_DISH")
+        self.assertGreater(self.observation.get_calc_version(), version)
+        version = self.observation.get_calc_version()
+        self.observation._update_scan_indices("telescopes", inserted_index=0)
+        self.assertGreater(self.observation.get_calc_version(), version)
+
+    def test_clear_calculated_data(self):
+        self.observation.set_calculated_data_by_key("scan_0", {"uv_coverage": []})
+        self.observation.set_calc_dirty(False)
+        version = self.observation.get_calc_version()
+        self.observation.clear_calculated_data()
+        self.assertEqual(self.observation.get_calculated_data(), {})
+        self.assertTrue(self.observation.is_calc_dirty())
+        self.assertGreater(self.observation.get_calc_version(), version)
+
+    def test_activation_round_trip_not_dirty(self):
+        self.observation.set_calc_dirty(False)
+        self.telescope.deactivate()
+        self.observation._sync_scans_with_activation("telescopes", 0, False)
+        self.assertTrue(self.observation.is_calc_dirty())
+        self.telescope.activate()
+        self.observation._sync_scans_with_activation("telescopes", 0, True)
+        self.assertEqual(self.scan.get_telescope_indices(), [0])
+        self.assertFalse(self.observation.is_calc_dirty())
+
+    def test_update_scan_indices_with_count(self):
+        self.scan.set_telescope_indices([0, 3])
+        self.observation._update_scan_indices("telescopes", inserted_index=1, count=2)
+        self.assertEqual(self.scan.get_telescope_indices(), [0, 5])
+        self.observation._update_scan_indices("telescopes", removed_index=0, count=2)
+        self.assertEqual(self.scan.get_telescope_indices(), [3])
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
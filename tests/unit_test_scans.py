@@ -6,6 +6,7 @@ from base.sources import Sources, Source
 from base.telescopes import Telescopes, Telescope
 from base.frequencies import Frequencies, IF
 from datetime import datetime
+from utils.formatting import format_scan_start
 
 class TestScans(unittest.TestCase):
     def setUp(self) -> None:
@@ -60,6 +61,11 @@ class TestScans(unittest.TestCase):
         self.assertEqual(self.scan1.get_start_datetime(), datetime.fromtimestamp(1000.0))
         self.assertEqual(self.scan1.get_end_datetime(), datetime.fromtimestamp(1300.0))
 
+    def test_format_scan_start(self) -> None:
+        """Test scan start formatting matches the former strftime output."""
+        for dt in (datetime(2025, 3, 1, 12, 5, 7, 123456), datetime(2025, 3, 1, 0, 0, 0)):
+            self.assertEqual(format_scan_start(dt), dt.strftime("%Y-%m-%d %H:%M:%S.%f")[:-4])
+
     def test_scan_setters(self) -> None:
         """Test Scan setters."""
         self.scan1.set_start(2000.0)
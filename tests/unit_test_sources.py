@@ -1,5 +1,6 @@
 import unittest
 from base.sources import Source, Sources
+from utils.formatting import format_ra_array, format_dec_array
 from typing import Dict, Optional
 
 class TestSources(unittest.TestCase):
@@ -53,6 +54,25 @@ class TestSources(unittest.TestCase):
         self.assertEqual(self.source1.get_ra(), (12.0, 0.0, 0.0))
         self.assertEqual(self.source1.get_dec(), (-45.0, 0.0, 0.0))
 
+    def test_source_coordinate_strings(self) -> None:
+        """Test cached RA/DEC display strings."""
+        self.assertEqual(self.source1.get_ra_str(), "12ʰ30′45.00″")
+        self.assertEqual(self.source1.get_dec_str(), "45°15′30.00″")
+        self.assertEqual(self.source2.get_dec_str(), "-30°00′00.00″")
+        self.source1.set_ra(6.0, 0.0, 0.0)
+        self.source1.set_dec_degrees(-10.5)
+        self.assertEqual(self.source1.get_ra_str(), "06ʰ00′00.00″")
+        self.assertEqual(self.source1.get_dec_str(), "-10°30′00.00″")
+
+    def test_format_coordinate_arrays(self) -> None:
+        """Test vectorized RA/DEC formatting matches the per-source strings."""
+        sources = [self.source1, self.source2]
+        ra_strs = format_ra_array([src.get_ra_degrees() for src in sources])
+        dec_strs = format_dec_array([src.get_dec_degrees() for src in sources])
+        self.assertEqual(ra_strs, [src.get_ra_str() for src in sources])
+        self.assertEqual(dec_strs, [src.get_dec_str() for src in sources])
+        self.assertEqual(format_ra_array([]), [])
+
     def test_sources_init_and_add(self) -> None:
         """Test Sources initialization and source addition."""
         self.assertEqual(len(self.sources), 2)
@@ -63,15 +83,37 @@ class TestSources(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.sources.create_source(name="TEST_SRC1")  # Duplicate name
 
+    def test_sources_insert_many(self) -> None:
+        """Test bulk insertion of sources with duplicate skipping."""
+        new_sources = [Source(name="TEST_SRC3"), Source(name="TEST_SRC1"), Source(name="TEST_SRC4")]
+        inserted = self.sources.insert_sources(1, new_sources)
+        self.assertEqual(inserted, 2)
+        self.assertEqual([s.get_name() for s in self.sources.get_all_sources()],
+                         ["TEST_SRC1", "TEST_SRC3", "TEST_SRC4", "TEST_SRC2"])
+        with self.assertRaises(IndexError):
+            self.sources.insert_sources(10, [Source(name="TEST_SRC5")])
+
+    def test_sources_remove_range(self) -> None:
+        """Test removal of a contiguous range of sources."""
+        self.sources.add_source(Source(name="TEST_SRC3"))
+        self.sources.remove_source_range(0, 2)
+        self.assertEqual([s.get_name() for s in self.sources.get_all_sources()], ["TEST_SRC3"])
+        with self.assertRaises(IndexError):
+            self.sources.remove_source_range(0, 5)
+
     def test_sources_activation(self) -> None:
         """Test source activation/deactivation."""
         self.sources.deactivate_source(0)
         self.assertFalse(self.sources.get_by_index(0).isactive)
         self.assertEqual(len(self.sources.get_active_sources()), 1)
+        self.assertEqual(self.sources.get_active_count(), 1)
+        self.assertTrue(self.sources.any_active())
         self.sources.activate_source(0)
         self.assertTrue(self.sources.get_by_index(0).isactive)
         self.sources.deactivate_all()
         self.assertEqual(len(self.sources.get_active_sources()), 0)
+        self.assertEqual(self.sources.get_active_count(), 0)
+        self.assertFalse(self.sources.any_active())
 
     def test_sources_serialization(self) -> None:
         """Test Sources to/from dict serialization."""
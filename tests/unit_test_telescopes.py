@@ -78,6 +78,11 @@ class TestTelescopes(unittest.TestCase):
         pos, vel = self.tel2.get_state_vector(dt)
         self.assertTrue(np.all(np.isfinite(pos)))
         self.assertTrue(np.all(np.isfinite(vel)))
+        dts = [datetime(2023, 1, 1, 0, m) for m in range(5)]
+        positions, velocities = self.tel2.get_state_vector_array(dts)
+        self.assertEqual(positions.shape, (5, 3))
+        self.assertTrue(np.allclose(positions[1], pos, rtol=0, atol=1e-6))
+        self.assertTrue(np.allclose(velocities[1], vel, rtol=0, atol=1e-9))
         self.tel2.set_use_kep(False)
         with self.assertRaises(ValueError):
             self.tel2.get_state_vector(dt)  # No orbit data loaded yet
@@ -92,11 +97,22 @@ class TestTelescopes(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.telescopes.add_telescope(Telescope(code="TEL1"))  # Duplicate code
 
+    def test_telescopes_insert_many(self) -> None:
+        """Test bulk insertion of telescopes with duplicate skipping."""
+        new_tels = [Telescope(code="TEL3"), Telescope(code="TEL1"), Telescope(code="TEL4")]
+        inserted = self.telescopes.insert_telescopes(0, new_tels)
+        self.assertEqual(inserted, 2)
+        self.assertEqual([t.get_code() for t in self.telescopes.get_all_telescopes()],
+                         ["TEL3", "TEL4", "TEL1", "STEL1"])
+        with self.assertRaises(IndexError):
+            self.telescopes.insert_telescopes(10, [Telescope(code="TEL5")])
+
     def test_telescopes_activation(self) -> None:
         """Test Telescopes activation/deactivation."""
         self.telescopes.deactivate_telescope(0)
         self.assertFalse(self.telescopes.get_by_index(0).isactive)
         self.assertEqual(len(self.telescopes.get_active_telescopes()), 1)
+        self.assertEqual(self.telescopes.get_active_count(), 1)
         self.telescopes.activate_all()
         self.assertEqual(len(self.telescopes.get_active_telescopes()), 2)
 
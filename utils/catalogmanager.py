@@ -4,10 +4,14 @@ from base.telescopes import Telescope, Telescopes
 
 from utils.logging_setup import logger
 from typing import Optional, List
+import os
 import re
 
 class CatalogManager:
     """Class to control catalogs"""
+
+    # Разобранные каталоги, общие для всех менеджеров: (kind, path, st_mtime_ns, st_size) -> Sources/Telescopes
+    _catalog_cache: dict = {}
     
     def __init__(self, source_file: Optional[str] = None, telescope_file: Optional[str] = None):
         """Initialize catalog manager
@@ -30,6 +34,28 @@ class CatalogManager:
         if telescope_file:
             self.load_telescope_catalog(telescope_file)
 
+    @classmethod
+    def _cache_key(cls, kind: str, path: str) -> Optional[tuple]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None  # отсутствующий файл разбирается обычным путем и дает FileNotFoundError
+        return (kind, os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+    @classmethod
+    def _cache_store(cls, key: Optional[tuple], catalog) -> None:
+        if key is None:
+            return
+        # Храним только последнюю версию файла
+        for old in [k for k in cls._catalog_cache if k[:2] == key[:2]]:
+            del cls._catalog_cache[old]
+        cls._catalog_cache[key] = catalog
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached parsed catalogs"""
+        cls._catalog_cache.clear()
+
     # sources catalog
 
     def load_source_catalog(self, source_file: str) -> None:
@@ -44,6 +70,12 @@ class CatalogManager:
             FileNotFoundError: file not found
             ValueError: incorrect data in the catalog
         """
+        key = self._cache_key("sources", source_file)
+        cached = self._catalog_cache.get(key)
+        if cached is not None:
+            self.source_catalog = cached
+            logger.info(f"Source catalog '{source_file}' is unchanged, using cached copy")
+            return
         sources = []
         failed_count = 0
         try:
@@ -89,6 +121,7 @@ class CatalogManager:
                         failed_count += 1
                         continue
             self.source_catalog = Sources(sources)
+            self._cache_store(key, self.source_catalog)
             if failed_count > 0:
                 logger.warning(f"Loaded {len(sources)} sources from '{source_file}', {failed_count} failed")
             else:
@@ -125,6 +158,12 @@ class CatalogManager:
             FileNotFoundError: file not found
             ValueError: incorrect data in the catalog
         """
+        key = self._cache_key("telescopes", telescope_file)
+        cached = self._catalog_cache.get(key)
+        if cached is not None:
+            self.telescope_catalog = cached
+            logger.info(f"Telescope catalog '{telescope_file}' is unchanged, using cached copy")
+            return
         telescopes = []
         failed_count = 0
         try:
@@ -159,6 +198,7 @@ class CatalogManager:
                         failed_count += 1
                         continue
             self.telescope_catalog = Telescopes(telescopes)
+            self._cache_store(key, self.telescope_catalog)
             if failed_count > 0:
                 logger.warning(f"Loaded {len(telescopes)} telescopes from '{telescope_file}', {failed_count} failed")
             else:
@@ -179,8 +219,9 @@ class CatalogManager:
 
     def clear_catalogs(self) -> None:
         """Clear both catalogs"""
-        self.source_catalog.clear()
-        self.telescope_catalog.clear()
+        # Новые пустые объекты вместо clear(): прежние могут лежать в общем кэше
+        self.source_catalog = Sources()
+        self.telescope_catalog = Telescopes()
 
     def __repr__(self) -> str:
         """String representation of CatalogManager"""
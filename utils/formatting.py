@@ -0,0 +1,41 @@
+# utils/formatting.py
+from datetime import datetime
+import numpy as np
+
+
+def format_ra_array(ra_deg) -> list[str]:
+    """Format an array of RA values in degrees as hhʰmm′ss.ss″ strings in one vectorized pass"""
+    ra_hours = np.asarray(ra_deg, dtype=np.float64) / 15
+    h = ra_hours.astype(np.int64)
+    minutes = (ra_hours - h) * 60
+    m = minutes.astype(np.int64)
+    s = (minutes - m) * 60
+    out = np.char.add(np.char.mod("%02d", h), "ʰ")
+    out = np.char.add(out, np.char.mod("%02d", m))
+    out = np.char.add(out, "′")
+    out = np.char.add(out, np.char.mod("%05.2f", s))
+    return np.char.add(out, "″").tolist()
+
+
+def format_dec_array(dec_deg) -> list[str]:
+    """Format an array of DEC values in degrees as [-]dd°mm′ss.ss″ strings in one vectorized pass"""
+    dec_deg = np.asarray(dec_deg, dtype=np.float64)
+    sign = np.where(dec_deg < 0, "-", "")
+    dec_abs = np.abs(dec_deg)
+    d = dec_abs.astype(np.int64)
+    minutes = (dec_abs - d) * 60
+    m = minutes.astype(np.int64)
+    s = (minutes - m) * 60
+    out = np.char.add(sign, np.char.mod("%d", d))
+    out = np.char.add(out, "°")
+    out = np.char.add(out, np.char.mod("%02d", m))
+    out = np.char.add(out, "′")
+    out = np.char.add(out, np.char.mod("%05.2f", s))
+    return np.char.add(out, "″").tolist()
+
+
+def format_scan_start(start: datetime) -> str:
+    """Format a scan start time as YYYY-MM-DD HH:MM:SS.ss"""
+    # isoformat реализован на C и быстрее strftime; последняя цифра миллисекунд отбрасывается,
+    # как и в прежнем strftime("%Y-%m-%d %H:%M:%S.%f")[:-4]
+    return start.isoformat(sep=' ', timespec='milliseconds')[:-1]